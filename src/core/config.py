@@ -4,6 +4,8 @@ The Glass - Core Configuration & Constants
 Shared values, standards, and conventions used across both ETL and Publish processes.
 """
 
+import os
+
 # ============================================================================
 # SEASON FORMATTING
 # ============================================================================
@@ -25,7 +27,30 @@ CORE_CONFIG_SCHEMA = {
         'postseason': {'required': True, 'types': (tuple, list)},
     },
     'SEASON_TYPE_LABELS': { # Using dict string match conceptually
-    }
+    },
+    'DB_POOL_CONFIG': {
+        'min_size': {'required': True, 'types': (int,)},
+        'max_size': {'required': True, 'types': (int,)},
+        'acquire_timeout_seconds': {'required': True, 'types': (int, float)},
+        'health_check_after_seconds': {'required': True, 'types': (int, float)},
+        'max_idle_seconds': {'required': True, 'types': (int, float)},
+    },
+}
+
+# ============================================================================
+# DATABASE CONNECTION POOL
+# Process-wide pool behind src.core.db (shared by ETL and publish).
+# ============================================================================
+
+DB_POOL_CONFIG = {
+    # Idle connections kept open even past max_idle_seconds
+    'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '1')),
+    # Hard cap on open connections; further callers wait for a release
+    'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '8')),
+    'acquire_timeout_seconds': 30.0,
+    # Idle connections older than this are pinged (SELECT 1) before reuse
+    'health_check_after_seconds': 30.0,
+    'max_idle_seconds': 300.0,
 }
 
 # ============================================================================
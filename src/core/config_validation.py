@@ -86,10 +86,12 @@ def validate_flat_config(
 
 def validate_core_constants() -> List[str]:
     """Validates the core constants exported in src/core/config.py against their schema."""
-    from src.core.config import SEASON_TYPE_GROUPS, CORE_CONFIG_SCHEMA
+    from src.core.config import DB_POOL_CONFIG, SEASON_TYPE_GROUPS, CORE_CONFIG_SCHEMA
     
     errors: List[str] = []
     if 'SEASON_TYPE_GROUPS' in CORE_CONFIG_SCHEMA:
         errors.extend(validate_entry(SEASON_TYPE_GROUPS, CORE_CONFIG_SCHEMA['SEASON_TYPE_GROUPS'], "SEASON_TYPE_GROUPS"))
+    if 'DB_POOL_CONFIG' in CORE_CONFIG_SCHEMA:
+        errors.extend(validate_flat_config(DB_POOL_CONFIG, CORE_CONFIG_SCHEMA['DB_POOL_CONFIG'], "DB_POOL_CONFIG"))
         
     return errors
@@ -8,17 +8,25 @@ Both leagues share the same PostgreSQL database with separate schemas:
   - nba.*   (players, teams, player_season_stats, team_season_stats, endpoint_tracker)
   - ncaa.*  (players, teams, player_season_stats, team_season_stats)
 
-Note: lib/nba_etl.py maintains its own ThreadedConnectionPool for the
-heavy NBA pipeline. This module is the canonical connection source for
-NCAA and lightweight shared callers.
+Connections come from one process-wide, thread-safe pool (sized by
+``DB_POOL_CONFIG``).  ``get_db_connection()`` checks a connection out and
+``conn.close()`` hands it back, so every caller -- ETL and publish --
+reuses warm connections instead of paying connect + auth each time.
 """
+import atexit
 import logging
 import os
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict
+from typing import Any, Dict, List, Tuple
 
 import psycopg2
+import psycopg2.extensions
+from psycopg2.pool import PoolError
+
+from src.core.config import DB_POOL_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -52,17 +60,225 @@ def quote_col(col: str) -> str:
     return f'"{col}"'
 
 
+# ============================================================================
+# CONNECTION POOL
+# ============================================================================
+# Checked-out connections are _PooledConnection instances: real psycopg2
+# connections whose close() returns them to the pool.  On return an open
+# transaction is rolled back (what a real close would have done) and a
+# broken connection is discarded.  Idle connections are reused LIFO; one
+# idle for longer than health_check_after_seconds is pinged first, and
+# idle connections beyond min_size are closed after max_idle_seconds.
+
+class _PooledConnection(psycopg2.extensions.connection):
+    """psycopg2 connection whose ``close()`` hands it back to the pool."""
+
+    def close(self) -> None:
+        _release(self)
+
+    def _discard(self) -> None:
+        super().close()
+
+
+_pool_cond = threading.Condition()
+_idle: List[Tuple[_PooledConnection, float]] = []  # (conn, released_at)
+_checked_out: set = set()
+_pool_state: Dict[str, Any] = {
+    'opening': 0,        # connections being opened outside the lock
+    'checkouts': 0,
+    'opened': 0,
+    'discarded': 0,
+    'health_check_failures': 0,
+    'waits': 0,
+    'wait_seconds': 0.0,
+    'max_wait_seconds': 0.0,
+    'timeouts': 0,
+}
+
+
+def _open_connection() -> _PooledConnection:
+    db_url = os.getenv('DATABASE_URL')
+    if not db_url:
+        raise ValueError("DATABASE_URL environment variable is missing.")
+    return psycopg2.connect(db_url, connection_factory=_PooledConnection)
+
+
+def _is_healthy(conn: _PooledConnection, idle_for: float) -> bool:
+    if conn.closed:
+        return False
+    if idle_for < DB_POOL_CONFIG['health_check_after_seconds']:
+        return True
+    try:
+        with conn.cursor() as cur:
+            cur.execute('SELECT 1')
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+def _trim_idle(now: float) -> List[_PooledConnection]:
+    """Pop idle connections past max_idle_seconds, keeping min_size open.
+
+    Caller must hold ``_pool_cond``; the returned connections are closed
+    outside the lock.
+    """
+    open_count = len(_idle) + len(_checked_out) + _pool_state['opening']
+    stale: List[_PooledConnection] = []
+    # _idle is oldest-first, so stale entries are at the front
+    while (
+        _idle and open_count - len(stale) > DB_POOL_CONFIG['min_size']
+        and now - _idle[0][1] > DB_POOL_CONFIG['max_idle_seconds']
+    ):
+        stale.append(_idle.pop(0)[0])
+    return stale
+
+
+def _acquire() -> _PooledConnection:
+    """Check out a healthy connection, waiting for a free slot if needed."""
+    timeout = DB_POOL_CONFIG['acquire_timeout_seconds']
+    start = time.monotonic()
+    waited = False
+
+    while True:
+        with _pool_cond:
+            while True:
+                now = time.monotonic()
+                if _idle:
+                    conn, released_at = _idle.pop()
+                    _checked_out.add(conn)
+                    open_new = False
+                    break
+                open_count = len(_checked_out) + _pool_state['opening']
+                if open_count < DB_POOL_CONFIG['max_size']:
+                    _pool_state['opening'] += 1
+                    open_new = True
+                    break
+                remaining = timeout - (now - start)
+                if remaining <= 0:
+                    _pool_state['timeouts'] += 1
+                    raise PoolError(
+                        f"No database connection free after {timeout}s "
+                        f"(max_size={DB_POOL_CONFIG['max_size']})"
+                    )
+                waited = True
+                _pool_cond.wait(remaining)
+
+            if waited:
+                elapsed = time.monotonic() - start
+                _pool_state['waits'] += 1
+                _pool_state['wait_seconds'] += elapsed
+                _pool_state['max_wait_seconds'] = max(
+                    _pool_state['max_wait_seconds'], elapsed,
+                )
+                waited = False
+
+        if open_new:
+            try:
+                conn = _open_connection()
+            except Exception:
+                with _pool_cond:
+                    _pool_state['opening'] -= 1
+                    _pool_cond.notify()
+                raise
+            with _pool_cond:
+                _pool_state['opening'] -= 1
+                _pool_state['opened'] += 1
+                _pool_state['checkouts'] += 1
+                _checked_out.add(conn)
+            return conn
+
+        if _is_healthy(conn, now - released_at):
+            with _pool_cond:
+                _pool_state['checkouts'] += 1
+            return conn
+
+        # Broken idle connection: drop it and try again
+        logger.info('Discarding unhealthy pooled database connection')
+        with _pool_cond:
+            _checked_out.discard(conn)
+            _pool_state['discarded'] += 1
+            _pool_state['health_check_failures'] += 1
+            _pool_cond.notify()
+        conn._discard()
+
+
+def _release(conn: _PooledConnection) -> None:
+    """Return a checked-out connection to the pool (idempotent)."""
+    with _pool_cond:
+        if conn not in _checked_out:
+            return
+        _checked_out.discard(conn)
+
+    keep = not conn.closed
+    if keep:
+        status = conn.info.transaction_status
+        if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+            keep = False
+        elif status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                keep = False
+
+    with _pool_cond:
+        if keep:
+            _idle.append((conn, time.monotonic()))
+            stale = _trim_idle(time.monotonic())
+        else:
+            _pool_state['discarded'] += 1
+            stale = []
+        _pool_cond.notify()
+
+    if not keep:
+        conn._discard()
+    for old in stale:
+        old._discard()
+
+
+def close_pool() -> None:
+    """Close every idle pooled connection (checked-out ones close on release)."""
+    with _pool_cond:
+        idle = [conn for conn, _ in _idle]
+        _idle.clear()
+    for conn in idle:
+        conn._discard()
+
+
+atexit.register(close_pool)
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Snapshot of pool size and checkout / wait counters for this process."""
+    with _pool_cond:
+        stats = {k: v for k, v in _pool_state.items() if k != 'opening'}
+        stats['idle'] = len(_idle)
+        stats['in_use'] = len(_checked_out)
+    return stats
+
+
+def log_pool_stats() -> None:
+    """Log a one-line pool summary."""
+    stats = pool_stats()
+    if not stats['checkouts']:
+        return
+    logger.info(
+        'DB pool: %d checkouts on %d connections opened (%d discarded); '
+        'waited %d times, %.2fs total, %.2fs max',
+        stats['checkouts'], stats['opened'], stats['discarded'],
+        stats['waits'], stats['wait_seconds'], stats['max_wait_seconds'],
+    )
+
+
 def get_db_connection():
     """
-    Create a new database connection.
+    Check a connection out of the process-wide pool.
 
-    Caller is responsible for calling conn.close().
+    Caller is responsible for calling conn.close(), which returns it to the
+    pool (rolling back any uncommitted transaction).
     Prefer using db_connection() context manager for short operations.
     """
-    db_url = os.getenv('DATABASE_URL')
-    if not db_url:
-        raise ValueError("DATABASE_URL environment variable is missing.")
-    return psycopg2.connect(db_url)
+    return _acquire()
 
 
 @contextmanager
@@ -71,7 +287,7 @@ def db_connection():
     Context manager for a database connection.
 
     Automatically commits on success, rolls back on exception,
-    and closes the connection.
+    and returns the connection to the pool.
 
     Usage:
         with db_connection() as conn:
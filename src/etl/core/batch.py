@@ -0,0 +1,139 @@
+"""
+The Glass - ETL Row Batch
+
+The contract between extraction and loading.  A ``RowBatch`` holds a fixed
+column list, one entity ID per row and the values column by column, so
+extractors can emit it without building a dict per entity and the loader
+can stream it straight into ``execute_values`` tuples.
+
+Per-entity calls extract one small batch per response and stack them
+with ``concat``.  Only the scalar extractor (``columnar_extract`` off)
+still builds ``{entity_id: {col: value}}`` dicts, converted once with
+``from_rows``.
+
+Values live in plain lists, not typed arrays: columns mix ints, floats,
+strings and None for NULL, the write buffer and the stat-domain rules edit
+them in place, and psycopg2 needs Python scalars, so array storage would be
+converted back cell by cell at write time.  ``scripts/bench_rowbatch.py``
+measures the saving over dict rows (about 31% retained for a league-wide
+season).
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+class RowBatch:
+    """Column-oriented batch of entity rows.
+
+    ``values[j][i]`` is the value of ``columns[j]`` for ``entity_ids[i]``.
+    Every column list has exactly ``len(entity_ids)`` entries.
+    """
+
+    __slots__ = ('columns', 'entity_ids', 'values', '_positions')
+
+    def __init__(
+        self,
+        columns: Sequence[str] = (),
+        entity_ids: Optional[List[Any]] = None,
+        values: Optional[List[List[Any]]] = None,
+    ) -> None:
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self.entity_ids: List[Any] = entity_ids if entity_ids is not None else []
+        self.values: List[List[Any]] = (
+            values if values is not None else [[] for _ in self.columns]
+        )
+        if len(self.values) != len(self.columns):
+            raise ValueError(
+                f'RowBatch has {len(self.columns)} columns '
+                f'but {len(self.values)} value lists'
+            )
+        self._positions: Optional[Dict[str, int]] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_columns(
+        cls, entity_ids: List[Any], columns: Dict[str, List[Any]],
+    ) -> 'RowBatch':
+        """Build from ``{col_name: [value per entity]}``."""
+        return cls(tuple(columns), entity_ids, list(columns.values()))
+
+    @classmethod
+    def concat(cls, batches: Iterable['RowBatch']) -> 'RowBatch':
+        """Stack *batches* row-wise; a repeated entity keeps its last row.
+
+        Columns are the union in first-seen order, and a column missing from
+        a batch is None for its rows -- the same rows, in the same order, as
+        ``dict.update`` over the batches' rows followed by ``from_rows``.
+        """
+        batches = [b for b in batches if len(b)]
+        names: Dict[str, None] = {}
+        for batch in batches:
+            names.update(dict.fromkeys(batch.columns))
+        columns = tuple(names)
+
+        entity_ids: List[Any] = []
+        values: List[List[Any]] = [[] for _ in columns]
+        positions: Dict[Any, int] = {}
+        for batch in batches:
+            present = set(batch.columns)
+            sources = [
+                batch.column(c) if c in present else [None] * len(batch)
+                for c in columns
+            ]
+            for i, eid in enumerate(batch.entity_ids):
+                target = positions.get(eid)
+                if target is None:
+                    positions[eid] = len(entity_ids)
+                    entity_ids.append(eid)
+                    for col_values, source in zip(values, sources):
+                        col_values.append(source[i])
+                else:
+                    for col_values, source in zip(values, sources):
+                        col_values[target] = source[i]
+        return cls(columns, entity_ids, values)
+
+    @classmethod
+    def from_rows(cls, rows: Dict[Any, Dict[str, Any]]) -> 'RowBatch':
+        """Build from ``{entity_id: {col: value}}``; missing values become None."""
+        names: Dict[str, None] = {}
+        for vals in rows.values():
+            names.update(dict.fromkeys(vals))
+        columns = tuple(names)
+        return cls(
+            columns,
+            list(rows),
+            [[vals.get(c) for vals in rows.values()] for c in columns],
+        )
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+    def __repr__(self) -> str:
+        return f'RowBatch({len(self)} rows x {len(self.columns)} columns)'
+
+    def column(self, name: str) -> List[Any]:
+        """Values of one column, aligned with ``entity_ids``."""
+        if self._positions is None:
+            self._positions = {c: j for j, c in enumerate(self.columns)}
+        return self.values[self._positions[name]]
+
+    def iter_rows(self, columns: Iterable[str]) -> Iterator[Tuple[Any, Tuple[Any, ...]]]:
+        """Yield ``(entity_id, values_tuple)`` with values in *columns* order."""
+        selected = [self.column(c) for c in columns]
+        if not selected:
+            return ((eid, ()) for eid in self.entity_ids)
+        return zip(self.entity_ids, zip(*selected))
+
+    def to_rows(self) -> Dict[Any, Dict[str, Any]]:
+        """Row-oriented ``{entity_id: {col: value}}`` view."""
+        return {
+            eid: dict(zip(self.columns, vals))
+            for eid, vals in self.iter_rows(self.columns)
+        }
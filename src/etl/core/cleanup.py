@@ -1,63 +1,120 @@
 import logging
-from typing import List
+from typing import Dict, List
 
 from src.core.db import db_connection, get_db_connection, quote_col
 from src.core.config import STAT_DOMAINS
-from src.etl.definitions import DB_COLUMNS, get_source_id_column
+from src.etl.core.batch import RowBatch
+from src.etl.core.db import get_season_partitions
+from src.etl.core.load import invalidate_entity_id_maps
+from src.etl.definitions import DB_COLUMNS, TABLES, get_source_id_column
 
 logger = logging.getLogger(__name__)
 
-def cleanup_stat_domains(db_schema: str, entity: str, season: str, season_type: str) -> int:
-    """
-    Run a sweeping ELT clean up on non-primary stat domains for a specific entity type, season, and season type.
-    If the domain's minutes column is 0 or NULL, all stats for that domain are set to NULL.
-    If the domain's minutes > 0, any NULL stats for that domain are set to 0.
+# Per-entity {minutes_col: [stat cols]}; DB_COLUMNS is static per process
+_domain_columns: Dict[str, Dict[str, List[str]]] = {}
+
+
+def domain_columns(entity: str) -> Dict[str, List[str]]:
+    """Map each non-primary stat domain's minutes column to its stat columns.
+
+    The minutes column itself is not part of its domain's list -- it is
+    the column the coherency rules key on.
     """
-    affected_rows = 0
-    table_name = f"{db_schema}.{entity}_season_stats"
+    cached = _domain_columns.get(entity)
+    if cached is not None:
+        return cached
 
-    # Group columns by domain
-    domain_cols = {}
+    domain_cols: Dict[str, List[str]] = {}
     for col_name, col_meta in DB_COLUMNS.items():
         if entity not in col_meta.get('entity_types', []):
             continue
         domain_name = col_meta.get('domain')
-        if domain_name and domain_name in STAT_DOMAINS and not STAT_DOMAINS[domain_name].get('primary', True):
-            # Exclude the exact minutes_col from being coerced to 0 if it's NULL?
-            # Wait, the minutes col itself should maybe be set to 0 if NULL?
-            # Actually, the user says "If the domain's minutes column is 0 or null, then it (the stats) should be null."
-            if col_name != STAT_DOMAINS[domain_name]['minutes_col']:
-                domain_cols.setdefault(domain_name, []).append(col_name)
+        domain = STAT_DOMAINS.get(domain_name) if domain_name else None
+        if domain is None or domain.get('primary', True):
+            continue
+        if col_name != domain['minutes_col']:
+            domain_cols.setdefault(domain['minutes_col'], []).append(col_name)
+
+    _domain_columns[entity] = domain_cols
+    return domain_cols
+
+
+def apply_domain_rules(batch: RowBatch, entity: str) -> int:
+    """Apply the domain coherency rules to *batch* in place.
+
+    For every non-primary domain whose minutes column is in the batch:
+    NULL stats become 0 where minutes > 0, and every stat becomes NULL
+    where minutes is 0 or NULL.  Only stat columns present in the batch
+    are touched; ``cleanup_stat_domains`` catches the rest.
+
+    Returns the number of values changed.
+    """
+    present = set(batch.columns)
+    changed = 0
+    for minutes_col, cols in domain_columns(entity).items():
+        if minutes_col not in present:
+            continue
+        minutes = batch.column(minutes_col)
+        for col in cols:
+            if col not in present:
+                continue
+            values = batch.column(col)
+            for i, m in enumerate(minutes):
+                v = values[i]
+                if m is None or m == 0:
+                    if v is not None:
+                        values[i] = None
+                        changed += 1
+                elif m > 0 and v is None:
+                    values[i] = 0
+                    changed += 1
+    return changed
+
+
+def cleanup_stat_domains(db_schema: str, entity: str, season: str, season_type: str) -> int:
+    """
+    Enforce the domain coherency rules on stored rows for one entity type, season and season type.
+    If a non-primary domain's minutes column is 0 or NULL, all stats for that domain are set to NULL.
+    If the domain's minutes > 0, any NULL stats for that domain are set to 0.
+
+    Rows written by the ETL already pass through ``apply_domain_rules``, so
+    this is a backstop for columns that reached the table in separate
+    writes.  One UPDATE covers every domain and only matches rows that
+    would change.  Returns the number of rows updated.
+    """
+    table_name = f"{db_schema}.{entity}_season_stats"
+    domain_cols = domain_columns(entity)
+    if not domain_cols:
+        return 0
+
+    set_clauses = []
+    mismatches = []
+    for minutes_col, cols in domain_cols.items():
+        m = quote_col(minutes_col)
+        has_minutes = f"{m} > 0"
+        no_minutes = f"({m} IS NULL OR {m} = 0)"
+        for c in map(quote_col, cols):
+            set_clauses.append(
+                f"{c} = CASE WHEN {has_minutes} THEN COALESCE({c}, 0) "
+                f"WHEN {no_minutes} THEN NULL ELSE {c} END"
+            )
+        any_null = ' OR '.join(f"{quote_col(c)} IS NULL" for c in cols)
+        any_set = ' OR '.join(f"{quote_col(c)} IS NOT NULL" for c in cols)
+        mismatches.append(f"({has_minutes} AND ({any_null}))")
+        mismatches.append(f"({no_minutes} AND ({any_set}))")
 
     logger.info(f"Running ELT domain cleanup for {entity} in {season} ({season_type})..")
 
     with db_connection() as conn:
         with conn.cursor() as cur:
-            for domain_name, cols in domain_cols.items():
-                if not cols:
-                    continue
-                
-                minutes_col = quote_col(STAT_DOMAINS[domain_name]['minutes_col'])
-                
-                # Condition 1: If minutes > 0, NULL stats -> 0
-                set_to_zero_clause = ", ".join(f"{quote_col(c)} = COALESCE({quote_col(c)}, 0)" for c in cols)
-                cur.execute(f"""
-                    UPDATE {table_name}
-                    SET {set_to_zero_clause}
-                    WHERE season = %s AND season_type = %s
-                      AND {minutes_col} > 0
-                """, (season, season_type))
-                affected_rows += cur.rowcount
-                
-                # Condition 2: If minutes is 0 or NULL, stats -> NULL
-                set_to_null_clause = ", ".join(f"{quote_col(c)} = NULL" for c in cols)
-                cur.execute(f"""
-                    UPDATE {table_name}
-                    SET {set_to_null_clause}
-                    WHERE season = %s AND season_type = %s
-                      AND ({minutes_col} IS NULL OR {minutes_col} = 0)
-                """, (season, season_type))
-                affected_rows += cur.rowcount
+            cur.execute(
+                f"UPDATE {table_name}\n"
+                f"SET {', '.join(set_clauses)}\n"
+                f"WHERE season = %s AND season_type = %s\n"
+                f"  AND ({' OR '.join(mismatches)})",
+                (season, season_type),
+            )
+            affected_rows = cur.rowcount
 
     return affected_rows
 
@@ -65,6 +122,10 @@ def cleanup_stat_domains(db_schema: str, entity: str, season: str, season_type:
 def prune_stale(entities: List[str], oldest_season: str, db_schema: str) -> int:
     """Delete stats rows older than the retention window, then remove orphaned entities.
 
+    Season-partitioned stats tables drop whole partitions instead of
+    deleting rows -- a catalog-only change that leaves no dead tuples.
+    Their row counts come from ``pg_class.reltuples`` and are estimates.
+
     Orphaned entities are entity rows (players/teams) that have no remaining
     stats rows after the prune -- e.g. a player who only appeared in seasons
     that are now outside the retention window.
@@ -80,6 +141,12 @@ def prune_stale(entities: List[str], oldest_season: str, db_schema: str) -> int:
                 if meta['scope'] != 'stats':
                     continue
                 qualified = f"{db_schema}.{table_name}"
+                partitions = get_season_partitions(cur, db_schema, table_name)
+                if partitions is not None:
+                    pruned += _drop_stale_partitions(
+                        cur, db_schema, qualified, partitions, oldest_season,
+                    )
+                    continue
                 cur.execute(
                     f"DELETE FROM {qualified} WHERE season < %s",
                     (oldest_season,),
@@ -115,6 +182,7 @@ def prune_stale(entities: List[str], oldest_season: str, db_schema: str) -> int:
                         'Pruned %d orphaned entities from %s', count, entity_qualified,
                     )
                     pruned += count
+                    invalidate_entity_id_maps(entity_qualified)
 
         conn.commit()
         return pruned
@@ -123,3 +191,33 @@ def prune_stale(entities: List[str], oldest_season: str, db_schema: str) -> int:
         raise
     finally:
         conn.close()
+
+
+def _drop_stale_partitions(
+    cur, db_schema: str, qualified: str,
+    partitions: Dict[str, str], oldest_season: str,
+) -> int:
+    """Drop every season partition of *qualified* older than *oldest_season*.
+
+    Returns the estimated number of rows removed.
+    """
+    dropped = 0
+    for season in sorted(partitions):
+        if season >= oldest_season:
+            continue
+        part = f"{db_schema}.{partitions[season]}"
+        cur.execute(
+            "SELECT GREATEST(reltuples, 0)::bigint FROM pg_class "
+            "WHERE oid = %s::regclass",
+            (part,),
+        )
+        row = cur.fetchone()
+        count = row[0] if row else 0
+        cur.execute(f"ALTER TABLE {qualified} DETACH PARTITION {part}")
+        cur.execute(f"DROP TABLE {part}")
+        logger.info(
+            'Dropped partition %s (%s, ~%d rows) from %s',
+            part, season, count, qualified,
+        )
+        dropped += count
+    return dropped
@@ -0,0 +1,93 @@
+"""
+The Glass - ETL Request Coalescing
+
+Run-scoped memoization of API fetches.  Simple-column groups, pipeline
+columns and multi-call columns frequently ask for the same endpoint with
+the same parameters; a ``FetchCoalescer`` wraps each provider fetcher so
+that identical requests -- whether already completed or still in flight
+on another thread -- are served by a single underlying call.
+
+Requests are keyed by the normalized (endpoint, params, season,
+season_type, entity) tuple.  Failures are never memoized: every waiter on
+a failed call sees the exception, and the next request retries.
+"""
+
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_key(
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    season: str,
+    season_type: str,
+    entity: str,
+) -> Tuple[str, str, str, str, str]:
+    """Build a hashable, order-independent key for a fetch request."""
+    params_key = json.dumps(params or {}, sort_keys=True, default=str)
+    return (endpoint, params_key, season, season_type, entity)
+
+
+class FetchCoalescer:
+    """Dedupes identical API requests for the lifetime of one ETL run."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str, str, str, str], Future] = {}
+        self.requests = 0
+        self.saved = 0
+
+    def wrap(
+        self,
+        fetcher: Callable,
+        season: str,
+        season_type: str,
+        entity: str,
+    ) -> Callable:
+        """Return a coalescing ``(endpoint, extra_params)`` fetcher."""
+        def fetch(endpoint: str, extra_params: Optional[Dict[str, Any]] = None) -> Any:
+            key = _normalize_key(endpoint, extra_params, season, season_type, entity)
+            with self._lock:
+                self.requests += 1
+                future = self._entries.get(key)
+                owner = future is None
+                if owner:
+                    future = Future()
+                    self._entries[key] = future
+                else:
+                    self.saved += 1
+
+            if not owner:
+                return future.result()
+
+            try:
+                result = fetcher(endpoint, extra_params)
+            except BaseException as exc:
+                with self._lock:
+                    self._entries.pop(key, None)
+                future.set_exception(exc)
+                raise
+            future.set_result(result)
+            return result
+
+        return fetch
+
+    def discard_season(self, season: str) -> None:
+        """Drop memoized responses for *season* once it has been processed."""
+        with self._lock:
+            for key in [k for k in self._entries if k[2] == season]:
+                del self._entries[key]
+
+    def log_summary(self) -> None:
+        """Log how many API calls coalescing saved during this run."""
+        if not self.requests:
+            return
+        logger.info(
+            'Request coalescing: %d requests, %d served from memo (%.1f%% saved)',
+            self.requests, self.saved, self.saved / self.requests * 100,
+        )
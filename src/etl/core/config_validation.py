@@ -17,7 +17,9 @@ it in ``validate_config()``.
 import logging
 from typing import Any, Dict, List, Optional
 
-from src.core.config_validation import validate_dict_config, validate_flat_config
+from src.core.config_validation import (
+    validate_dict_config, validate_entry, validate_flat_config,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -109,7 +111,11 @@ def _validate_table_unique_keys(
     tables: Dict[str, Dict],
     db_columns: Dict[str, Dict],
 ) -> List[str]:
-    """Validate that TABLES unique_key columns exist in DB_COLUMNS."""
+    """Validate that TABLES unique_key columns exist in DB_COLUMNS.
+
+    Partitioned tables must also carry their partition column in the
+    unique key -- PostgreSQL rejects unique constraints that don't.
+    """
     errors = []
     for table_name, meta in tables.items():
         for uk_col in meta.get('unique_key', []):
@@ -118,6 +124,48 @@ def _validate_table_unique_keys(
                     f"TABLES['{table_name}']: unique_key references "
                     f"unknown column '{uk_col}'"
                 )
+        partition_by = meta.get('partition_by')
+        if partition_by and partition_by not in meta.get('unique_key', []):
+            errors.append(
+                f"TABLES['{table_name}']: partition_by '{partition_by}' "
+                f"must be part of unique_key"
+            )
+    return errors
+
+
+def _validate_table_indexes(
+    tables: Dict[str, Dict],
+    config_name: str,
+    known_columns,
+) -> List[str]:
+    """Validate declared ``indexes`` entries against INDEX_SCHEMA.
+
+    *known_columns(meta)* returns the column names the table can index.
+    Unique indexes on partitioned tables must include the partition column.
+    """
+    from src.etl.definitions import INDEX_SCHEMA
+
+    errors = []
+    for table_name, meta in tables.items():
+        for i, index in enumerate(meta.get('indexes', [])):
+            prefix = f"{config_name}['{table_name}'].indexes[{i}]"
+            if not isinstance(index, dict):
+                errors.append(f"{prefix}: expected dict, got {type(index).__name__}")
+                continue
+            entry_errors = validate_entry(index, INDEX_SCHEMA, prefix)
+            errors.extend(entry_errors)
+            if entry_errors:
+                continue
+            columns = known_columns(meta)
+            for col in index['columns'] + index.get('include', []):
+                if col not in columns:
+                    errors.append(f"{prefix}: references unknown column '{col}'")
+            partition_by = meta.get('partition_by')
+            if index.get('unique') and partition_by and partition_by not in index['columns']:
+                errors.append(
+                    f"{prefix}: unique index must include partition "
+                    f"column '{partition_by}'"
+                )
     return errors
 
 
@@ -169,6 +217,10 @@ def validate_config(
     errors.extend(_validate_pg_types(DB_COLUMNS))
     errors.extend(_validate_source_structure(DB_COLUMNS))
     errors.extend(_validate_table_unique_keys(TABLES, DB_COLUMNS))
+    errors.extend(_validate_table_indexes(TABLES, 'TABLES', lambda meta: DB_COLUMNS))
+    errors.extend(_validate_table_indexes(
+        ETL_TABLES, 'ETL_TABLES', lambda meta: meta['columns'],
+    ))
 
     # Cross-reference validations
     if endpoints:
@@ -6,8 +6,10 @@ registry.  Creates tables that don't exist and adds missing columns to
 existing tables -- all from the single source of truth in config.py.
 """
 
+import hashlib
 import logging
-from typing import Any, Dict, List, Tuple
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from src.core.db import get_db_connection, quote_col
 from src.etl.definitions import DB_COLUMNS, ETL_TABLES, TABLES
@@ -60,17 +62,26 @@ def get_table_columns(
 # DDL GENERATION
 # ============================================================================
 
-def _col_ddl(col_name: str, col_meta: Dict[str, Any]) -> str:
-    """Generate a single column DDL fragment."""
+def _col_ddl(
+    col_name: str,
+    col_meta: Dict[str, Any],
+    inline_pk: bool = True,
+) -> str:
+    """Generate a single column DDL fragment.
+
+    ``inline_pk=False`` renders primary-key columns as plain NOT NULL
+    columns -- partitioned tables only accept keys that include the
+    partition column, so their uniqueness comes from ``unique_key``.
+    """
     col_type = col_meta['type']
     nullable = col_meta.get('nullable', True)
     default = col_meta.get('default')
-    pk = col_meta.get('primary_key', False)
+    pk = col_meta.get('primary_key', False) and inline_pk
 
     parts = [quote_col(col_name), col_type]
     if pk:
         parts.append('PRIMARY KEY')
-    elif not nullable:
+    elif not nullable or col_meta.get('primary_key', False):
         parts.append('NOT NULL')
     if default is not None and not pk:
         parts.append(f'DEFAULT {default}')
@@ -78,19 +89,206 @@ def _col_ddl(col_name: str, col_meta: Dict[str, Any]) -> str:
     return ' '.join(parts)
 
 
+# ============================================================================
+# INDEXES
+# ============================================================================
+
+# Indexes named with this prefix are owned by ensure_tables: created when
+# declared, dropped when no longer declared.  Anything else is left alone.
+MANAGED_INDEX_PREFIX = 'ix_'
+
+
+def index_name(table_name: str, index: Dict[str, Any]) -> str:
+    """Deterministic name for a declared index.
+
+    The trailing digest covers the whole definition, so editing an entry
+    yields a new name and the old index is replaced on the next sync.
+    """
+    definition = repr((
+        index['columns'], index.get('include', []),
+        index.get('where'), index.get('unique', False),
+    ))
+    digest = hashlib.md5(definition.encode()).hexdigest()[:8]
+    base = f"{MANAGED_INDEX_PREFIX}{table_name}_{'_'.join(index['columns'])}"
+    return f'{base[:54]}_{digest}'
+
+
+def _index_ddl(qual_table: str, name: str, index: Dict[str, Any]) -> str:
+    """CREATE INDEX statement for one declared index."""
+    unique = 'UNIQUE ' if index.get('unique') else ''
+    cols = ', '.join(quote_col(c) for c in index['columns'])
+    sql = f'CREATE {unique}INDEX IF NOT EXISTS {name} ON {qual_table} ({cols})'
+    if index.get('include'):
+        sql += f" INCLUDE ({', '.join(quote_col(c) for c in index['include'])})"
+    if index.get('where'):
+        sql += f" WHERE {index['where']}"
+    return sql
+
+
+def _sync_indexes(
+    cur,
+    db_schema: str,
+    table_name: str,
+    indexes: List[Dict[str, Any]],
+) -> List[str]:
+    """Create declared indexes that are missing and drop stale managed ones.
+
+    On a partitioned table the index is created on the parent and
+    PostgreSQL cascades it to every current and future partition.
+    """
+    qual_table = f"{db_schema}.{table_name}"
+    cur.execute(
+        "SELECT indexname FROM pg_indexes "
+        "WHERE schemaname = %s AND tablename = %s",
+        (db_schema, table_name),
+    )
+    existing = {row[0] for row in cur.fetchall()}
+
+    actions: List[str] = []
+    declared = set()
+    for index in indexes:
+        name = index_name(table_name, index)
+        declared.add(name)
+        if name not in existing:
+            cur.execute(_index_ddl(qual_table, name, index))
+            actions.append(f'index {name}')
+
+    for name in sorted(existing - declared):
+        if name.startswith(MANAGED_INDEX_PREFIX):
+            cur.execute(f'DROP INDEX IF EXISTS {db_schema}.{name}')
+            actions.append(f'dropped index {name}')
+
+    return actions
+
+
+# ============================================================================
+# SEASON PARTITIONS
+# ============================================================================
+
+_SEASON_RE = re.compile(r'^\d{4}-\d{2}$')
+
+
+def partition_name(table_name: str, season: str) -> str:
+    """Name of the partition holding *season* (``player_season_stats_2024_25``)."""
+    if not _SEASON_RE.match(season):
+        raise ValueError(f"Invalid season for partitioning: {season!r}")
+    return f"{table_name}_{season.replace('-', '_')}"
+
+
+def get_season_partitions(
+    cur, db_schema: str, table_name: str,
+) -> Optional[Dict[str, str]]:
+    """Map season -> partition name for a season-partitioned table.
+
+    Returns None when the table is not partitioned (or does not exist), so
+    callers can fall back to row-level DML.  Partitions are matched by the
+    ``partition_name`` convention; anything else attached is ignored.
+    """
+    cur.execute(
+        "SELECT 1 FROM pg_partitioned_table pt "
+        "JOIN pg_class c ON c.oid = pt.partrelid "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE n.nspname = %s AND c.relname = %s",
+        (db_schema, table_name),
+    )
+    if cur.fetchone() is None:
+        return None
+
+    cur.execute(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "JOIN pg_namespace n ON n.oid = p.relnamespace "
+        "WHERE n.nspname = %s AND p.relname = %s",
+        (db_schema, table_name),
+    )
+    prefix = f'{table_name}_'
+    partitions: Dict[str, str] = {}
+    for (relname,) in cur.fetchall():
+        suffix = relname[len(prefix):] if relname.startswith(prefix) else ''
+        season = suffix.replace('_', '-', 1)
+        if _SEASON_RE.match(season):
+            partitions[season] = relname
+    return partitions
+
+
+def ensure_season_partitions(
+    db_schema: str,
+    seasons: Iterable[str],
+    conn=None,
+) -> Dict[str, List[str]]:
+    """Create any missing season partitions of the partitioned stats tables.
+
+    Tables that exist unpartitioned (created before ``partition_by`` was
+    set) are left alone.
+
+    Returns:
+        Dict mapping qualified table name to the partitions created.
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
+
+    seasons = sorted(set(seasons))
+    try:
+        created: Dict[str, List[str]] = {}
+        with conn.cursor() as cur:
+            for table_name, table_meta in TABLES.items():
+                if table_meta.get('partition_by') != 'season':
+                    continue
+                existing = get_season_partitions(cur, db_schema, table_name)
+                if existing is None:
+                    continue
+                qual_table = f"{db_schema}.{table_name}"
+                for season in seasons:
+                    if season in existing:
+                        continue
+                    part = partition_name(table_name, season)
+                    cur.execute(
+                        f"CREATE TABLE IF NOT EXISTS {db_schema}.{part} "
+                        f"PARTITION OF {qual_table} FOR VALUES IN (%s)",
+                        (season,),
+                    )
+                    created.setdefault(qual_table, []).append(part)
+                if created.get(qual_table):
+                    logger.info(
+                        'Created %d season partitions of %s: %s',
+                        len(created[qual_table]), qual_table,
+                        ', '.join(created[qual_table]),
+                    )
+
+        conn.commit()
+        return created
+
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        if own_conn:
+            conn.close()
+
+
 # ============================================================================
 # TABLE CREATION & SYNC
 # ============================================================================
 
-def ensure_tables(db_schema: str, conn=None) -> Dict[str, List[str]]:
+def ensure_tables(
+    db_schema: str,
+    conn=None,
+    seasons: Optional[Iterable[str]] = None,
+) -> Dict[str, List[str]]:
     """Create missing tables and add missing columns from configuration.
 
     Safe to call on every ETL run -- only issues DDL when something is
-    actually missing.
+    actually missing.  Declared ``indexes`` are reconciled on every call
+    (see ``_sync_indexes``).  Tables with ``partition_by: 'season'`` are created
+    LIST-partitioned on season; pass *seasons* to also create their
+    partitions (see ``ensure_season_partitions``).
 
     Args:
         db_schema: PostgreSQL schema name (e.g. ``'nba'``).
         conn:      Optional existing connection.
+        seasons:   Seasons that need a partition in every partitioned table.
 
     Returns:
         Dict mapping qualified table name to list of actions taken
@@ -119,7 +317,11 @@ def ensure_tables(db_schema: str, conn=None) -> Dict[str, List[str]]:
                 )
 
                 if cur.fetchone() is None:
-                    col_defs = [_col_ddl(cn, cm) for cn, cm in columns]
+                    partition_by = table_meta.get('partition_by')
+                    col_defs = [
+                        _col_ddl(cn, cm, inline_pk=partition_by is None)
+                        for cn, cm in columns
+                    ]
 
                     unique_key = table_meta.get('unique_key')
                     if unique_key is None and table_meta['scope'] == 'entity':
@@ -134,6 +336,8 @@ def ensure_tables(db_schema: str, conn=None) -> Dict[str, List[str]]:
                         + ",\n  ".join(col_defs)
                         + "\n)"
                     )
+                    if partition_by:
+                        create_sql += f' PARTITION BY LIST ({quote_col(partition_by)})'
                     cur.execute(create_sql)
                     table_actions.append(f'created ({len(columns)} columns)')
                     logger.info(
@@ -162,6 +366,15 @@ def ensure_tables(db_schema: str, conn=None) -> Dict[str, List[str]]:
                             qual_table, ', '.join(table_actions),
                         )
 
+                index_actions = _sync_indexes(
+                    cur, db_schema, table_name, table_meta.get('indexes', []),
+                )
+                if index_actions:
+                    logger.info(
+                        'Indexes on %s: %s', qual_table, ', '.join(index_actions),
+                    )
+                table_actions.extend(index_actions)
+
                 actions[qual_table] = table_actions
 
             # ---- ETL operational tables (inline column definitions) ----
@@ -221,9 +434,25 @@ def ensure_tables(db_schema: str, conn=None) -> Dict[str, List[str]]:
                             qual_table, ', '.join(table_actions),
                         )
 
+                index_actions = _sync_indexes(
+                    cur, db_schema, table_name, table_meta.get('indexes', []),
+                )
+                if index_actions:
+                    logger.info(
+                        'Indexes on %s: %s', qual_table, ', '.join(index_actions),
+                    )
+                table_actions.extend(index_actions)
+
                 actions[qual_table] = table_actions
 
         conn.commit()
+
+        if seasons is not None:
+            for qual_table, parts in ensure_season_partitions(
+                db_schema, seasons, conn,
+            ).items():
+                actions[qual_table].extend(f'partition {p}' for p in parts)
+
         return actions
 
     except Exception:
@@ -12,27 +12,195 @@ This module is the execution layer.  Orchestration (which groups to run,
 in what order, for which seasons) lives in runner.py.
 """
 
+import hashlib
+import json
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from src.core.db import db_connection, get_table_name, quote_col
+from src.etl.core.batch import RowBatch
+from src.etl.core.cleanup import apply_domain_rules
 from src.etl.core.extract import (
+    TeamRowBuffer,
+    extract_columns_columnar,
     extract_columns_from_result,
-    extract_raw_rows,
     extract_single_field,
     get_multi_call_columns,
     get_pipeline_columns,
     get_simple_columns,
 )
-from src.etl.definitions import get_source_id_column
-from src.etl.core.load import write_entity_rows
-from src.etl.core.transform import aggregate_team_rows, execute_pipeline
+from src.etl.definitions import ETL_CONFIG, get_source_id_column
+from src.etl.core.load import UpsertCounts, write_entity_rows
+from src.etl.core.progress_tracker import get_payload_hash, save_payload_hash
+from src.etl.core.transform import (
+    aggregate_team_rows,
+    compile_pipelines,
+    execute_pipeline_plan,
+    explain_pipeline_plan,
+)
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# WRITE BUFFER
+# ============================================================================
+# With coalesce_writes on, every strategy hands its rows to a WriteBuffer
+# instead of upserting them.  Rows for the same entity merge across groups
+# (later groups win per column), and flush() writes each entity once.
+# The buffer is columnar like RowBatch: entity positions plus one value
+# list per column, so merging never builds per-entity dicts.
+# Stats rows get the stat-domain coherency rules applied on the merged
+# batch, so the post-run cleanup pass rarely has anything left to fix.
+# Entities are upserted grouped by their column set, so a column is never
+# NULLed for an entity that no group produced it for.  Each group is
+# credited with the flushed rows it contributed to that actually changed.
+
+# Buffer cell no group has produced a value for
+_UNSET = object()
+
+
+@dataclass
+class WriteBuffer:
+    """Merged pending rows for one (entity, scope, season, season_type)."""
+
+    entity: str
+    scope: str
+    season: str
+    season_type: str
+    db_schema: str
+    max_cells: int = 0
+    entity_ids: List[Any] = field(default_factory=list)
+    columns: Dict[str, List[Any]] = field(default_factory=dict)
+    cells: int = 0
+    _positions: Dict[Any, int] = field(default_factory=dict)
+    _after_flush: List[Callable[[], None]] = field(default_factory=list)
+    _group: Any = None
+    _contributions: Dict[Any, set] = field(default_factory=dict)
+
+    def begin_group(self, tag: Any) -> None:
+        """Attribute rows added from now on to *tag* (e.g. a progress id)."""
+        self._group = tag
+
+    def add(self, rows: Union[RowBatch, Dict[Any, Dict[str, Any]]]) -> int:
+        """Merge *rows* into the buffer; returns the number of rows added."""
+        batch = rows if isinstance(rows, RowBatch) else RowBatch.from_rows(rows)
+        self._contributions.setdefault(self._group, set()).update(batch.entity_ids)
+
+        targets = []
+        for eid in batch.entity_ids:
+            target = self._positions.get(eid)
+            if target is None:
+                target = self._positions[eid] = len(self.entity_ids)
+                self.entity_ids.append(eid)
+                for col_values in self.columns.values():
+                    col_values.append(_UNSET)
+            targets.append(target)
+        # Common case: the batch covers every buffered entity in order
+        aligned = targets == list(range(len(self.entity_ids)))
+
+        for col_name, values in zip(batch.columns, batch.values):
+            merged = self.columns.get(col_name)
+            if aligned:
+                unset = len(targets) if merged is None else sum(
+                    1 for v in merged if v is _UNSET
+                )
+                self.columns[col_name] = list(values)
+                self.cells += unset
+                continue
+            if merged is None:
+                merged = self.columns[col_name] = [_UNSET] * len(self.entity_ids)
+            for target, val in zip(targets, values):
+                if merged[target] is _UNSET:
+                    self.cells += 1
+                merged[target] = val
+        return len(batch)
+
+    def after_flush(self, callback: Callable[[], None]) -> None:
+        """Run *callback* once the buffered rows have been written.
+
+        Callbacks are bookkeeping (e.g. payload hashes): one that raises is
+        logged and does not fail the flush, whose rows are already stored.
+        """
+        self._after_flush.append(callback)
+
+    @property
+    def over_threshold(self) -> bool:
+        return bool(self.max_cells) and self.cells >= self.max_cells
+
+    def _batches(self) -> List[RowBatch]:
+        """The buffered rows as one RowBatch per distinct column set."""
+        names = tuple(sorted(self.columns))
+        if self.cells == len(self.entity_ids) * len(names):
+            return [RowBatch(names, self.entity_ids, [self.columns[c] for c in names])]
+
+        by_columns: Dict[Tuple[str, ...], List[int]] = {}
+        for i in range(len(self.entity_ids)):
+            present = tuple(c for c in names if self.columns[c][i] is not _UNSET)
+            by_columns.setdefault(present, []).append(i)
+        return [
+            RowBatch(
+                present,
+                [self.entity_ids[i] for i in positions],
+                [[self.columns[c][i] for i in positions] for c in present],
+            )
+            for present, positions in by_columns.items()
+        ]
+
+    def flush(self) -> Tuple[int, Dict[Any, int]]:
+        """Write all buffered rows.
+
+        Returns ``(rows_written, {group_tag: changed rows it contributed to})``.
+        """
+        batches = self._batches() if self.entity_ids else []
+
+        written = 0
+        counts = UpsertCounts()
+        changed: set = set()
+        for batch in batches:
+            if self.scope == 'stats':
+                apply_domain_rules(batch, self.entity)
+            written += write_entity_rows(
+                self.entity, self.scope, batch,
+                self.season, self.season_type, self.db_schema,
+                counts=counts, changed_ids=changed,
+            )
+        if self.entity_ids:
+            logger.info(
+                'Flushed %d %s %s rows (%d cells) in %d upserts: '
+                '%d inserted, %d updated, %d unchanged',
+                len(self.entity_ids), self.entity, self.scope, self.cells, len(batches),
+                counts.inserted, counts.updated, counts.unchanged,
+            )
+        per_group = {
+            tag: len(eids & changed) for tag, eids in self._contributions.items()
+        }
+
+        callbacks = self._after_flush
+        self.discard()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as exc:
+                logger.warning(
+                    'After-flush callback for %s %s %s failed: %s',
+                    self.entity, self.scope, self.season, exc,
+                )
+        return written, per_group
+
+    def discard(self) -> None:
+        """Drop buffered rows and pending callbacks without writing."""
+        self.entity_ids = []
+        self.columns = {}
+        self.cells = 0
+        self._positions = {}
+        self._after_flush = []
+        self._contributions = {}
+
+
 # ============================================================================
 # EXECUTION CONTEXT
 # ============================================================================
@@ -50,9 +218,47 @@ class ExecutionContext:
     db_schema: str
     api_fetcher: Callable
     team_ids: Dict[str, int] = field(default_factory=dict)
-    rate_limit_delay: float = 1.2
     max_consecutive_failures: int = 5
+    max_workers: int = 1
     id_aliases: Dict[str, list] = field(default_factory=dict)
+    skip_unchanged: bool = False
+    unchanged_payloads: List[str] = field(default_factory=list)
+    write_buffer: Optional[WriteBuffer] = None
+    # The unit's own pooled connection, reused for lookups so a running
+    # unit holds one connection (writes take a write slot's connection)
+    conn: Any = None
+
+
+@contextmanager
+def _connection(ctx: ExecutionContext) -> Iterator[Any]:
+    """``ctx.conn`` when set, else a pooled connection; commits like ``db_connection``."""
+    if ctx.conn is None:
+        with db_connection() as conn:
+            yield conn
+        return
+    try:
+        yield ctx.conn
+        ctx.conn.commit()
+    except Exception:
+        ctx.conn.rollback()
+        raise
+
+
+def _write_rows(ctx: ExecutionContext, rows: Union[RowBatch, Dict[Any, Dict[str, Any]]]) -> int:
+    """Upsert *rows*, or merge them into ``ctx.write_buffer`` when set.
+
+    Direct stats writes get the stat-domain rules here; buffered rows get
+    them at flush time, once every group's columns have been merged.
+    """
+    if ctx.write_buffer is not None:
+        return ctx.write_buffer.add(rows)
+    if ctx.scope == 'stats':
+        if not isinstance(rows, RowBatch):
+            rows = RowBatch.from_rows(rows)
+        apply_domain_rules(rows, ctx.entity)
+    return write_entity_rows(
+        ctx.entity, ctx.scope, rows, ctx.season, ctx.season_type, ctx.db_schema,
+    )
 
 
 # ============================================================================
@@ -66,7 +272,12 @@ def _execute_league_wide(
     ctx: ExecutionContext,
     failed: List[Dict[str, Any]],
 ) -> int:
-    """One API call returns all entities -- extract, transform, write."""
+    """One API call returns all entities -- extract, transform, write.
+
+    The payload hash (over the response and the target columns) is stored
+    after every write.  When ``ctx.skip_unchanged`` is set and the hash
+    matches the stored one, extract and load are skipped entirely.
+    """
     try:
         result = ctx.api_fetcher(endpoint, params)
     except Exception as exc:
@@ -77,13 +288,55 @@ def _execute_league_wide(
     if result is None:
         return 0
 
-    rows = extract_columns_from_result(
+    params_key = json.dumps(params, sort_keys=True, default=str)
+    payload_hash = _payload_hash(result, columns)
+    hash_key = (
+        ctx.entity, endpoint, params_key, ctx.season, ctx.season_type,
+    )
+
+    if ctx.skip_unchanged:
+        with _connection(ctx) as conn:
+            stored = get_payload_hash(conn, ctx.db_schema, *hash_key)
+        if stored == payload_hash:
+            logger.info(
+                'League-wide %s %s unchanged since last run, skipping',
+                endpoint, params_key,
+            )
+            ctx.unchanged_payloads.append(endpoint)
+            return 0
+
+    extract = (
+        extract_columns_columnar if ETL_CONFIG['columnar_extract']
+        else extract_columns_from_result
+    )
+    rows = extract(
         result, columns, ctx.entity, ctx.entity_id_field,
         id_aliases=ctx.id_aliases,
     )
-    return write_entity_rows(
-        ctx.entity, ctx.scope, rows, ctx.season, ctx.season_type, ctx.db_schema,
-    )
+    written = _write_rows(ctx, rows)
+
+    def save_hash() -> None:
+        with _connection(ctx) as conn:
+            save_payload_hash(conn, ctx.db_schema, *hash_key, payload_hash)
+
+    # A buffered write only counts once flushed
+    if ctx.write_buffer is not None:
+        ctx.write_buffer.after_flush(save_hash)
+    else:
+        save_hash()
+    return written
+
+
+def _payload_hash(result: Dict[str, Any], columns: Dict[str, Dict[str, Any]]) -> str:
+    """Hash a response together with the columns extracted from it.
+
+    Including the column set means adding a column for an endpoint forces
+    a re-extract even when the payload itself is unchanged.
+    """
+    digest = hashlib.sha256()
+    digest.update(','.join(sorted(columns)).encode('utf-8'))
+    digest.update(json.dumps(result, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
 
 
 def _execute_multi_call_column(
@@ -121,20 +374,22 @@ def _execute_multi_call_column(
 
     if not totals:
         return 0
-    rows = {eid: {col_name: val} for eid, val in totals.items()}
-    return write_entity_rows(
-        ctx.entity, ctx.scope, rows, ctx.season, ctx.season_type, ctx.db_schema,
-    )
+    rows = RowBatch((col_name,), list(totals), [list(totals.values())])
+    return _write_rows(ctx, rows)
 
 
-def _execute_pipeline_column(
-    col_name: str,
-    source: Dict[str, Any],
+def _execute_pipeline_columns(
+    pipelines: Dict[str, Dict[str, Any]],
     ctx: ExecutionContext,
     failed: List[Dict[str, Any]],
 ) -> int:
-    """Execute a transformation pipeline for a single column."""
-    pipeline_config = source['pipeline']
+    """Run all pipeline columns of a group as one compiled DAG.
+
+    Shared fetch and extract nodes run once; the surviving columns are
+    written together, one upsert per distinct entity set (normally one).
+    """
+    plan = compile_pipelines(pipelines)
+    logger.debug('%s', explain_pipeline_plan(plan))
 
     def pipeline_fetcher(ep, extra_params, tier):
         try:
@@ -142,23 +397,31 @@ def _execute_pipeline_column(
         except Exception:
             return {'resultSets': []}
 
-    try:
-        result = execute_pipeline(
-            pipeline_config, pipeline_fetcher, ctx.entity,
-            ctx.season, ctx.season_type_name,
-            entity_id_field=ctx.entity_id_field,
-        )
-    except Exception as exc:
+    results, errors = execute_pipeline_plan(
+        plan, pipeline_fetcher, ctx.entity,
+        ctx.season, ctx.season_type_name,
+        entity_id_field=ctx.entity_id_field,
+    )
+    for col_name, exc in errors.items():
         logger.error('Pipeline %s failed: %s', col_name, exc)
         failed.append({'column': col_name, 'error': str(exc)})
-        return 0
 
-    if not result:
-        return 0
-    rows = {eid: {col_name: val} for eid, val in result.items()}
-    return write_entity_rows(
-        ctx.entity, ctx.scope, rows, ctx.season, ctx.season_type, ctx.db_schema,
-    )
+    # Columns covering different entities are written separately so one
+    # column's missing entities are never NULLed by another's rows.
+    by_entities: Dict[frozenset, Dict[str, Dict[int, Any]]] = {}
+    for col_name, values in results.items():
+        if values:
+            by_entities.setdefault(frozenset(values), {})[col_name] = values
+
+    written = 0
+    for col_values in by_entities.values():
+        entity_ids = list(next(iter(col_values.values())))
+        rows = RowBatch(
+            tuple(col_values), entity_ids,
+            [[values[eid] for eid in entity_ids] for values in col_values.values()],
+        )
+        written += _write_rows(ctx, rows)
+    return written
 
 
 def _execute_team_call(
@@ -185,10 +448,12 @@ def _execute_team_call(
         return 0
 
     consecutive_failures = 0
-    player_team_rows: Dict[int, list] = {}
+    buffer = TeamRowBuffer(
+        fields=(minutes_field, *(src.get('field') for src in columns.values() if src.get('field'))),
+    )
     team_ids = list(ctx.team_ids.values())
 
-    for idx, team_id in enumerate(team_ids):
+    for team_id in team_ids:
         try:
             result = ctx.api_fetcher(endpoint, {'team_id': team_id})
             consecutive_failures = 0
@@ -206,20 +471,15 @@ def _execute_team_call(
         if result is None:
             continue
 
-        new_rows = extract_raw_rows(result, player_id_field, result_set_name)
-        for pid, rows_list in new_rows.items():
-            player_team_rows.setdefault(pid, []).extend(rows_list)
-
-        if ctx.rate_limit_delay > 0 and idx < len(team_ids) - 1:
-            time.sleep(ctx.rate_limit_delay)
+        buffer.add_result(result, player_id_field, result_set_name)
 
-    if not player_team_rows:
+    if not buffer.entity_ids:
         return 0
 
-    rows = aggregate_team_rows(player_team_rows, columns, minutes_field)
-    return write_entity_rows(
-        ctx.entity, ctx.scope, rows, ctx.season, ctx.season_type, ctx.db_schema,
+    rows = aggregate_team_rows(
+        buffer.entity_ids, buffer.codes, buffer.values, columns, minutes_field,
     )
+    return _write_rows(ctx, rows)
 
 
 def _execute_per_entity(
@@ -233,11 +493,14 @@ def _execute_per_entity(
 
     Iterates over all known entities in the DB, calls the endpoint once
     per entity (passing the entity's source_id), and extracts simple columns.
+    Calls run on a pool of ``ctx.max_workers`` threads; the fetcher's rate
+    limiter sets the request budget, including the cooldown between bursts,
+    which it shares across every unit running the same endpoint class.
     """
     source_id_col = get_source_id_column(ctx.db_schema)
     entity_table = get_table_name(ctx.entity, 'entity', ctx.db_schema)
 
-    with db_connection() as conn:
+    with _connection(ctx) as conn:
         with conn.cursor() as cur:
             if removed_refresh_mode == 'always':
                 cur.execute(
@@ -257,56 +520,58 @@ def _execute_per_entity(
     if not source_ids:
         return 0
 
-    all_rows: Dict[int, Dict[str, Any]] = {}
+    batches: List[RowBatch] = []
     consecutive_failures = 0
     id_param = ctx.entity_id_field.lower()
-
-    for idx, sid in enumerate(source_ids):
-        try:
-            result = ctx.api_fetcher(endpoint, {id_param: sid})
-            consecutive_failures = 0
-        except KeyError as exc:
-            # Malformed response for this specific entity (e.g. missing
-            # resultSet key) — skip without counting toward API-level abort.
-            logger.debug(
-                'Per-entity %s: no data for %s=%s (KeyError: %s)',
-                endpoint, id_param, sid, exc,
-            )
-            continue
-        except Exception as exc:
-            consecutive_failures += 1
-            logger.warning(
-                'Per-entity %s for %s=%s failed: %s', endpoint, id_param, sid, exc,
-            )
-            if consecutive_failures >= ctx.max_consecutive_failures:
-                logger.error(
-                    'Aborting %s after %d consecutive failures',
-                    endpoint, consecutive_failures,
+    pool = ThreadPoolExecutor(max_workers=max(1, ctx.max_workers))
+    try:
+        futures = [
+            (sid, pool.submit(ctx.api_fetcher, endpoint, {id_param: sid}))
+            for sid in source_ids
+        ]
+        # Consume in submission order so consecutive-failure counting
+        # matches the serial walk regardless of completion order.
+        for sid, future in futures:
+            try:
+                result = future.result()
+                consecutive_failures = 0
+            except KeyError as exc:
+                # Malformed response for this specific entity (e.g. missing
+                # resultSet key) — skip without counting toward API-level abort.
+                logger.debug(
+                    'Per-entity %s: no data for %s=%s (KeyError: %s)',
+                    endpoint, id_param, sid, exc,
                 )
-                failed.append({'endpoint': endpoint, 'error': str(exc)})
-                break
-            continue
-
-        if result is None:
-            continue
-
-        extracted = extract_columns_from_result(
-            result, columns, ctx.entity, ctx.entity_id_field,
-            id_aliases=ctx.id_aliases,
-        )
-        all_rows.update(extracted)
-
-        per_entity_delay = 2.5
-        if idx < len(source_ids) - 1:
-            time.sleep(per_entity_delay)
-
-    if not all_rows:
+                continue
+            except Exception as exc:
+                consecutive_failures += 1
+                logger.warning(
+                    'Per-entity %s for %s=%s failed: %s', endpoint, id_param, sid, exc,
+                )
+                if consecutive_failures >= ctx.max_consecutive_failures:
+                    logger.error(
+                        'Aborting %s after %d consecutive failures',
+                        endpoint, consecutive_failures,
+                    )
+                    failed.append({'endpoint': endpoint, 'error': str(exc)})
+                    break
+                continue
+
+            if result is None:
+                continue
+
+            batches.append(extract_columns_columnar(
+                result, columns, ctx.entity, ctx.entity_id_field,
+                id_aliases=ctx.id_aliases,
+            ))
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    rows = RowBatch.concat(batches)
+    if not len(rows):
         return 0
 
-    return write_entity_rows(
-        ctx.entity, ctx.scope, all_rows,
-        ctx.season, ctx.season_type, ctx.db_schema,
-    )
+    return _write_rows(ctx, rows)
 
 
 # ============================================================================
@@ -344,8 +609,8 @@ def execute_group(
                 endpoint, simple, ctx, failed,
                 removed_refresh_mode=group.get('removed_refresh_mode', 'null_only'),
             )
-        for col_name, source in pipelines.items():
-            written += _execute_pipeline_column(col_name, source, ctx, failed)
+        if pipelines:
+            written += _execute_pipeline_columns(pipelines, ctx, failed)
         for col_name, source in multi_call.items():
             written += _execute_multi_call_column(col_name, source, ctx, failed)
     else:
@@ -353,7 +618,7 @@ def execute_group(
             written += _execute_league_wide(endpoint, params, simple, ctx, failed)
         for col_name, source in multi_call.items():
             written += _execute_multi_call_column(col_name, source, ctx, failed)
-        for col_name, source in pipelines.items():
-            written += _execute_pipeline_column(col_name, source, ctx, failed)
+        if pipelines:
+            written += _execute_pipeline_columns(pipelines, ctx, failed)
 
     return written
@@ -10,9 +10,21 @@ JSON response that the provider client returns.
 """
 
 import logging
-from typing import Any, Dict, List, Literal, Optional, Tuple
-
-from src.etl.core.transform import apply_transform, safe_int
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.etl.core.batch import RowBatch
+from src.etl.core.transform import (
+    BATCH_TRANSFORMS,
+    NUMERIC_TRANSFORMS,
+    TRANSFORMS,
+    apply_transform,
+    safe_int_batch,
+    to_float_array,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +89,105 @@ def extract_derived_field(
     return base_value
 
 
+# ============================================================================
+# EXTRACTION PLANS
+# ============================================================================
+# A plan resolves every column's header index, transform callable, scale
+# and derived-subtract index once per (result set headers, columns) pair,
+# so per-row extraction is a loop over precomputed slots with no header
+# scans.  Plans are cached for the life of the process.
+
+_plan_cache: Dict[Tuple[Any, ...], List[Tuple[str, Optional[int], Any, Optional[int]]]] = {}
+
+_MAX_CACHED_PLANS = 1024
+
+
+def _columns_signature(columns: Dict[str, Dict[str, Any]]) -> Tuple[Any, ...]:
+    """Hashable summary of the source settings that shape a plan."""
+    return tuple(
+        (
+            col_name,
+            source.get('field'),
+            source.get('transform', 'safe_int'),
+            source.get('scale', 1),
+            (source.get('derived') or {}).get('subtract'),
+        )
+        for col_name, source in columns.items()
+        # Skip columns with pipeline or multi_call sources
+        if 'pipeline' not in source and 'multi_call' not in source
+    )
+
+
+def _bind_transform(transform_name: str, scale: Any) -> Callable[[Any], Any]:
+    """Resolve a named transform to a one-argument callable."""
+    func = TRANSFORMS.get(transform_name)
+    if func is None:
+        raise ValueError(f"Unknown transform: {transform_name}")
+    if transform_name in ('safe_int', 'safe_float'):
+        return partial(func, scale=scale)
+    return func
+
+
+def compile_extraction_plan(
+    headers: Tuple[str, ...],
+    signature: Tuple[Any, ...],
+) -> List[Tuple[str, Optional[int], Any, Optional[int]]]:
+    """Build (or fetch from cache) the extraction plan for one result set.
+
+    Each plan slot is ``(col_name, field_idx, transform, subtract_idx)``;
+    ``field_idx`` is ``None`` when the field is absent from *headers*.
+    """
+    key = (headers, signature)
+    plan = _plan_cache.get(key)
+    if plan is not None:
+        return plan
+
+    positions = {h: i for i, h in reversed(list(enumerate(headers)))}
+    plan = []
+    for col_name, api_field, transform_name, scale, subtract in signature:
+        field_idx = positions.get(api_field) if api_field else None
+        if field_idx is None:
+            plan.append((col_name, None, None, None))
+            continue
+        plan.append((
+            col_name,
+            field_idx,
+            _bind_transform(transform_name, scale),
+            positions.get(subtract) if subtract else None,
+        ))
+
+    if len(_plan_cache) >= _MAX_CACHED_PLANS:
+        _plan_cache.clear()
+    _plan_cache[key] = plan
+    return plan
+
+
+def _run_plan(
+    row: List[Any],
+    plan: List[Tuple[str, Optional[int], Any, Optional[int]]],
+    existing: Dict[str, Any],
+) -> None:
+    """Apply *plan* to one row, merging values into *existing*."""
+    for col_name, field_idx, transform, subtract_idx in plan:
+        val = None
+        if field_idx is not None:
+            raw_value = row[field_idx]
+            # Reject complex types (some endpoints return nested objects)
+            if not isinstance(raw_value, (dict, list)):
+                val = transform(raw_value)
+                if subtract_idx is not None and val is not None:
+                    subtract_raw = row[subtract_idx]
+                    if subtract_raw is not None:
+                        try:
+                            val = val - round(float(subtract_raw))
+                        except (ValueError, TypeError):
+                            pass
+
+        # Prefer non-None values across multiple result sets
+        if val is not None or col_name not in existing:
+            existing[col_name] = val
+
+
 # ============================================================================
 # BATCH EXTRACTION
 # ============================================================================
@@ -91,6 +202,10 @@ def extract_columns_from_result(
 ) -> Dict[int, Dict[str, Any]]:
     """Extract all mapped columns from an API result for every entity.
 
+    Each result set is extracted with a compiled plan (see
+    ``compile_extraction_plan``), so headers are indexed once per shape
+    rather than once per row and column.
+
     Args:
         api_result: Raw API JSON with ``resultSets``.
         columns: ``{canonical_col_name: source_config}`` — typically a
@@ -103,6 +218,7 @@ def extract_columns_from_result(
         ``{entity_id: {col_name: value, ...}, ...}``
     """
     all_entities: Dict[int, Dict[str, Any]] = {}
+    signature = _columns_signature(columns)
 
     for rs in api_result.get('resultSets', []):
         if result_set_name and rs['name'] != result_set_name:
@@ -122,28 +238,138 @@ def extract_columns_from_result(
                 continue
 
         id_idx = headers.index(id_field)
+        plan = compile_extraction_plan(tuple(headers), signature)
 
         for row in rs['rowSet']:
             entity_id = row[id_idx]
             if entity_id is None:
                 continue
+            _run_plan(row, plan, all_entities.setdefault(entity_id, {}))
 
-            existing = all_entities.setdefault(entity_id, {})
-            for col_name, source in columns.items():
-                # Skip columns with pipeline or multi_call sources
-                if 'pipeline' in source or 'multi_call' in source:
-                    continue
+    return all_entities
 
-                if source.get('derived'):
-                    val = extract_derived_field(row, headers, source)
-                else:
-                    val = extract_field(row, headers, source)
 
-                # Prefer non-None values across multiple result sets
-                if val is not None or col_name not in existing:
-                    existing[col_name] = val
+# ============================================================================
+# COLUMNAR EXTRACTION
+# ============================================================================
+# Alternative engine for large league-wide responses: the rowSet is
+# transposed once and each mapped field is converted as a whole column
+# through BATCH_TRANSFORMS (NumPy with null masks for numeric fields).  Output is a
+# RowBatch, which write_entity_rows consumes without rebuilding
+# per-entity dicts.  Values match extract_columns_from_result exactly.
+
+_MISSING = object()
+
+
+def _subtract_rounded(
+    base: List[Any], subtract_raw: Sequence[Any],
+) -> List[Any]:
+    """Column form of the derived ``base - round(float(subtract))`` rule."""
+    subtract = np.rint(to_float_array(subtract_raw)).tolist()
+    return [
+        b - int(sub) if b is not None and sub == sub else b
+        for b, sub in zip(base, subtract)
+    ]
+
+
+def _extract_column(
+    fields: List[Tuple[Any, ...]],
+    slot: Tuple[str, Optional[int], Any, Optional[int]],
+    transform_name: str,
+    scale: Any,
+    n_rows: int,
+) -> List[Any]:
+    """Convert one mapped field of a transposed result set."""
+    _, field_idx, _, subtract_idx = slot
+    if field_idx is None:
+        return [None] * n_rows
+
+    raw = fields[field_idx]
+    if transform_name not in NUMERIC_TRANSFORMS:
+        # Reject complex types (some endpoints return nested objects)
+        raw = [None if isinstance(v, (dict, list)) else v for v in raw]
+    values = BATCH_TRANSFORMS[transform_name](raw, scale)
+
+    if subtract_idx is not None:
+        values = _subtract_rounded(values, fields[subtract_idx])
+    return values
+
+
+def extract_columns_columnar(
+    api_result: Dict[str, Any],
+    columns: Dict[str, Dict[str, Any]],
+    entity: Literal['player', 'team'],
+    entity_id_field: str,
+    result_set_name: Optional[str] = None,
+    id_aliases: Optional[Dict[str, List[str]]] = None,
+) -> RowBatch:
+    """Columnar equivalent of ``extract_columns_from_result``.
 
-    return all_entities
+    Same arguments and merge rules (first appearance fixes entity order;
+    later non-None values win), but returns a ``RowBatch``.
+    """
+    entity_ids: List[Any] = []
+    merged_columns: Dict[str, List[Any]] = {}
+    signature = _columns_signature(columns)
+    positions: Dict[Any, int] = {}
+
+    for rs in api_result.get('resultSets', []):
+        if result_set_name and rs['name'] != result_set_name:
+            continue
+
+        headers = rs['headers']
+
+        # Resolve entity ID field, falling back to source-provided aliases
+        id_field = entity_id_field
+        if id_field not in headers:
+            aliases = (id_aliases or {}).get(entity_id_field, [])
+            id_field = next(
+                (a for a in aliases if a in headers),
+                None,
+            )
+            if id_field is None:
+                continue
+
+        id_idx = headers.index(id_field)
+        rows = [row for row in rs['rowSet'] if row[id_idx] is not None]
+        if not rows:
+            continue
+
+        plan = compile_extraction_plan(tuple(headers), signature)
+        fields = list(zip(*rows))
+        ids = fields[id_idx]
+        values = {
+            slot[0]: _extract_column(fields, slot, sig[2], sig[3], len(rows))
+            for slot, sig in zip(plan, signature)
+        }
+
+        # Common case: one result set with unique IDs -- take columns as-is
+        if not entity_ids and len(set(ids)) == len(ids):
+            entity_ids = list(ids)
+            merged_columns = values
+            positions = {eid: i for i, eid in enumerate(ids)}
+            continue
+
+        targets = []
+        for eid in ids:
+            target = positions.get(eid)
+            if target is None:
+                target = positions[eid] = len(entity_ids)
+                entity_ids.append(eid)
+                for col_values in merged_columns.values():
+                    col_values.append(_MISSING)
+            targets.append(target)
+
+        for col_name, col_values in values.items():
+            merged = merged_columns.setdefault(
+                col_name, [_MISSING] * len(entity_ids),
+            )
+            # Prefer non-None values across multiple result sets
+            for target, val in zip(targets, col_values):
+                if val is not None or merged[target] is _MISSING:
+                    merged[target] = val
+
+    return RowBatch.from_columns(entity_ids, merged_columns)
 
 
 # ============================================================================
@@ -181,7 +407,7 @@ def get_multi_call_columns(
 
 
 # ============================================================================
-# SINGLE-FIELD & RAW EXTRACTION  (for multi-call and team-call patterns)
+# SINGLE-FIELD & TEAM-ROW EXTRACTION  (for multi-call and team-call patterns)
 # ============================================================================
 
 def extract_single_field(
@@ -205,39 +431,69 @@ def extract_single_field(
             continue
         id_idx = headers.index(entity_id_field)
         field_idx = headers.index(field)
-        for row in rs['rowSet']:
-            eid = row[id_idx]
-            val = safe_int(row[field_idx])
+        rows = rs['rowSet']
+        vals = safe_int_batch([row[field_idx] for row in rows])
+        for row, val in zip(rows, vals):
             if val is not None:
-                extracted[eid] = val
+                extracted[row[id_idx]] = val
         break
 
     return extracted
 
 
-def extract_raw_rows(
-    api_result: Dict[str, Any],
-    entity_id_field: str,
-    result_set_name: Optional[str] = None,
-) -> Dict[int, List[Dict[str, Any]]]:
-    """Extract raw row dicts from an API result, grouped by entity ID.
+@dataclass
+class TeamRowBuffer:
+    """Columnar buffer of per-team rows for team-call aggregation.
 
-    Returns ``{entity_id: [row_dict, ...]}``.
-    Used by team-call patterns that collect per-team rows for later aggregation.
+    Rows from every team response are appended column by column: only
+    the requested ``fields`` are kept, and each row is tagged with a
+    group code (the entity's index in ``entity_ids``, in first-seen
+    order).  Traded entities therefore contribute one row per team stint
+    without a dict being built per row.
     """
-    grouped: Dict[int, List[Dict[str, Any]]] = {}
-
-    for rs in api_result.get('resultSets', []):
-        if result_set_name and rs['name'] != result_set_name:
-            continue
-        headers = rs['headers']
-        if entity_id_field not in headers:
-            continue
-        id_idx = headers.index(entity_id_field)
-        for row in rs['rowSet']:
-            eid = row[id_idx]
-            if eid is not None:
-                grouped.setdefault(eid, []).append(dict(zip(headers, row)))
-
-    return grouped
+    fields: Tuple[str, ...]
+    entity_ids: List[Any] = field(default_factory=list)
+    codes: List[int] = field(default_factory=list)
+    values: Dict[str, List[Any]] = field(default_factory=dict)
+    _index: Dict[Any, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self.fields = tuple(dict.fromkeys(self.fields))
+        self.values = {f: [] for f in self.fields}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def add_result(
+        self,
+        api_result: Dict[str, Any],
+        entity_id_field: str,
+        result_set_name: Optional[str] = None,
+    ) -> None:
+        """Append the rows of one API response."""
+        for rs in api_result.get('resultSets', []):
+            if result_set_name and rs['name'] != result_set_name:
+                continue
+            headers = rs['headers']
+            if entity_id_field not in headers:
+                continue
+            id_idx = headers.index(entity_id_field)
+            rows = [row for row in rs['rowSet'] if row[id_idx] is not None]
+            if not rows:
+                continue
 
+            index = self._index
+            for row in rows:
+                eid = row[id_idx]
+                code = index.get(eid)
+                if code is None:
+                    code = index[eid] = len(self.entity_ids)
+                    self.entity_ids.append(eid)
+                self.codes.append(code)
+
+            for f in self.fields:
+                if f in headers:
+                    idx = headers.index(f)
+                    self.values[f].extend(row[idx] for row in rows)
+                else:
+                    self.values[f].extend([None] * len(rows))
@@ -2,25 +2,51 @@
 The Glass - ETL Database Loader
 
 Bulk database write functions for the ETL pipeline.  Provides ``bulk_upsert``
-(using ``execute_values`` with ``ON CONFLICT``) and ``bulk_copy``
-(using PostgreSQL ``COPY FROM``).  Both honour the column-quoting
-required by digit-starting column names (e.g. ``fg2m``).
+(``ON CONFLICT`` upserts via ``execute_values``, or via ``COPY`` into a
+staging table for large batches) and ``bulk_copy`` (plain PostgreSQL
+``COPY FROM``).  All honour the column-quoting required by digit-starting
+column names (e.g. ``fg2m``).
 
 All functions are stateless and operate on a caller-provided connection.
 """
 
 import logging
+import threading
+from dataclasses import dataclass
 from io import StringIO
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from psycopg2.extras import execute_values
 
 from src.core.db import db_connection, quote_col
+from src.etl.core.batch import RowBatch
+from src.etl.definitions import ETL_CONFIG
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_BATCH_SIZE = 500
 
+UPSERT_METHODS = ('values', 'copy')
+
+# Session-local temp table used by the COPY upsert path (dropped at commit)
+STAGING_TABLE = '_etl_upsert_stage'
+
+# Alias for the target table in upserts (change guard compares t.col)
+UPSERT_ALIAS = 't'
+
+
+@dataclass
+class UpsertCounts:
+    """Row outcomes of upserts, accumulated across calls."""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> int:
+        return self.inserted + self.updated
+
 
 # ============================================================================
 # BULK OPERATIONS
@@ -34,6 +60,11 @@ def bulk_upsert(
     conflict_columns: List[str],
     update_columns: Optional[List[str]] = None,
     batch_size: int = DEFAULT_BATCH_SIZE,
+    method: Optional[str] = None,
+    returning: Optional[List[str]] = None,
+    returned: Optional[List[tuple]] = None,
+    only_changed: bool = False,
+    counts: Optional[UpsertCounts] = None,
 ) -> int:
     """INSERT ... ON CONFLICT DO UPDATE SET for a batch of rows.
 
@@ -46,27 +77,49 @@ def bulk_upsert(
         update_columns:   Columns to overwrite on conflict.
                           *None* -> all non-conflict columns.
         batch_size:       Rows per execute_values call.
+        method:           ``'values'`` (execute_values batches) or ``'copy'``
+                          (COPY into a staging table, then one INSERT ...
+                          SELECT).  *None* -> ``'copy'`` once *data* reaches
+                          ``ETL_CONFIG['copy_upsert_threshold']`` rows.
+        returning:        Columns for a ``RETURNING`` clause; the returned
+                          rows (inserted and updated) are appended to
+                          *returned*.
+        returned:         Output list for ``RETURNING`` rows.
+        only_changed:     Change-aware mode: skip the update when the
+                          existing row already holds the same values
+                          (``IS DISTINCT FROM`` guard).  Skipped rows are
+                          not returned.
+        counts:           Accumulates inserted / updated / unchanged rows.
 
     Returns:
-        Number of rows written.
+        Number of rows written (inserted + updated in change-aware mode).
     """
     if not data:
         return 0
 
+    if method is None:
+        threshold = ETL_CONFIG['copy_upsert_threshold']
+        method = 'copy' if threshold and len(data) >= threshold else 'values'
+    if method not in UPSERT_METHODS:
+        raise ValueError(f"Unknown upsert method '{method}'. Must be one of {UPSERT_METHODS}")
+
     if update_columns is None:
         conflict_set = set(conflict_columns)
         update_columns = [c for c in columns if c not in conflict_set]
 
-    cols_sql = ', '.join(quote_col(c) for c in columns)
-    conflict_sql = ', '.join(quote_col(c) for c in conflict_columns)
-    update_sql = ', '.join(
-        f'{quote_col(c)} = EXCLUDED.{quote_col(c)}' for c in update_columns
-    )
+    track = only_changed or counts is not None
+
+    if method == 'copy':
+        return _staged_upsert(
+            conn, table, columns, data, conflict_columns, update_columns,
+            returning, returned, only_changed, counts,
+        )
 
+    cols_sql = ', '.join(quote_col(c) for c in columns)
     query = (
-        f'INSERT INTO {table} ({cols_sql}) VALUES %s '
-        f'ON CONFLICT ({conflict_sql}) '
-        f'DO UPDATE SET {update_sql}, updated_at = NOW()'
+        f'INSERT INTO {table} AS {UPSERT_ALIAS} ({cols_sql}) VALUES %s '
+        + _on_conflict_sql(conflict_columns, update_columns, only_changed)
+        + _returning_sql(returning, track)
     )
 
     cursor = conn.cursor()
@@ -75,8 +128,13 @@ def bulk_upsert(
     for offset in range(0, len(data), batch_size):
         batch = data[offset : offset + batch_size]
         try:
-            execute_values(cursor, query, batch, page_size=batch_size)
-            written += len(batch)
+            rows = execute_values(
+                cursor, query, batch, page_size=batch_size,
+                fetch=bool(returning) or track,
+            )
+            written += _settle_returned(
+                rows, len(batch), returning, returned, track, counts,
+            )
         except Exception:
             logger.error('Batch failed at offset %d in %s', offset, table)
             conn.rollback()
@@ -102,23 +160,175 @@ def bulk_copy(
     if not data:
         return 0
 
+    cursor = conn.cursor()
+    try:
+        _copy_rows(cursor, table, columns, data)
+        conn.commit()
+        return len(data)
+    except Exception:
+        logger.error('COPY into %s failed', table)
+        conn.rollback()
+        raise
+
+
+# ============================================================================
+# UPSERT & COPY HELPERS
+# ============================================================================
+# COPY rows are streamed as CSV: NULL is an unquoted empty field and every
+# string is quoted (doubling embedded quotes), so '', tabs, newlines and
+# backslashes round-trip unchanged.
+
+
+def _on_conflict_sql(
+    conflict_columns: List[str], update_columns: List[str], only_changed: bool = False,
+) -> str:
+    conflict_sql = ', '.join(quote_col(c) for c in conflict_columns)
+    if not update_columns:
+        return f'ON CONFLICT ({conflict_sql}) DO NOTHING'
+    update_sql = ', '.join(
+        f'{quote_col(c)} = EXCLUDED.{quote_col(c)}' for c in update_columns
+    )
+    sql = (
+        f'ON CONFLICT ({conflict_sql}) '
+        f'DO UPDATE SET {update_sql}, updated_at = NOW()'
+    )
+    if only_changed:
+        current = ', '.join(f'{UPSERT_ALIAS}.{quote_col(c)}' for c in update_columns)
+        incoming = ', '.join(f'EXCLUDED.{quote_col(c)}' for c in update_columns)
+        sql += f' WHERE ({current}) IS DISTINCT FROM ({incoming})'
+    return sql
+
+
+def _returning_sql(returning: Optional[List[str]], track: bool = False) -> str:
+    """RETURNING clause; *track* appends an inserted flag (xmax = 0 on insert)."""
+    items = [quote_col(c) for c in returning or []]
+    if track:
+        items.append('(xmax = 0)')
+    if not items:
+        return ''
+    return ' RETURNING ' + ', '.join(items)
+
+
+def _settle_returned(
+    fetched: Optional[List[tuple]],
+    n_rows: int,
+    returning: Optional[List[str]],
+    returned: Optional[List[tuple]],
+    track: bool,
+    counts: Optional[UpsertCounts],
+) -> int:
+    """Route RETURNING rows to the caller and tally them; returns rows written.
+
+    Rows skipped by the change guard are not returned, so with *track* on
+    ``n_rows - len(fetched)`` rows were unchanged.
+    """
+    if not track:
+        if returning and returned is not None:
+            returned.extend(fetched)
+        return n_rows
+
+    inserted = sum(1 for row in fetched if row[-1])
+    if counts is not None:
+        counts.inserted += inserted
+        counts.updated += len(fetched) - inserted
+        counts.unchanged += n_rows - len(fetched)
+    if returning and returned is not None:
+        returned.extend(row[:-1] for row in fetched)
+    return len(fetched)
+
+
+def _csv_field(value: Any) -> str:
+    """Render one value as a PostgreSQL CSV field."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_rows(cursor: Any, table: str, columns: List[str], data: List[tuple]) -> None:
+    """COPY *data* into *table* (``columns`` order) as escaped CSV."""
     buf = StringIO()
     for row in data:
-        line = '\t'.join(
-            str(v) if v is not None else '\\N' for v in row
-        )
-        buf.write(line + '\n')
+        buf.write(','.join(map(_csv_field, row)))
+        buf.write('\n')
     buf.seek(0)
 
+    cols_sql = ', '.join(quote_col(c) for c in columns)
+    cursor.copy_expert(
+        f'COPY {table} ({cols_sql}) FROM STDIN WITH (FORMAT csv)', buf,
+    )
+
+
+def _staged_upsert(
+    conn: Any,
+    table: str,
+    columns: List[str],
+    data: List[tuple],
+    conflict_columns: List[str],
+    update_columns: List[str],
+    returning: Optional[List[str]] = None,
+    returned: Optional[List[tuple]] = None,
+    only_changed: bool = False,
+    counts: Optional[UpsertCounts] = None,
+) -> int:
+    """COPY into a session-local staging table, then upsert in one statement.
+
+    The staging table copies only the written columns' types from *table*
+    and is dropped at commit.  Rows sharing a conflict key keep the last
+    one, as later execute_values batches would.
+    """
+    key_idx = [columns.index(c) for c in conflict_columns]
+    deduped = list({tuple(row[i] for i in key_idx): row for row in data}.values())
+    cols_sql = ', '.join(quote_col(c) for c in columns)
+
     cursor = conn.cursor()
     try:
-        cursor.copy_from(buf, table, columns=columns, null='\\N')
+        cursor.execute(f'DROP TABLE IF EXISTS {STAGING_TABLE}')
+        cursor.execute(
+            f'CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS '
+            f'SELECT {cols_sql} FROM {table} WITH NO DATA'
+        )
+        _copy_rows(cursor, STAGING_TABLE, columns, deduped)
+        track = only_changed or counts is not None
+        cursor.execute(
+            f'INSERT INTO {table} AS {UPSERT_ALIAS} ({cols_sql}) '
+            f'SELECT {cols_sql} FROM {STAGING_TABLE} '
+            + _on_conflict_sql(conflict_columns, update_columns, only_changed)
+            + _returning_sql(returning, track)
+        )
+        fetched = cursor.fetchall() if returning or track else None
+        written = _settle_returned(
+            fetched, len(deduped), returning, returned, track, counts,
+        )
         conn.commit()
-        return len(data)
     except Exception:
-        logger.error('COPY into %s failed', table)
+        logger.error('Staged upsert into %s failed (%d rows)', table, len(deduped))
         conn.rollback()
         raise
+    return written
+
+
+# ============================================================================
+# WRITE CONCURRENCY
+# ============================================================================
+# write_entity_rows holds one of these slots (and one pooled connection)
+# for the duration of its upsert, capping concurrent writers when the
+# scheduler runs several units at once.
+
+_write_slots = threading.BoundedSemaphore(ETL_CONFIG['max_concurrent_writes'])
+
+
+def set_write_concurrency(limit: int) -> None:
+    """Allow at most *limit* ``write_entity_rows`` calls at once.
+
+    Call before starting writers; slots held by running writes belong to
+    the previous semaphore.
+    """
+    global _write_slots
+    _write_slots = threading.BoundedSemaphore(max(1, limit))
 
 
 # ============================================================================
@@ -128,49 +338,50 @@ def bulk_copy(
 def upsert_entity_rows(
     conn: Any,
     table: str,
-    rows: Dict[int, Dict[str, Any]],
+    rows: Union[Dict[int, Dict[str, Any]], RowBatch],
     conflict_columns: List[str],
     batch_size: int = DEFAULT_BATCH_SIZE,
+    method: Optional[str] = None,
 ) -> int:
-    """Convert ``{entity_id: {col: val}}`` dicts to tuples and upsert.
+    """Upsert a ``RowBatch`` (or ``{entity_id: {col: val}}`` dicts).
 
-    Collects the union of all column names across every entity, fills
-    missing values with ``None``, and delegates to ``bulk_upsert``.
+    Every column of the batch is written; values missing from a dict row
+    are ``None``.  Delegates to ``bulk_upsert``.
 
     Args:
         conn:             psycopg2 connection.
         table:            Schema-qualified table name.
-        rows:             Extraction result from ``extract_columns_from_result``.
+        rows:             Extraction result (``RowBatch`` or row dicts).
         conflict_columns: PK / unique columns for upsert conflict resolution.
         batch_size:       Rows per batch.
+        method:           Upsert method, see ``bulk_upsert``.
 
     Returns:
         Number of rows written.
     """
-    if not rows:
+    batch = rows if isinstance(rows, RowBatch) else RowBatch.from_rows(rows)
+    if not batch:
         return 0
 
-    # Collect the union of all columns present in the data
-    all_cols: set = set()
-    for entity_vals in rows.values():
-        all_cols.update(entity_vals.keys())
-
-    columns = sorted(all_cols)
-    data = [
-        tuple(entity_vals.get(c) for c in columns)
-        for entity_vals in rows.values()
-    ]
+    columns = sorted(batch.columns)
+    data = [vals for _, vals in batch.iter_rows(columns)]
 
-    return bulk_upsert(conn, table, columns, data, conflict_columns, batch_size=batch_size)
+    return bulk_upsert(
+        conn, table, columns, data, conflict_columns,
+        batch_size=batch_size, method=method,
+    )
 
 
 def write_entity_rows(
     entity: str,
     scope: str,
-    rows: Dict[Any, Dict[str, Any]],
+    rows: Union[Dict[Any, Dict[str, Any]], RowBatch],
     season: str,
     season_type: str,
     db_schema: str,
+    method: Optional[str] = None,
+    counts: Optional[UpsertCounts] = None,
+    changed_ids: Optional[set] = None,
 ) -> int:
     """Write extracted entity rows to the database via upsert.
 
@@ -181,15 +392,24 @@ def write_entity_rows(
     Args:
         entity:      ``'player'`` or ``'team'``.
         scope:       ``'stats'`` or ``'entity'``.
-        rows:        ``{source_entity_id: {col_name: value, ...}, ...}``
+        rows:        A ``RowBatch`` keyed by source entity ID, or the
+                     equivalent ``{source_entity_id: {col_name: value}}``.
         season:      Season string (e.g. ``'2024-25'``).
         season_type: Season type code (e.g. ``'rs'``, ``'po'``, ``'pi'``).
         db_schema:   Database schema name (e.g. ``'nba'``).
+        method:      Upsert method, see ``bulk_upsert`` (default: by row count).
+        counts:      Accumulates inserted / updated / unchanged rows.
+        changed_ids: If given, receives the source IDs of rows that were
+                     inserted or updated.
+
+    Uses change-aware upserts when ``ETL_CONFIG['change_aware_upserts']``
+    is set, so rows already holding these values are left untouched.
 
     Returns:
-        Number of rows written.
+        Number of rows written (inserted + updated when change-aware).
     """
-    if not rows:
+    batch = rows if isinstance(rows, RowBatch) else RowBatch.from_rows(rows)
+    if not batch:
         return 0
 
     from src.etl.definitions import TABLES
@@ -202,21 +422,19 @@ def write_entity_rows(
     source_id_col = get_source_id_column(db_schema)
     conflict_columns = table_meta.get('unique_key') or [source_id_col]
 
-    all_cols: set = set()
-    for vals in rows.values():
-        all_cols.update(vals.keys())
+    data_cols = sorted(batch.columns)
+    only_changed = ETL_CONFIG['change_aware_upserts']
 
-    data_cols = sorted(all_cols)
-
-    with db_connection() as conn:
+    with _write_slots, db_connection() as conn:
         if scope == 'stats':
             entity_table = get_table_name(entity, 'entity', db_schema)
-            id_map = _load_entity_id_map(conn, entity_table, source_id_col)
+            id_map = get_entity_id_map(conn, entity_table, source_id_col)
 
             non_conflict_cols = [c for c in data_cols if c not in set(conflict_columns)]
             columns = list(conflict_columns) + non_conflict_cols
             data = []
-            for source_id, vals in rows.items():
+            source_by_serial: Dict[int, Any] = {}
+            for source_id, row_values in batch.iter_rows(non_conflict_cols):
                 serial_id = id_map.get(str(source_id))
                 if serial_id is None:
                     logger.warning(
@@ -236,29 +454,37 @@ def write_entity_rows(
                     else:
                         identity_values.append(None)
 
-                row_values = [vals.get(c) for c in non_conflict_cols]
-                data.append(tuple(identity_values + row_values))
+                data.append(tuple(identity_values) + row_values)
+                source_by_serial[serial_id] = source_id
 
             if not data:
                 return 0
-            return bulk_upsert(conn, table, columns, data, conflict_columns)
+            returned: List[tuple] = []
+            written = bulk_upsert(
+                conn, table, columns, data, conflict_columns, method=method,
+                returning=['entity_id'] if changed_ids is not None else None,
+                returned=returned, only_changed=only_changed, counts=counts,
+            )
+            if changed_ids is not None:
+                changed_ids.update(source_by_serial[row[0]] for row in returned)
+            return written
         else:
             # Entity scope: source_id maps to the table's unique key column.
             # For players, resolve team_id from source API team ID to Glass serial ID.
             team_id_map = None
             if entity == 'player' and 'team_id' in data_cols:
                 teams_table = get_table_name('team', 'entity', db_schema)
-                team_id_map = _load_entity_id_map(conn, teams_table, source_id_col)
+                team_id_map = get_entity_id_map(conn, teams_table, source_id_col)
 
             # Exclude conflict columns from data_cols to avoid duplicates
             non_conflict_cols = [c for c in data_cols if c not in set(conflict_columns)]
             columns = list(conflict_columns) + non_conflict_cols
             data = []
-            for source_id, vals in rows.items():
-                identity_values = [str(source_id)]
-                row_values = [vals.get(c) for c in non_conflict_cols]
+            for source_id, row_values in batch.iter_rows(non_conflict_cols):
+                identity_values = (str(source_id),)
 
                 if team_id_map and 'team_id' in non_conflict_cols:
+                    row_values = list(row_values)
                     ti = non_conflict_cols.index('team_id')
                     raw_team_id = str(row_values[ti]) if row_values[ti] is not None else None
                     if raw_team_id and raw_team_id in team_id_map:
@@ -269,9 +495,32 @@ def write_entity_rows(
                             raw_team_id, source_id,
                         )
 
-                data.append(tuple(identity_values + row_values))
+                data.append(identity_values + tuple(row_values))
 
-            return bulk_upsert(conn, table, columns, data, conflict_columns)
+            # RETURNING keeps the cached id map current for later stats writes
+            returned: List[tuple] = []
+            written = bulk_upsert(
+                conn, table, columns, data, conflict_columns, method=method,
+                returning=[source_id_col, 'id'], returned=returned,
+                only_changed=only_changed, counts=counts,
+            )
+            _record_entity_ids(table, source_id_col, returned)
+            if changed_ids is not None:
+                source_ids = {str(eid): eid for eid in batch.entity_ids}
+                changed_ids.update(source_ids.get(str(row[0]), row[0]) for row in returned)
+            return written
+
+
+# ============================================================================
+# ENTITY ID MAPS
+# ============================================================================
+# source_id -> serial id per entity table, loaded once per process and kept
+# current by entity-scope upserts (RETURNING), so stats writes resolve
+# entity ids without a query.  Code that deletes entity rows must call
+# invalidate_entity_id_maps().
+
+_id_map_lock = threading.Lock()
+_id_maps: Dict[Tuple[str, str], Dict[str, int]] = {}
 
 
 def _load_entity_id_map(conn: Any, entity_table: str, source_id_column: str) -> Dict[str, int]:
@@ -281,6 +530,38 @@ def _load_entity_id_map(conn: Any, entity_table: str, source_id_column: str) ->
         return {str(row[0]): row[1] for row in cur.fetchall()}
 
 
+def get_entity_id_map(conn: Any, entity_table: str, source_id_column: str) -> Dict[str, int]:
+    """Cached source_id -> serial id mapping (loaded on first use)."""
+    key = (entity_table, source_id_column)
+    with _id_map_lock:
+        id_map = _id_maps.get(key)
+    if id_map is None:
+        loaded = _load_entity_id_map(conn, entity_table, source_id_column)
+        with _id_map_lock:
+            id_map = _id_maps.setdefault(key, loaded)
+    return id_map
+
+
+def _record_entity_ids(
+    entity_table: str, source_id_column: str, returned: List[tuple],
+) -> None:
+    """Add ``(source_id, id)`` rows returned by an entity upsert to the cache."""
+    with _id_map_lock:
+        id_map = _id_maps.get((entity_table, source_id_column))
+        # Not loaded yet: the first lookup will read the whole table anyway
+        if id_map is None:
+            return
+        for source_id, serial_id in returned:
+            id_map[str(source_id)] = serial_id
+
+
+def invalidate_entity_id_maps(entity_table: Optional[str] = None) -> None:
+    """Drop cached id maps for *entity_table* (or all tables)."""
+    with _id_map_lock:
+        for key in [k for k in _id_maps if entity_table in (None, k[0])]:
+            del _id_maps[key]
+
+
 def seed_empty_stats(
     entity: str,
     season: str,
@@ -13,6 +13,7 @@ Column schema and provider source mappings live in the unified config
 (src/etl/config.py).
 """
 
+import json
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -173,7 +174,9 @@ def build_call_groups(
 
     Walks DB_COLUMNS, groups simple/derived columns that share the same
     (endpoint, params) so each batch requires exactly one API call.
-    Multi-call, pipeline, and team_call columns get their own entries.
+    Multi-call columns get their own entries; pipeline columns sharing
+    (endpoint, params, tier) and team_call columns sharing an endpoint are
+    merged into one entry each.
 
     Args:
         scope: If set, only include columns whose scope list contains
@@ -183,6 +186,7 @@ def build_call_groups(
         endpoint, params, tier, columns ({col_name: enriched_source})
     """
     simple_groups: Dict[tuple, Dict[str, Dict[str, Any]]] = {}
+    pipeline_groups: Dict[tuple, Dict[str, Dict[str, Any]]] = {}
     special: List[Dict[str, Any]] = []
 
     for col_name, col_meta in DB_COLUMNS.items():
@@ -203,7 +207,16 @@ def build_call_groups(
         if not is_endpoint_available(ep, season, endpoints):
             continue
 
-        if 'multi_call' in enriched or 'pipeline' in enriched:
+        if 'pipeline' in enriched:
+            pipeline = enriched['pipeline']
+            key = (
+                ep,
+                json.dumps(enriched.get('params', {}), sort_keys=True, default=str),
+                json.dumps(pipeline.get('params', {}), sort_keys=True, default=str),
+                tier_for_source(enriched, ep, endpoints),
+            )
+            pipeline_groups.setdefault(key, {})[col_name] = enriched
+        elif 'multi_call' in enriched:
             special.append({
                 'endpoint': ep,
                 'params': enriched.get('params', {}),
@@ -236,6 +249,16 @@ def build_call_groups(
             'removed_refresh_mode': removed_refresh_mode,
         })
 
+    # Pipeline columns reading the same endpoint + params share one group,
+    # which the executor compiles into a single DAG
+    for (ep, _, _, tier), cols in pipeline_groups.items():
+        groups.append({
+            'endpoint': ep,
+            'params': next(iter(cols.values())).get('params', {}),
+            'tier': tier,
+            'columns': cols,
+        })
+
     # Merge team_call columns that share the same endpoint into one group
     team_call_merged: Dict[str, Dict[str, Dict[str, Any]]] = {}
     for item in special:
@@ -252,4 +275,30 @@ def build_call_groups(
             'removed_refresh_mode': 'null_only',
         })
 
-    return groups
+    return _order_db_copy_groups(groups)
+
+
+def _order_db_copy_groups(groups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Move groups with ``db_copy`` operations after their source columns.
+
+    Such groups get a ``copies_from`` set naming the columns they read
+    back from the table (``op['column']``).  Groups copying from a column
+    another group writes move to the end, keeping their relative order.
+    """
+    written = {col: i for i, g in enumerate(groups) for col in g['columns']}
+    dependent = set()
+    for i, group in enumerate(groups):
+        sources = {
+            op['column']
+            for src in group['columns'].values()
+            for op in src.get('pipeline', {}).get('operations', [])
+            if op.get('type') == 'db_copy' and op.get('column')
+        }
+        if sources:
+            group['copies_from'] = sources
+            if any(written.get(col, i) != i for col in sources):
+                dependent.add(i)
+    return (
+        [g for i, g in enumerate(groups) if i not in dependent]
+        + [g for i, g in enumerate(groups) if i in dependent]
+    )
@@ -123,6 +123,21 @@ def mark_group_completed(
     conn.commit()
 
 
+def mark_group_skipped(
+    conn: Any, db_schema: str, progress_id: int, reason: str,
+) -> None:
+    """Mark a progress entry as skipped (e.g. API payload unchanged)."""
+    with conn.cursor() as cur:
+        cur.execute(
+            f"UPDATE {db_schema}.etl_progress "
+            f"SET status = 'skipped', completed_at = NOW(), rows_written = 0, "
+            f"error_message = %s "
+            f"WHERE id = %s",
+            (reason, progress_id),
+        )
+    conn.commit()
+
+
 def mark_group_failed(
     conn: Any, db_schema: str, progress_id: int, error_message: str,
 ) -> None:
@@ -138,6 +153,54 @@ def mark_group_failed(
     conn.commit()
 
 
+# ============================================================================
+# PAYLOAD HASHES
+# ============================================================================
+
+def get_payload_hash(
+    conn: Any,
+    db_schema: str,
+    entity_type: str,
+    endpoint: str,
+    params: str,
+    season: str,
+    season_type: str,
+) -> Optional[str]:
+    """Return the stored payload hash for a request, or None if never seen."""
+    with conn.cursor() as cur:
+        cur.execute(
+            f"SELECT payload_hash FROM {db_schema}.etl_payload_hashes "
+            f"WHERE entity_type = %s AND endpoint = %s AND params = %s "
+            f"AND season = %s AND season_type = %s",
+            (entity_type, endpoint, params, season, season_type),
+        )
+        row = cur.fetchone()
+    return row[0] if row else None
+
+
+def save_payload_hash(
+    conn: Any,
+    db_schema: str,
+    entity_type: str,
+    endpoint: str,
+    params: str,
+    season: str,
+    season_type: str,
+    payload_hash: str,
+) -> None:
+    """Record the hash of the payload that was just written."""
+    with conn.cursor() as cur:
+        cur.execute(
+            f"INSERT INTO {db_schema}.etl_payload_hashes "
+            f"(entity_type, endpoint, params, season, season_type, payload_hash) "
+            f"VALUES (%s, %s, %s, %s, %s, %s) "
+            f"ON CONFLICT (entity_type, endpoint, params, season, season_type) "
+            f"DO UPDATE SET payload_hash = EXCLUDED.payload_hash, updated_at = NOW()",
+            (entity_type, endpoint, params, season, season_type, payload_hash),
+        )
+    conn.commit()
+
+
 # ============================================================================
 # AUTO-RESUME
 # ============================================================================
@@ -191,7 +254,7 @@ def update_run_completed_groups(
         cur.execute(
             f"UPDATE {db_schema}.etl_runs SET completed_groups = ("
             f"  SELECT COUNT(*) FROM {db_schema}.etl_progress "
-            f"  WHERE run_id = %s AND status = 'completed'"
+            f"  WHERE run_id = %s AND status IN ('completed', 'skipped')"
             f") WHERE id = %s",
             (run_id, run_id),
         )
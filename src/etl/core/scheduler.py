@@ -0,0 +1,93 @@
+"""
+The Glass - ETL Scheduler
+
+Runs a dependency graph of ETL work units on a thread pool.  A task starts
+once every task it depends on has finished; ready tasks start in the order
+they were given, so ``max_workers=1`` reproduces a plain sequential loop.
+
+The scheduler only bounds how many units run at once.  The API request
+budget is enforced by the provider's rate limiter and DB write concurrency
+by ``load.set_write_concurrency``, both of which are shared by every
+worker thread.
+"""
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Task:
+    """One schedulable unit of work."""
+
+    key: Hashable
+    run: Callable[[], Any]
+    deps: Set[Hashable] = field(default_factory=set)
+
+
+def run_tasks(tasks: List[Task], max_workers: int = 1) -> Dict[Hashable, Any]:
+    """Run *tasks* on up to *max_workers* threads, honouring ``deps``.
+
+    Fails fast: after the first task raises, no new task is started,
+    running tasks are allowed to finish, and the exception is re-raised.
+
+    Returns:
+        ``{task.key: return value}`` for every task.
+
+    Raises:
+        ValueError: On duplicate keys, unknown dependencies or a cycle.
+    """
+    by_key: Dict[Hashable, Task] = {}
+    for task in tasks:
+        if task.key in by_key:
+            raise ValueError(f'Duplicate task key: {task.key!r}')
+        by_key[task.key] = task
+    for task in tasks:
+        unknown = task.deps - by_key.keys()
+        if unknown:
+            raise ValueError(f'Task {task.key!r} depends on unknown {sorted(map(repr, unknown))}')
+
+    pending: List[Task] = list(tasks)
+    done: Set[Hashable] = set()
+    results: Dict[Hashable, Any] = {}
+    running: Dict[Future, Task] = {}
+    error: Optional[Exception] = None
+    workers = max(1, max_workers)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while pending or running:
+            if error is None:
+                for task in [t for t in pending if t.deps <= done]:
+                    if len(running) >= workers:
+                        break
+                    pending.remove(task)
+                    running[pool.submit(task.run)] = task
+
+            if not running:
+                if error is not None:
+                    break
+                raise ValueError(
+                    f'Dependency cycle among tasks: {[t.key for t in pending]!r}'
+                )
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                task = running.pop(future)
+                try:
+                    results[task.key] = future.result()
+                except Exception as exc:
+                    if error is None:
+                        error = exc
+                        logger.error(
+                            'Task %r failed, not starting %d pending tasks: %s',
+                            task.key, len(pending), exc,
+                        )
+                    continue
+                done.add(task.key)
+
+    if error is not None:
+        raise error
+    return results
@@ -6,10 +6,16 @@ Type converters turn raw API values into DB-ready values.
 The pipeline engine executes multi-step transformations defined in config.
 """
 
+import json
 import logging
 import time
+from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Any, Callable, Dict, List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.etl.core.batch import RowBatch
 
 logger = logging.getLogger(__name__)
 
@@ -18,24 +24,25 @@ logger = logging.getLogger(__name__)
 # TYPE CONVERTERS
 # ============================================================================
 
+# Scaled results at or beyond this magnitude are unstorable (and would wrap
+# in the int64 batch path), so both paths map them to None
+INT_LIMIT = 2 ** 63
+
+
 def safe_int(value: Any, scale: int = 1) -> Optional[int]:
     """Convert value to scaled integer, returning None for unparseable input."""
     if value is None:
         return None
     try:
-        return round(float(value) * scale)
-    except (ValueError, TypeError):
+        result = round(float(value) * scale)
+    except (ValueError, TypeError, OverflowError):
         return None
+    return result if abs(result) < INT_LIMIT else None
 
 
 def safe_float(value: Any, scale: int = 1) -> Optional[int]:
     """Convert value to scaled float (stored as integer), returning None for unparseable input."""
-    if value is None:
-        return None
-    try:
-        return round(float(value) * scale)
-    except (ValueError, TypeError):
-        return None
+    return safe_int(value, scale)
 
 
 def safe_str(value: Any) -> Optional[str]:
@@ -57,7 +64,7 @@ def null_if_zero(value: Any) -> Optional[int]:
     try:
         if int(float(value)) == 0:
             return None
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         return None
     return safe_int(value)
 
@@ -105,6 +112,100 @@ def format_season_end_year(year: int) -> str:
     return f"{year - 1}-{str(year)[-2:]}"
 
 
+# ============================================================================
+# BATCH CONVERTERS
+# ============================================================================
+# Column-at-a-time equivalents of the converters above.  Each takes a
+# sequence of raw values and a scale and returns a list that matches the
+# scalar converter element for element.  The numeric ones run on NumPy
+# with null masks; the string / date parsers loop with the scalar bound
+# once, so callers skip the per-value dispatch in apply_transform.
+
+def to_float_array(values: Sequence[Any]) -> np.ndarray:
+    """Parse raw values to a 1-D float64 array.
+
+    None, unparseable and nested values (lists, dicts) become NaN, exactly
+    where ``float()`` would fail for the scalar converters.
+    """
+    try:
+        # Fast path: numbers, numeric strings and None (-> NaN).  Nested
+        # lists of equal length would parse into extra dimensions.
+        arr = np.array(values, dtype=np.float64)
+        if arr.ndim == 1:
+            return arr
+    except (ValueError, TypeError, OverflowError):
+        pass
+    out = np.empty(len(values), dtype=np.float64)
+    for i, value in enumerate(values):
+        try:
+            out[i] = float(value)
+        except (ValueError, TypeError, OverflowError):
+            out[i] = np.nan
+    return out
+
+
+def _unstorable(rounded: np.ndarray) -> np.ndarray:
+    """Mask of NaN / infinite values and magnitudes of ``INT_LIMIT`` or more."""
+    with np.errstate(invalid='ignore'):
+        return ~np.isfinite(rounded) | (np.abs(rounded) >= INT_LIMIT)
+
+
+def _ints_with_nulls(rounded: np.ndarray, null_mask: np.ndarray) -> List[Optional[int]]:
+    """Convert a rounded float array to Python ints, None where masked."""
+    out = np.where(null_mask, 0.0, rounded).astype(np.int64).astype(object)
+    out[null_mask] = None
+    return out.tolist()
+
+
+def safe_int_batch(values: Sequence[Any], scale: int = 1) -> List[Optional[int]]:
+    """Batch ``safe_int``: scale, round half to even, None for unparseable."""
+    rounded = np.rint(to_float_array(values) * scale)
+    return _ints_with_nulls(rounded, _unstorable(rounded))
+
+
+def safe_float_batch(values: Sequence[Any], scale: int = 1) -> List[Optional[int]]:
+    """Batch ``safe_float`` (stored as scaled integer, like the scalar)."""
+    return safe_int_batch(values, scale)
+
+
+def null_if_zero_batch(values: Sequence[Any], scale: int = 1) -> List[Optional[int]]:
+    """Batch ``null_if_zero``; *scale* is ignored, as in the scalar."""
+    arr = to_float_array(values)
+    rounded = np.rint(arr)
+    null_mask = _unstorable(rounded)
+    null_mask |= np.trunc(np.where(null_mask, 1.0, arr)) == 0
+    return _ints_with_nulls(rounded, null_mask)
+
+
+def safe_str_batch(values: Sequence[Any], scale: int = 1) -> List[Optional[str]]:
+    """Batch ``safe_str``; *scale* is ignored."""
+    return [safe_str(v) for v in values]
+
+
+def parse_height_batch(values: Sequence[Any], scale: int = 1) -> List[Optional[int]]:
+    """Batch ``parse_height``; *scale* is ignored."""
+    return [parse_height(v) for v in values]
+
+
+def parse_birthdate_batch(values: Sequence[Any], scale: int = 1) -> List[Optional[date]]:
+    """Batch ``parse_birthdate``; repeated strings are parsed once."""
+    parsed: Dict[Any, Optional[date]] = {}
+    out = []
+    for v in values:
+        try:
+            out.append(parsed[v])
+        except KeyError:
+            out.append(parsed.setdefault(v, parse_birthdate(v)))
+        except TypeError:  # unhashable
+            out.append(parse_birthdate(v))
+    return out
+
+
+def format_season_batch(values: Sequence[Any], scale: int = 1) -> List[Optional[str]]:
+    """Batch ``format_season``; *scale* is ignored."""
+    return [format_season(v) for v in values]
+
+
 # ============================================================================
 # TRANSFORM DISPATCH
 # ============================================================================
@@ -119,6 +220,21 @@ TRANSFORMS: Dict[str, Callable] = {
     'format_season': format_season,
 }
 
+# Batch variant of every TRANSFORMS entry, called as ``func(values, scale)``
+BATCH_TRANSFORMS: Dict[str, Callable] = {
+    'safe_int': safe_int_batch,
+    'safe_float': safe_float_batch,
+    'safe_str': safe_str_batch,
+    'null_if_zero': null_if_zero_batch,
+    'parse_height': parse_height_batch,
+    'parse_birthdate': parse_birthdate_batch,
+    'format_season': format_season_batch,
+}
+
+# Batch transforms that parse via NumPy and already map nested values
+# (dicts / lists) to None (see to_float_array)
+NUMERIC_TRANSFORMS = frozenset({'safe_int', 'safe_float', 'null_if_zero'})
+
 
 def apply_transform(value: Any, transform_name: str, scale: int = 1) -> Any:
     """Apply a named transform to a value.
@@ -134,6 +250,16 @@ def apply_transform(value: Any, transform_name: str, scale: int = 1) -> Any:
     return func(value)
 
 
+def apply_batch_transform(
+    values: Sequence[Any], transform_name: str, scale: int = 1,
+) -> List[Any]:
+    """Apply a named transform to a whole column of values in one call."""
+    func = BATCH_TRANSFORMS.get(transform_name)
+    if func is None:
+        raise ValueError(f"Unknown transform: {transform_name}")
+    return func(values, scale)
+
+
 # ============================================================================
 # PIPELINE ENGINE
 # ============================================================================
@@ -160,6 +286,8 @@ def execute_pipeline(
 ) -> Dict[int, Any]:
     """Execute a transformation pipeline and return ``{entity_id: value}``.
 
+    Single-column convenience wrapper around the DAG compiler below.
+
     Args:
         pipeline_config: The ``transformation`` dict from a SOURCES entry.
         api_fetcher: Callable ``(endpoint, params, execution_tier) -> raw_result``
@@ -173,39 +301,266 @@ def execute_pipeline(
     Returns:
         Dict mapping entity ID to the final computed value.
     """
-    endpoint = pipeline_config['endpoint']
-    execution_tier = pipeline_config.get('tier', 'league')
-    operations = pipeline_config['operations']
-    endpoint_params = pipeline_config.get('params', {})
-
-    # Determine if any operation needs API data
-    needs_api = any(op.get('type') not in ('db_copy',) for op in operations)
-
-    api_result = None
-    if needs_api:
-        api_result = api_fetcher(endpoint, endpoint_params, execution_tier)
-
-    data: Dict[int, Any] = {}
-    for op in operations:
-        op_type = op['type']
-        if op_type == 'extract':
-            data = _op_extract(api_result, op, entity_id_field)
-        elif op_type == 'multi_league_extract':
-            data = _op_multi_league_extract(op, api_fetcher, endpoint, entity_id_field, season, season_type_name)
-        elif op_type == 'filter':
-            data = _op_filter(data, op)
-        elif op_type == 'aggregate':
-            data = _op_aggregate(data, op)
-        elif op_type == 'scale':
-            data = _op_scale(data, op)
-        elif op_type == 'multiply':
-            data = _op_multiply(data, op)
-        elif op_type == 'db_copy':
-            data = _op_db_copy(op)
+    plan = compile_pipelines({'value': {'pipeline': pipeline_config}})
+    results, errors = execute_pipeline_plan(
+        plan, api_fetcher, entity, season, season_type_name, entity_id_field,
+    )
+    if errors:
+        raise errors['value']
+    return results['value']
+
+
+def _apply_op(
+    op: Dict[str, Any],
+    data: Dict[int, Any],
+    api_result: Optional[Dict[str, Any]],
+    api_fetcher: Callable,
+    endpoint: str,
+    entity_id_field: str,
+    season: str,
+    season_type_name: str,
+) -> Dict[int, Any]:
+    """Apply one pipeline operation to *data*."""
+    op_type = op['type']
+    if op_type == 'extract':
+        return _op_extract(api_result, op, entity_id_field)
+    if op_type == 'multi_league_extract':
+        return _op_multi_league_extract(
+            op, api_fetcher, endpoint, entity_id_field, season, season_type_name,
+        )
+    if op_type == 'filter':
+        return _op_filter(data, op)
+    if op_type == 'aggregate':
+        return _op_aggregate(data, op)
+    if op_type == 'scale':
+        return _op_scale(data, op)
+    if op_type == 'multiply':
+        return _op_multiply(data, op)
+    if op_type == 'db_copy':
+        return _op_db_copy(op)
+    raise ValueError(f"Unknown pipeline operation: {op_type}")
+
+
+# ============================================================================
+# PIPELINE DAG COMPILER
+# ============================================================================
+# All pipeline columns of a call group compile into one DAG.  Nodes are
+# hash-consed on (parent, operations), so columns that read the same
+# endpoint + params share one fetch node, and columns whose operation
+# lists share a prefix (typically the same extract) share those nodes.
+# Runs of filter / aggregate / scale operations fuse into a single node
+# that makes one pass over the entities.  Nodes are appended parents
+# first, so the node list is already in topological order.
+
+FUSABLE_OPS = frozenset({'filter', 'aggregate', 'scale'})
+
+
+@dataclass
+class PipelinePlan:
+    """Compiled pipeline DAG for a set of columns.
+
+    ``nodes`` are plain dicts in topological order; ``outputs`` maps each
+    column to the node producing its value (``None`` for an empty pipeline).
+    """
+    nodes: List[Dict[str, Any]] = field(default_factory=list)
+    outputs: Dict[str, Optional[int]] = field(default_factory=dict)
+
+
+def compile_pipelines(pipeline_columns: Dict[str, Dict[str, Any]]) -> PipelinePlan:
+    """Compile ``{col_name: source}`` pipeline columns into one shared DAG."""
+    plan = PipelinePlan()
+    index: Dict[tuple, int] = {}
+
+    def intern(key: tuple, node: Dict[str, Any]) -> int:
+        if key not in index:
+            node['id'] = len(plan.nodes)
+            plan.nodes.append(node)
+            index[key] = node['id']
+        return index[key]
+
+    for col_name, source in pipeline_columns.items():
+        config = source['pipeline']
+        endpoint = config['endpoint']
+        tier = config.get('tier', 'league')
+        params = config.get('params', {})
+        operations = config['operations']
+
+        # Only fetch when some operation needs API data
+        fetch_id = None
+        if any(op.get('type') not in ('db_copy',) for op in operations):
+            fetch_key = ('fetch', endpoint, json.dumps(params, sort_keys=True, default=str), tier)
+            fetch_id = intern(fetch_key, {
+                'kind': 'fetch', 'endpoint': endpoint, 'params': params, 'tier': tier,
+            })
+
+        parent_key: tuple = ('root', endpoint, fetch_id)
+        parent_id: Optional[int] = None
+        i = 0
+        while i < len(operations):
+            j = i + 1
+            if operations[i].get('type') in FUSABLE_OPS:
+                while j < len(operations) and operations[j].get('type') in FUSABLE_OPS:
+                    j += 1
+            chunk = operations[i:j]
+            key = (parent_key, json.dumps(chunk, sort_keys=True, default=str))
+            parent_id = intern(key, {
+                'kind': 'fused' if len(chunk) > 1 else 'op',
+                'ops': chunk,
+                'parent': parent_id,
+                'fetch': fetch_id,
+                'endpoint': endpoint,
+            })
+            parent_key = key
+            i = j
+
+        plan.outputs[col_name] = parent_id
+
+    return plan
+
+
+def _run_fused(data: Dict[int, Any], ops: List[Dict[str, Any]]) -> Dict[int, Any]:
+    """Apply a filter / aggregate / scale chain in one pass over *data*.
+
+    Equivalent to applying ``_op_filter``, ``_op_aggregate`` and
+    ``_op_scale`` one after another.
+    """
+    steps = []
+    for op in ops:
+        if op['type'] == 'filter':
+            steps.append(('filter', set(op['values'])))
+        elif op['type'] == 'aggregate':
+            steps.append(('aggregate', op.get('method', 'sum')))
         else:
-            raise ValueError(f"Unknown pipeline operation: {op_type}")
+            steps.append(('scale', op['factor']))
+
+    result: Dict[int, Any] = {}
+    for eid, val in data.items():
+        keep = True
+        for kind, arg in steps:
+            if kind == 'filter':
+                if val not in arg:
+                    keep = False
+                    break
+            elif kind == 'aggregate':
+                val = _aggregate_value(val, arg)
+            else:
+                val = round(float(val) * arg) if val is not None else None
+        if keep:
+            result[eid] = val
+    return result
+
+
+def execute_pipeline_plan(
+    plan: PipelinePlan,
+    api_fetcher: Callable,
+    entity: Literal['player', 'team'],
+    season: str,
+    season_type_name: str,
+    entity_id_field: str,
+) -> Tuple[Dict[str, Dict[int, Any]], Dict[str, Exception]]:
+    """Evaluate a compiled plan once and return per-column results.
+
+    Returns ``(results, errors)``: ``{col_name: {entity_id: value}}`` for
+    columns that succeeded and ``{col_name: exception}`` for columns whose
+    fetch or operations raised.  A failing node only fails the columns
+    that depend on it.
+    """
+    values: Dict[int, Any] = {}
+    node_errors: Dict[int, Exception] = {}
+
+    for node in plan.nodes:
+        node_id = node['id']
+        if node['kind'] == 'fetch':
+            try:
+                values[node_id] = api_fetcher(node['endpoint'], node['params'], node['tier'])
+            except Exception as exc:
+                node_errors[node_id] = exc
+            continue
+
+        upstream = [d for d in (node['parent'], node['fetch']) if d is not None]
+        failed_dep = next((d for d in upstream if d in node_errors), None)
+        if failed_dep is not None:
+            node_errors[node_id] = node_errors[failed_dep]
+            continue
 
-    return data
+        data = values[node['parent']] if node['parent'] is not None else {}
+        try:
+            if node['kind'] == 'fused':
+                values[node_id] = _run_fused(data, node['ops'])
+            else:
+                values[node_id] = _apply_op(
+                    node['ops'][0], data, values.get(node['fetch']), api_fetcher,
+                    node['endpoint'], entity_id_field, season, season_type_name,
+                )
+        except Exception as exc:
+            node_errors[node_id] = exc
+
+    results: Dict[str, Dict[int, Any]] = {}
+    errors: Dict[str, Exception] = {}
+    for col_name, node_id in plan.outputs.items():
+        if node_id is None:
+            results[col_name] = {}
+        elif node_id in node_errors:
+            errors[col_name] = node_errors[node_id]
+        else:
+            results[col_name] = values[node_id]
+    return results, errors
+
+
+def _describe_op(op: Dict[str, Any]) -> str:
+    op_type = op.get('type')
+    if op_type == 'extract':
+        target = op.get('field') or '{' + ', '.join(
+            f'{alias}={f}' for alias, f in (op.get('fields') or {}).items()
+        ) + '}'
+        desc = f"extract {op.get('result_set') or '*'}.{target}"
+        if op.get('filter_field') and op.get('filter_values'):
+            desc += f" where {op['filter_field']} in {op['filter_values']}"
+        return desc
+    if op_type == 'filter':
+        return f"filter in {op.get('values')}"
+    if op_type == 'aggregate':
+        return f"aggregate {op.get('method', 'sum')}"
+    if op_type == 'scale':
+        return f"scale x{op.get('factor')}"
+    if op_type == 'multiply':
+        return f"multiply {op.get('fields')}"
+    if op_type == 'multi_league_extract':
+        return f"multi_league_extract {op.get('field')} over {len(op.get('calls', []))} calls"
+    return str(op_type)
+
+
+def explain_pipeline_plan(plan: PipelinePlan) -> str:
+    """Human-readable listing of a compiled plan's nodes and outputs."""
+    consumers: Dict[int, List[str]] = {}
+    for col_name, node_id in plan.outputs.items():
+        if node_id is not None:
+            consumers.setdefault(node_id, []).append(col_name)
+
+    fetches = sum(1 for n in plan.nodes if n['kind'] == 'fetch')
+    lines = [
+        f"Pipeline plan: {len(plan.outputs)} columns, {fetches} fetches, "
+        f"{len(plan.nodes)} nodes"
+    ]
+    for node in plan.nodes:
+        if node['kind'] == 'fetch':
+            line = (
+                f"  #{node['id']} fetch {node['endpoint']} "
+                f"{json.dumps(node['params'], sort_keys=True, default=str)} "
+                f"tier={node['tier']}"
+            )
+        else:
+            source = node['parent'] if node['parent'] is not None else node['fetch']
+            prefix = 'fused ' if node['kind'] == 'fused' else ''
+            line = (
+                f"  #{node['id']} {prefix}"
+                + ' -> '.join(_describe_op(op) for op in node['ops'])
+                + (f" <- #{source}" if source is not None else '')
+            )
+        if node['id'] in consumers:
+            line += f"  => {', '.join(consumers[node['id']])}"
+        lines.append(line)
+    return '\n'.join(lines)
 
 
 # ============================================================================
@@ -308,10 +663,11 @@ def _op_multi_league_extract(
                 continue
             id_idx = headers.index(id_field)
             field_idx = headers.index(field)
-            for row in rs['rowSet']:
-                eid = row[id_idx]
-                val = safe_int(row[field_idx])
+            rows = rs['rowSet']
+            vals = safe_int_batch([row[field_idx] for row in rows])
+            for row, val in zip(rows, vals):
                 if val is not None:
+                    eid = row[id_idx]
                     totals[eid] = totals.get(eid, 0) + val
             break
 
@@ -329,20 +685,35 @@ def _op_aggregate(data: Dict[int, Any], op: Dict[str, Any]) -> Dict[int, Any]:
     """Reduce list values to a single value per entity."""
     method = op.get('method', 'sum')
     result = {}
+
+    # Convert every list element in one batch for the 'sum' method
+    if method == 'sum':
+        converted = safe_int_batch(
+            [v for val in data.values() if isinstance(val, list) for v in val]
+        )
+        offset = 0
+
     for eid, val in data.items():
-        if isinstance(val, list):
-            nums = [v for v in val if v is not None]
-            if method == 'sum':
-                result[eid] = sum(safe_int(v) or 0 for v in nums)
-            elif method == 'avg':
-                result[eid] = round(sum(float(v) for v in nums) / len(nums)) if nums else None
-            else:
-                raise ValueError(f"Unknown aggregate method: {method}")
+        if isinstance(val, list) and method == 'sum':
+            result[eid] = sum(c or 0 for c in converted[offset:offset + len(val)])
+            offset += len(val)
         else:
-            result[eid] = safe_int(val) if val is not None else None
+            result[eid] = _aggregate_value(val, method)
     return result
 
 
+def _aggregate_value(val: Any, method: str) -> Any:
+    """Reduce one entity's value (list or scalar) with *method*."""
+    if isinstance(val, list):
+        nums = [v for v in val if v is not None]
+        if method == 'sum':
+            return sum(safe_int(v) or 0 for v in nums)
+        if method == 'avg':
+            return round(sum(float(v) for v in nums) / len(nums)) if nums else None
+        raise ValueError(f"Unknown aggregate method: {method}")
+    return safe_int(val) if val is not None else None
+
+
 def _op_scale(data: Dict[int, Any], op: Dict[str, Any]) -> Dict[int, Any]:
     """Multiply all values by a constant factor."""
     factor = op['factor']
@@ -385,43 +756,53 @@ def _op_db_copy(op: Dict[str, Any]) -> Dict[int, Any]:
 # ============================================================================
 
 def aggregate_team_rows(
-    entity_team_rows: Dict[int, List[Dict[str, Any]]],
+    entity_ids: Sequence[Any],
+    codes: Sequence[int],
+    values: Dict[str, Sequence[Any]],
     columns: Dict[str, Dict[str, Any]],
     minutes_field: str = 'MIN',
-) -> Dict[int, Dict[str, Any]]:
+) -> RowBatch:
     """Aggregate per-team rows into per-entity values.
 
+    Takes columnar rows (see ``TeamRowBuffer``): ``codes[i]`` is the
+    index into *entity_ids* of row *i*, and ``values[field][i]`` its raw
+    value.  Each column is reduced with one group-by over all rows.
+
     For traded entities who appear on multiple teams, supports two
     aggregation modes per column (set via ``source['aggregation']``):
 
       - ``'sum'``: simple sum across all team stints (default)
       - ``'minute_weighted'``: weighted average by minutes played
     """
-    rows: Dict[int, Dict[str, Any]] = {}
-
-    for entity_id, team_rows in entity_team_rows.items():
-        total_minutes = sum(float(r.get(minutes_field) or 0) for r in team_rows)
-        values: Dict[str, Any] = {}
-
-        for col_name, source in columns.items():
-            nba_field = source.get('field')
-            scale = source.get('scale', 1)
-            transform_name = source.get('transform', 'safe_int')
-            aggregation = source.get('aggregation', 'sum')
-
-            if aggregation == 'minute_weighted' and total_minutes > 0:
-                weighted_sum = 0.0
-                for r in team_rows:
-                    val = r.get(nba_field)
-                    mins = float(r.get(minutes_field) or 0)
-                    if val is not None and mins > 0:
-                        weighted_sum += float(val) * mins
-                raw = weighted_sum / total_minutes
-            else:
-                raw = sum(float(r.get(nba_field) or 0) for r in team_rows)
-
-            values[col_name] = apply_transform(raw, transform_name, scale)
-
-        rows[entity_id] = values
-
-    return rows
+    n_entities = len(entity_ids)
+    codes_arr = np.asarray(codes, dtype=np.intp)
+
+    minutes = np.nan_to_num(to_float_array(values.get(minutes_field, [None] * len(codes))))
+    total_minutes = np.bincount(codes_arr, weights=minutes, minlength=n_entities)
+
+    col_values: Dict[str, List[Any]] = {}
+
+    for col_name, source in columns.items():
+        nba_field = source.get('field')
+        scale = source.get('scale', 1)
+        transform_name = source.get('transform', 'safe_int')
+        aggregation = source.get('aggregation', 'sum')
+
+        raw = to_float_array(values.get(nba_field, [None] * len(codes)))
+        present = ~np.isnan(raw)
+        sums = np.bincount(codes_arr, weights=np.where(present, raw, 0.0), minlength=n_entities)
+
+        if aggregation == 'minute_weighted':
+            stint = present & (minutes > 0)
+            weighted = np.bincount(
+                codes_arr, weights=np.where(stint, raw * minutes, 0.0), minlength=n_entities,
+            )
+            has_minutes = total_minutes > 0
+            sums = np.where(
+                has_minutes, weighted / np.where(has_minutes, total_minutes, 1.0), sums,
+            )
+
+        # One transform call per column rather than per entity
+        col_values[col_name] = apply_batch_transform(sums.tolist(), transform_name, scale)
+
+    return RowBatch.from_columns(list(entity_ids), col_values)
@@ -10,6 +10,7 @@ from src.etl.definitions.config import (                           # noqa: F401
     ETL_CONFIG_SCHEMA,
     ETL_TABLES,
     ETL_TABLES_SCHEMA,
+    INDEX_SCHEMA,
     SOURCES,
     SOURCES_SCHEMA,
     TABLES,
@@ -24,6 +24,7 @@ VALID_ENTITY_TYPES = {'player', 'team', 'opponent'}
 VALID_SCOPES = {'entity', 'stats'}
 VALID_UPDATE_FREQUENCIES = {'daily', 'annual', None}
 VALID_REFRESH_MODES = {'null_only', 'always'}
+VALID_PARTITION_KEYS = {'season'}
 
 DB_COLUMNS_SCHEMA = {
     'type': {'required': True, 'types': (str,)},
@@ -43,6 +44,16 @@ TABLES_SCHEMA = {
     'scope': {'required': True, 'types': (str,), 'allowed_values': VALID_SCOPES},
     'unique_key': {'required': False, 'types': (list,)},
     'has_opponent_columns': {'required': False, 'types': (bool,)},
+    'partition_by': {'required': False, 'types': (str,), 'allowed_values': VALID_PARTITION_KEYS},
+    'indexes': {'required': False, 'types': (list,)},
+}
+
+# One entry of a table's 'indexes' list (TABLES and ETL_TABLES)
+INDEX_SCHEMA = {
+    'columns': {'required': True, 'types': (list,)},
+    'include': {'required': False, 'types': (list,)},
+    'where': {'required': False, 'types': (str,)},
+    'unique': {'required': False, 'types': (bool,)},
 }
 
 ETL_CONFIG_SCHEMA = {
@@ -52,11 +63,19 @@ ETL_CONFIG_SCHEMA = {
     'max_retry_attempts': {'required': True, 'types': (int,)},
     'retry_delay_seconds': {'required': True, 'types': (int,)},
     'auto_resume': {'required': True, 'types': (bool,)},
+    'columnar_extract': {'required': True, 'types': (bool,)},
+    'copy_upsert_threshold': {'required': True, 'types': (int,)},
+    'change_aware_upserts': {'required': True, 'types': (bool,)},
+    'coalesce_writes': {'required': True, 'types': (bool,)},
+    'write_buffer_max_cells': {'required': True, 'types': (int,)},
+    'max_concurrent_units': {'required': True, 'types': (int,)},
+    'max_concurrent_writes': {'required': True, 'types': (int,)},
 }
 
 ETL_TABLES_SCHEMA = {
     'columns': {'required': True, 'types': (dict,)},
     'unique_key': {'required': False, 'types': (list,)},
+    'indexes': {'required': False, 'types': (list,)},
 }
 
 SOURCES_SCHEMA = {
@@ -80,26 +99,46 @@ TYPE_TRANSFORMS = {
 # ============================================================================
 # TABLE DEFINITIONS
 # ============================================================================
+#
+# 'indexes' entries are reconciled by ensure_tables: 'columns' is the key,
+# 'include' adds covering columns, 'where' makes the index partial.
 
 TABLES = {
     'players': {
         'entity': 'player',
         'scope': 'entity',
+        'indexes': [
+            # publish: players of a team (p.team_id = t.id)
+            {'columns': ['team_id'], 'include': ['id']},
+        ],
     },
     'teams': {
         'entity': 'team',
         'scope': 'entity',
+        'indexes': [
+            # publish: team lookup by abbreviation
+            {'columns': ['abbr'], 'include': ['id']},
+        ],
     },
     'player_season_stats': {
         'entity': 'player',
         'scope': 'stats',
         'unique_key': ['entity_id', 'season', 'season_type'],
+        'partition_by': 'season',
+        'indexes': [
+            # publish: league-wide scans by season / season type
+            {'columns': ['season', 'season_type'], 'include': ['entity_id']},
+        ],
     },
     'team_season_stats': {
         'entity': 'team',
         'scope': 'stats',
         'unique_key': ['entity_id', 'season', 'season_type'],
         'has_opponent_columns': True,
+        'partition_by': 'season',
+        'indexes': [
+            {'columns': ['season', 'season_type'], 'include': ['entity_id']},
+        ],
     },
 }
 
@@ -115,6 +154,25 @@ ETL_CONFIG = {
     'max_retry_attempts': 3,
     'retry_delay_seconds': 60,
     'auto_resume': True,
+    # Extract league-wide responses column-at-a-time with NumPy
+    'columnar_extract': True,
+    # Upserts of at least this many rows COPY into a staging table first
+    # (0 = always use execute_values)
+    'copy_upsert_threshold': 1000,
+    # Skip updates that would not change the stored row (IS DISTINCT FROM)
+    # and report real inserted/updated counts as rows_written
+    'change_aware_upserts': True,
+    # Buffer every stats group's rows per (entity, season, season type) and
+    # write them as one wide upsert; flush early past this many cells
+    'coalesce_writes': True,
+    'write_buffer_max_cells': 250_000,
+    # Entity-season units run concurrently on this many threads (1 = the
+    # sequential season -> entity order); API calls stay under the
+    # provider's rate limiter either way, whose process-wide budget and
+    # batch cooldowns are shared by every unit
+    'max_concurrent_units': 4,
+    # Concurrent upserts across all units
+    'max_concurrent_writes': 2,
 }
 
 
@@ -138,6 +196,13 @@ ETL_TABLES = {
             'total_rows': {'type': 'INTEGER', 'nullable': True, 'default': '0'},
             'error_message': {'type': 'TEXT', 'nullable': True},
         },
+        'indexes': [
+            # find_interrupted_run
+            {
+                'columns': ['season', 'season_type', 'entity_type', 'started_at'],
+                'where': "status = 'running'",
+            },
+        ],
     },
     'etl_progress': {
         'columns': {
@@ -155,6 +220,23 @@ ETL_TABLES = {
             'retry_count': {'type': 'INTEGER', 'nullable': True, 'default': '0'},
         },
         'unique_key': ['run_id', 'entity_type', 'endpoint', 'column_name'],
+        'indexes': [
+            # resume lookups and completed-group counts
+            {'columns': ['run_id', 'status']},
+        ],
+    },
+    'etl_payload_hashes': {
+        'columns': {
+            'id': {'type': 'SERIAL', 'primary_key': True, 'nullable': False},
+            'entity_type': {'type': 'VARCHAR(10)', 'nullable': False},
+            'endpoint': {'type': 'VARCHAR(100)', 'nullable': False},
+            'params': {'type': 'TEXT', 'nullable': False},
+            'season': {'type': 'VARCHAR(7)', 'nullable': False},
+            'season_type': {'type': 'VARCHAR(3)', 'nullable': False},
+            'payload_hash': {'type': 'VARCHAR(64)', 'nullable': False},
+            'updated_at': {'type': 'TIMESTAMP', 'nullable': False, 'default': 'NOW()'},
+        },
+        'unique_key': ['entity_type', 'endpoint', 'params', 'season', 'season_type'],
     },
 }
 
@@ -8,6 +8,7 @@ generic core modules:
   - core/extract.py:  field extraction from API responses
   - core/transform.py: type conversion, pipeline engine, aggregation
   - core/load.py:     database writes via upsert
+  - core/scheduler.py: dependency-ordered, concurrent execution of units
 
 Usage:
     python -m etl.runner --source nba_api                       # full run
@@ -15,42 +16,46 @@ Usage:
     python -m etl.runner --source nba_api --season-type po       # Playoffs
     python -m etl.runner --source nba_api --entity team         # teams only
     python -m etl.runner --source nba_api --endpoint leaguedashptstats
+    python -m etl.runner --source nba_api --record fixtures/   # save responses
+    python -m etl.runner --source nba_api --replay fixtures/   # offline re-run
+    python -m etl.runner --source nba_api --phase rederive      # rebuild from archive
 """
 
 import argparse
 import importlib
 import logging
-import warnings
+import threading
+from functools import partial
 from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 load_dotenv()
 
-from src.core.db import db_connection, quote_col
+from src.core.config import DB_POOL_CONFIG
+from src.core.db import db_connection, log_pool_stats, quote_col
 from src.etl.definitions import ETL_CONFIG
 from src.etl.core.db import ensure_tables
 from src.etl.core.cleanup import cleanup_stat_domains, prune_stale
+from src.etl.core.coalesce import FetchCoalescer
 from src.etl.core.config_validation import validate_config
-from src.etl.core.executor import ExecutionContext, execute_group
-from src.etl.core.load import seed_empty_stats
+from src.etl.core.executor import ExecutionContext, WriteBuffer, execute_group
+from src.etl.core.extract import get_pipeline_columns
+from src.etl.core.load import seed_empty_stats, set_write_concurrency
 from src.etl.core.progress_tracker import (
     complete_run,
     fail_run,
     mark_group_completed,
     mark_group_failed,
+    mark_group_skipped,
     mark_group_started,
     resolve_work,
     update_run_completed_groups,
 )
 from src.etl.core.plan import build_call_groups
+from src.etl.core.scheduler import Task, run_tasks
+from src.etl.core.transform import compile_pipelines, explain_pipeline_plan
 from src.etl.definitions import SOURCES, get_source_id_column
 
-warnings.filterwarnings(
-    'ignore',
-    message='Failed to return connection to pool',
-    module='urllib3',
-)
-
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -109,15 +114,51 @@ def _get_season_range(current_season: str) -> List[str]:
 # SHARED EXECUTION ENGINE
 # ============================================================================
 
-def _run_groups(
+def _flush_writes(
+    conn: Any,
+    db_schema: str,
+    buffer: WriteBuffer,
+    deferred: List[int],
+    failed: List[Dict[str, Any]],
+) -> int:
+    """Flush the write buffer, then settle the groups waiting on it.
+
+    Deferred groups are marked completed only once their rows are in the
+    database, with the number of changed rows they contributed to; if the
+    flush fails they are marked failed (and retried by the next resume
+    like any failed group).
+    """
+    try:
+        written, per_group = buffer.flush()
+    except Exception as exc:
+        logger.error(
+            'Write flush for %s %s %s failed: %s',
+            buffer.entity, buffer.scope, buffer.season, exc,
+        )
+        buffer.discard()
+        for progress_id in deferred:
+            mark_group_failed(conn, db_schema, progress_id, f'write flush failed: {exc}')
+        failed.append({
+            'entity': buffer.entity, 'season': buffer.season, 'error': str(exc),
+        })
+        deferred.clear()
+        return 0
+
+    for progress_id in deferred:
+        mark_group_completed(conn, db_schema, progress_id, per_group.get(progress_id, 0))
+    deferred.clear()
+    return written
+
+
+def _run_unit(
     run_type: str,
     scope: str,
-    entities: List[str],
-    seasons: List[str],
+    ent: str,
+    season: str,
+    groups: List[Dict[str, Any]],
     season_type: str,
     season_type_name: str,
     team_ids: Dict[str, int],
-    endpoint_filter: Optional[str],
     failed: List[Dict[str, Any]],
     *,
     provider_key: str,
@@ -126,76 +167,239 @@ def _run_groups(
     db_schema: str,
     api_config: dict,
     make_fetcher,
+    coalescer: FetchCoalescer,
 ) -> int:
-    """Execute call groups for a given scope across entities and seasons.
+    """Execute one entity-season's call groups.
 
     Handles progress tracking, resume support, and per-group error isolation.
+    Fetches go through the run-scoped *coalescer*, so identical requests
+    across groups are made once per season.
     """
-    total_rows = 0
+    logger.info(
+        '%s: %s %s — %d call groups', run_type, ent, season, len(groups),
+    )
+
+    # Stats writes coalesce into one wide upsert per entity-season;
+    # entity scope writes per group (per-entity groups read back the
+    # entities earlier groups inserted)
+    write_buffer = None
+    if ETL_CONFIG['coalesce_writes'] and scope == 'stats':
+        write_buffer = WriteBuffer(
+            ent, scope, season, season_type, db_schema,
+            max_cells=ETL_CONFIG['write_buffer_max_cells'],
+        )
+
+    ctx = ExecutionContext(
+        entity=ent,
+        scope=scope,
+        season=season,
+        season_type=season_type,
+        season_type_name=season_type_name,
+        entity_id_field=api_field_names['entity_id'][ent],
+        db_schema=db_schema,
+        api_fetcher=coalescer.wrap(
+            make_fetcher(season, season_type_name, ent),
+            season, season_type, ent,
+        ),
+        team_ids=team_ids,
+        max_consecutive_failures=api_config.get('max_consecutive_failures', 5),
+        max_workers=api_config.get('per_entity_workers', 1),
+        id_aliases=api_field_names.get('id_aliases', {}),
+        skip_unchanged=(run_type == 'update'),
+        write_buffer=write_buffer,
+    )
+
+    with db_connection() as conn:
+        ctx.conn = conn
+        run_id, work_items = resolve_work(
+            conn, db_schema, ent, season, season_type, groups, run_type,
+            ETL_CONFIG['auto_resume'],
+        )
+
+        entity_rows = 0
+        # Progress ids of groups whose rows sit in the write buffer
+        deferred: List[int] = []
+        try:
+            for group, progress_id in work_items:
+                # db_copy reads its source columns from the table, so
+                # anything still buffered must land first
+                if group.get('copies_from') and ctx.write_buffer is not None and deferred:
+                    entity_rows += _flush_writes(
+                        conn, db_schema, ctx.write_buffer, deferred, failed,
+                    )
+                mark_group_started(conn, db_schema, progress_id)
+                try:
+                    unchanged_before = len(ctx.unchanged_payloads)
+                    if ctx.write_buffer is not None:
+                        ctx.write_buffer.begin_group(progress_id)
+                    rows = execute_group(group, ctx, failed)
+                    if not rows and len(ctx.unchanged_payloads) > unchanged_before:
+                        mark_group_skipped(
+                            conn, db_schema, progress_id, 'payload unchanged',
+                        )
+                    elif ctx.write_buffer is not None:
+                        deferred.append(progress_id)
+                    else:
+                        entity_rows += rows
+                        mark_group_completed(conn, db_schema, progress_id, rows)
+                except Exception as exc:
+                    logger.error('Group %s failed: %s', group['endpoint'], exc)
+                    mark_group_failed(conn, db_schema, progress_id, str(exc))
+                    failed.append({
+                        'endpoint': group['endpoint'], 'error': str(exc),
+                    })
+
+                if ctx.write_buffer is not None and ctx.write_buffer.over_threshold:
+                    entity_rows += _flush_writes(
+                        conn, db_schema, ctx.write_buffer, deferred, failed,
+                    )
+
+            if ctx.write_buffer is not None:
+                entity_rows += _flush_writes(
+                    conn, db_schema, ctx.write_buffer, deferred, failed,
+                )
+
+            update_run_completed_groups(conn, db_schema, run_id)
+            complete_run(conn, db_schema, run_id, entity_rows)
+        except Exception as exc:
+            fail_run(conn, db_schema, run_id, str(exc))
+            raise
+
+    return entity_rows
+
+
+def _plan_groups(
+    run_type: str,
+    scope: str,
+    entities: List[str],
+    seasons: List[str],
+    season_type: str,
+    season_type_name: str,
+    team_ids: Dict[str, int],
+    endpoint_filter: Optional[str],
+    failed: List[Dict[str, Any]],
+    **source_kw,
+) -> List[Task]:
+    """Plan one task per entity-season that has call groups.
+
+    Entity discovery runs teams before players, so player rows can
+    resolve ``team_id``.  Each season's coalesced fetches are dropped
+    once all of this phase's tasks for it have finished.
+    """
+    coalescer: FetchCoalescer = source_kw['coalescer']
+    tasks: List[Task] = []
 
     for season in seasons:
+        season_tasks: List[Task] = []
         for ent in entities:
             groups = build_call_groups(
-                ent, season, provider_key, endpoints, scope=scope,
+                ent, season, source_kw['provider_key'], source_kw['endpoints'],
+                scope=scope,
             )
             if endpoint_filter:
                 groups = [g for g in groups if g['endpoint'] == endpoint_filter]
             if not groups:
                 continue
 
-            logger.info(
-                '%s: %s %s — %d call groups', run_type, ent, season, len(groups),
-            )
+            deps = set()
+            if scope == 'entity' and ent == 'player':
+                deps = {t.key for t in season_tasks if t.key[2] == 'team'}
+            season_tasks.append(Task(
+                (run_type, season, ent),
+                partial(
+                    _run_unit, run_type, scope, ent, season, groups,
+                    season_type, season_type_name, team_ids, failed,
+                    **source_kw,
+                ),
+                deps,
+            ))
+        tasks.extend(_discard_season_after(season_tasks, coalescer, season))
+
+    return tasks
+
+
+def _discard_season_after(
+    tasks: List[Task],
+    coalescer: FetchCoalescer,
+    season: str,
+) -> List[Task]:
+    """Wrap *tasks* so the last one to finish drops *season* from the coalescer."""
+    remaining = [len(tasks)]
+    lock = threading.Lock()
+
+    def wrap(run):
+        def run_then_release():
+            try:
+                return run()
+            finally:
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    coalescer.discard_season(season)
+        return run_then_release
+
+    for task in tasks:
+        task.run = wrap(task.run)
+    return tasks
 
-            ctx = ExecutionContext(
-                entity=ent,
-                scope=scope,
-                season=season,
-                season_type=season_type,
-                season_type_name=season_type_name,
-                entity_id_field=api_field_names['entity_id'][ent],
-                db_schema=db_schema,
-                api_fetcher=make_fetcher(season, season_type_name, ent),
-                team_ids=team_ids,
-                rate_limit_delay=api_config.get('rate_limit_delay', 1.2),
-                max_consecutive_failures=api_config.get('max_consecutive_failures', 5),
-                id_aliases=api_field_names.get('id_aliases', {}),
-            )
 
-            with db_connection() as conn:
-                run_id, work_items = resolve_work(
-                    conn, db_schema, ent, season, season_type, groups, run_type,
-                    ETL_CONFIG['auto_resume'],
-                )
+# ============================================================================
+# SCHEDULING
+# ============================================================================
 
-                entity_rows = 0
-                try:
-                    for group, progress_id in work_items:
-                        mark_group_started(conn, db_schema, progress_id)
-                        try:
-                            rows = execute_group(group, ctx, failed)
-                            entity_rows += rows
-                            mark_group_completed(conn, db_schema, progress_id, rows)
-                        except Exception as exc:
-                            logger.error('Group %s failed: %s', group['endpoint'], exc)
-                            mark_group_failed(conn, db_schema, progress_id, str(exc))
-                            failed.append({
-                                'endpoint': group['endpoint'], 'error': str(exc),
-                            })
-
-                    total_rows += entity_rows
-                    update_run_completed_groups(conn, db_schema, run_id)
-                    complete_run(conn, db_schema, run_id, entity_rows)
-                except Exception as exc:
-                    fail_run(conn, db_schema, run_id, str(exc))
-                    raise
+# A task waits for every earlier-stage task of its season, and for its
+# entity's discovery (which only runs for the current season).  Same-stage
+# tasks are independent apart from discovery's teams -> players edge.
+PHASE_STAGES = {
+    'discover': 0,
+    'seed': 1,
+    'backfill': 2,
+    'rederive': 2,
+    'update': 3,
+    'cleanup': 4,
+}
+
+
+def _link_phases(tasks: List[Task]) -> List[Task]:
+    """Add the cross-phase dependencies to *tasks* (keys are (phase, season, entity))."""
+    for task in tasks:
+        run_type, season, ent = task.key
+        stage = PHASE_STAGES[run_type]
+        for other in tasks:
+            o_type, o_season, o_ent = other.key
+            if PHASE_STAGES[o_type] >= stage:
+                continue
+            if o_season == season or (o_type == 'discover' and o_ent == ent):
+                task.deps.add(other.key)
+    return tasks
 
-    return total_rows
+
+def _unit_workers() -> int:
+    """Concurrent units, capped so units and writers fit in the DB pool.
+
+    Every running unit holds one pooled connection, used for progress
+    tracking and for the executor's lookups (payload hashes, per-entity
+    source ids) via ``ExecutionContext.conn``; every write slot needs one
+    more.
+    """
+    units = ETL_CONFIG['max_concurrent_units']
+    room = DB_POOL_CONFIG['max_size'] - ETL_CONFIG['max_concurrent_writes']
+    if units > room:
+        logger.warning(
+            'max_concurrent_units=%d does not fit a pool of %d with %d write '
+            'slots; running %d units at once',
+            units, DB_POOL_CONFIG['max_size'],
+            ETL_CONFIG['max_concurrent_writes'], max(1, room),
+        )
+        units = max(1, room)
+    return units
 
 
 # ============================================================================
 # ETL PHASES
 # ============================================================================
+# Each phase plans its tasks; run_etl links and schedules them together.
 
 def _discover_entities(
     entities: List[str],
@@ -205,10 +409,10 @@ def _discover_entities(
     team_ids: Dict[str, int],
     failed: List[Dict[str, Any]],
     **source_kw,
-) -> int:
+) -> List[Task]:
     """Phase 1: Populate entity tables (players, teams) from current season."""
     logger.info('Phase: discover_entities')
-    return _run_groups(
+    return _plan_groups(
         'discover', 'entity', entities, [season],
         season_type, season_type_name, team_ids, None, failed,
         **source_kw,
@@ -224,10 +428,10 @@ def _backfill(
     endpoint_filter: Optional[str],
     failed: List[Dict[str, Any]],
     **source_kw,
-) -> int:
+) -> List[Task]:
     """Phase 2: Fill stats for all seasons in the retention window."""
     logger.info('Phase: backfill (%d seasons)', len(seasons))
-    return _run_groups(
+    return _plan_groups(
         'backfill', 'stats', entities, seasons,
         season_type, season_type_name, team_ids, endpoint_filter, failed,
         **source_kw,
@@ -243,21 +447,44 @@ def _update_current(
     endpoint_filter: Optional[str],
     failed: List[Dict[str, Any]],
     **source_kw,
-) -> int:
+) -> List[Task]:
     """Phase 3: Refresh stats for the current season only."""
     logger.info('Phase: update_current')
-    return _run_groups(
+    return _plan_groups(
         'update', 'stats', entities, [season],
         season_type, season_type_name, team_ids, endpoint_filter, failed,
         **source_kw,
     )
 
 
+def _rederive(
+    entities: List[str],
+    seasons: List[str],
+    season_type: str,
+    season_type_name: str,
+    team_ids: Dict[str, int],
+    endpoint_filter: Optional[str],
+    failed: List[Dict[str, Any]],
+    **source_kw,
+) -> List[Task]:
+    """Rebuild stats for all seasons from the raw response archive.
+
+    Runs the same call groups as backfill, but the source client serves
+    every response from its archive, so no request reaches the API.
+    """
+    logger.info('Phase: rederive (%d seasons)', len(seasons))
+    return _plan_groups(
+        'rederive', 'stats', entities, seasons,
+        season_type, season_type_name, team_ids, endpoint_filter, failed,
+        **source_kw,
+    )
+
+
 # ============================================================================
 # ORCHESTRATOR
 # ============================================================================
 
-VALID_PHASES = {'full', 'discover', 'backfill', 'update', 'prune'}
+VALID_PHASES = {'full', 'discover', 'backfill', 'update', 'prune', 'rederive'}
 
 
 def run_etl(
@@ -267,20 +494,31 @@ def run_etl(
     endpoint_filter: Optional[str] = None,
     season: Optional[str] = None,
     season_type: str = 'rs',
+    record_dir: Optional[str] = None,
+    replay_dir: Optional[str] = None,
 ) -> None:
     """Main ETL entry point.
 
     Args:
         source:          Registered source key (e.g. ``'nba_api'``).
         phase:           Execution phase — 'full', 'discover', 'backfill',
-                         'update', or 'prune'.
+                         'update', 'prune', or 'rederive' (rebuild stats
+                         from the source's raw response archive).
         entity:          'player', 'team', or 'all'.
         endpoint_filter: If set, only process this one endpoint.
         season:          e.g. '2024-25'.  Defaults to current season.
         season_type:     'rs'=Regular Season, 'po'=Playoffs, 'pi'=PlayIn.
+        record_dir:      If set, save every raw API response under this directory.
+        replay_dir:      If set, serve API responses recorded under this
+                         directory instead of calling the API (no network,
+                         no rate limiting).
     """
     if phase not in VALID_PHASES:
         raise ValueError(f"Invalid phase '{phase}'. Must be one of {VALID_PHASES}")
+    if record_dir and replay_dir:
+        raise ValueError("record_dir and replay_dir are mutually exclusive")
+    if phase == 'rederive' and (record_dir or replay_dir):
+        raise ValueError("rederive reads the response archive; drop record/replay")
 
     config_mod, client_mod = _load_source(source)
     source_meta = SOURCES[source]
@@ -309,11 +547,31 @@ def run_etl(
         config_mod.validate_provider_config()
 
     validate_config(endpoints, endpoints_schema)
-    ensure_tables(db_schema)
+    season_range = _get_season_range(season)
+    oldest_season = season_range[0]
+    # Every season the run can write needs its stats partition up front
+    ensure_tables(db_schema, seasons=season_range)
+
+    # Compile per-endpoint call specs up front so fetches only fill slots
+    if hasattr(client_mod, 'compile_call_specs'):
+        client_mod.compile_call_specs()
+
+    if record_dir or replay_dir:
+        if not hasattr(client_mod, 'configure_fixtures'):
+            raise ValueError(f"Source '{source}' does not support record/replay")
+        client_mod.configure_fixtures(
+            'record' if record_dir else 'replay', record_dir or replay_dir,
+        )
+
+    if phase == 'rederive':
+        if not hasattr(client_mod, 'configure_archive_replay'):
+            raise ValueError(f"Source '{source}' does not keep a response archive")
+        client_mod.configure_archive_replay(True)
 
     # provider_key is the league name, matching the keys in DB_COLUMNS sources
     provider_key = league
 
+    coalescer = FetchCoalescer()
     source_kw = dict(
         provider_key=provider_key,
         endpoints=endpoints,
@@ -321,6 +579,7 @@ def run_etl(
         db_schema=db_schema,
         api_config=api_config,
         make_fetcher=client_mod.make_fetcher,
+        coalescer=coalescer,
     )
 
     entities = ['team', 'player'] if entity == 'all' else [entity]
@@ -328,45 +587,71 @@ def run_etl(
     failed: List[Dict[str, Any]] = []
     total_rows = 0
 
-    season_range = _get_season_range(season)
-    oldest_season = season_range[0]
+    tasks: List[Task] = []
 
     if phase in ('full', 'discover'):
-        total_rows += _discover_entities(
+        tasks += _discover_entities(
             entities, season, season_type, season_type_name, team_ids, failed,
             **source_kw,
         )
         # Always seed RS records for new entities — PO/PI records are created
         # only when those season types are explicitly backfilled.
         for ent in entities:
-            total_rows += seed_empty_stats(ent, season, 'rs', db_schema)
+            tasks.append(Task(
+                ('seed', season, ent),
+                partial(seed_empty_stats, ent, season, 'rs', db_schema),
+            ))
 
     if phase in ('full', 'backfill'):
-        total_rows += _backfill(
+        tasks += _backfill(
             entities, season_range, season_type, season_type_name,
             team_ids, endpoint_filter, failed,
             **source_kw,
         )
 
     if phase in ('full', 'update'):
-        total_rows += _update_current(
+        tasks += _update_current(
             entities, season, season_type, season_type_name,
             team_ids, endpoint_filter, failed,
             **source_kw,
         )
 
+    if phase == 'rederive':
+        tasks += _rederive(
+            entities, season_range, season_type, season_type_name,
+            team_ids, endpoint_filter, failed,
+            **source_kw,
+        )
 
     # Run ELT cleaning rules (domain coherency: nullifying/zeroing missing stats)
-    if phase in ('full', 'backfill', 'update') and not endpoint_filter:
-        seasons_to_clean = season_range if phase in ('full', 'backfill') else [season]
+    if phase in ('full', 'backfill', 'update', 'rederive') and not endpoint_filter:
+        seasons_to_clean = (
+            season_range if phase in ('full', 'backfill', 'rederive') else [season]
+        )
         for s in seasons_to_clean:
             for ent in entities:
-                total_rows += cleanup_stat_domains(db_schema, ent, s, season_type)
+                tasks.append(Task(
+                    ('cleanup', s, ent),
+                    partial(cleanup_stat_domains, db_schema, ent, s, season_type),
+                ))
+
+    set_write_concurrency(ETL_CONFIG['max_concurrent_writes'])
+    workers = _unit_workers()
+    logger.info(
+        'Scheduling %d tasks on %d workers (%d concurrent writes)',
+        len(tasks), workers, ETL_CONFIG['max_concurrent_writes'],
+    )
+    total_rows += sum(run_tasks(_link_phases(tasks), workers).values())
 
     if phase in ('full', 'prune'):
         total_rows += prune_stale(entities, oldest_season, db_schema)
 
     logger.info('ETL complete: %d total rows written/pruned', total_rows)
+    coalescer.log_summary()
+
+    if hasattr(client_mod, 'log_run_stats'):
+        client_mod.log_run_stats()
+    log_pool_stats()
 
     if failed:
         logger.warning('%d failures:', len(failed))
@@ -374,6 +659,46 @@ def run_etl(
             logger.warning('  %s', f)
 
 
+# ============================================================================
+# PLAN EXPLAIN
+# ============================================================================
+
+def explain_pipelines(
+    source: str,
+    entity: str = 'all',
+    endpoint_filter: Optional[str] = None,
+    season: Optional[str] = None,
+) -> str:
+    """Describe the compiled pipeline DAG of every call group.
+
+    Builds the call groups exactly as a run would, without touching the
+    database or the API.
+    """
+    config_mod, _ = _load_source(source)
+    # provider_key is the league name, matching the keys in DB_COLUMNS sources
+    provider_key = SOURCES[source]['leagues'][0]
+    season = season or config_mod.SEASON_CONFIG['current_season']
+    entities = ['player', 'team'] if entity == 'all' else [entity]
+
+    sections: List[str] = []
+    for scope in ('entity', 'stats'):
+        for ent in entities:
+            groups = build_call_groups(
+                ent, season, provider_key, config_mod.ENDPOINTS, scope=scope,
+            )
+            for group in groups:
+                if endpoint_filter and group['endpoint'] != endpoint_filter:
+                    continue
+                pipelines = get_pipeline_columns(group['columns'])
+                if not pipelines:
+                    continue
+                sections.append(
+                    f"[{scope}] {ent} {season} {group['endpoint']} tier={group['tier']}\n"
+                    + explain_pipeline_plan(compile_pipelines(pipelines))
+                )
+    return '\n\n'.join(sections) or 'No pipeline columns.'
+
+
 # ============================================================================
 # CLI
 # ============================================================================
@@ -394,8 +719,25 @@ def main() -> None:
     parser.add_argument('--season-type', type=str, default='rs', choices=['rs', 'po', 'pi'])
     parser.add_argument('--entity', type=str, default='all', choices=['player', 'team', 'all'])
     parser.add_argument('--endpoint', type=str, default=None)
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument(
+        '--record', type=str, default=None, metavar='DIR',
+        help='Save every raw API response under DIR',
+    )
+    fixtures.add_argument(
+        '--replay', type=str, default=None, metavar='DIR',
+        help='Serve API responses recorded under DIR (no network, no rate limiting)',
+    )
+    parser.add_argument(
+        '--explain', action='store_true',
+        help='Print the compiled pipeline plans and exit (no DB or API access)',
+    )
     args = parser.parse_args()
 
+    if args.explain:
+        print(explain_pipelines(args.source, args.entity, args.endpoint, args.season))
+        return
+
     run_etl(
         source=args.source,
         phase=args.phase,
@@ -403,6 +745,8 @@ def main() -> None:
         endpoint_filter=args.endpoint,
         season=args.season,
         season_type=args.season_type,
+        record_dir=args.record,
+        replay_dir=args.replay,
     )
 
 
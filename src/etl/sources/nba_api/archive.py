@@ -0,0 +1,200 @@
+"""
+The Glass - NBA API Raw Response Archive
+
+Bronze layer for the NBA source.  Every response fetched from the live API
+is appended to a gzip-compressed NDJSON file partitioned by season and
+endpoint (``<dir>/<season>/<endpoint>.ndjson.gz``).  Each line holds the
+endpoint, season, full parameter dict, fetch time and raw response.
+
+In re-derive mode (``--phase rederive`` on the runner) the fetcher reads
+responses back from the archive instead of calling the API, so new
+DB_COLUMNS mapped to already-fetched endpoints can be populated offline.
+When a request was archived more than once, the most recent line wins.
+
+Appends write one gzip member per record; concatenated members are a
+valid gzip stream, so files never need rewriting.
+
+No classes -- module-level state guarded by a lock, like the client.
+Archive files are decompressed outside that lock, one loader per file.
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from src.etl.sources.nba_api.cache import cache_key
+from src.etl.sources.nba_api.config import ARCHIVE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_state: Dict[str, Any] = {
+    'replay': False,
+    'appended': 0,
+    'bytes_written': 0,
+    'replay_hits': 0,
+    'replay_misses': 0,
+}
+
+# (season, endpoint) -> {cache_key: response}, least recently used first;
+# bounded by ARCHIVE_CONFIG['index_cache_size']
+_index: 'OrderedDict[Tuple[str, str], Dict[str, Dict[str, Any]]]' = OrderedDict()
+# (season, endpoint) -> lock held while that file is being loaded
+_load_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+
+def _archive_path(season: str, endpoint: str) -> str:
+    return os.path.join(ARCHIVE_CONFIG['directory'], season, f'{endpoint}.ndjson.gz')
+
+
+# ============================================================================
+# WRITE
+# ============================================================================
+
+def append_response(
+    endpoint: str,
+    season: str,
+    params: Dict[str, Any],
+    response: Optional[Dict[str, Any]],
+) -> None:
+    """Append one raw response to the season's archive for *endpoint*."""
+    if not ARCHIVE_CONFIG['enabled'] or _state['replay'] or response is None:
+        return
+
+    line = json.dumps(
+        {
+            'endpoint': endpoint,
+            'season': season,
+            'params': params,
+            'fetched_at': time.time(),
+            'response': response,
+        },
+        default=str, separators=(',', ':'),
+    ) + '\n'
+
+    path = _archive_path(season, endpoint)
+    with _lock:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            size_before = os.path.getsize(path) if os.path.exists(path) else 0
+            with gzip.open(path, 'at', encoding='utf-8') as fh:
+                fh.write(line)
+            _state['bytes_written'] += os.path.getsize(path) - size_before
+        except OSError as exc:
+            logger.warning('Could not archive %s response: %s', endpoint, exc)
+            return
+        _state['appended'] += 1
+
+
+# ============================================================================
+# RE-DERIVE (READ)
+# ============================================================================
+
+def set_archive_replay(enabled: bool) -> None:
+    """Serve fetches from the archive instead of the API (re-derive mode)."""
+    with _lock:
+        _state['replay'] = enabled
+        _index.clear()
+        _load_locks.clear()
+
+
+def archive_replay_active() -> bool:
+    return _state['replay']
+
+
+def _load_index(season: str, endpoint: str) -> Dict[str, Dict[str, Any]]:
+    """Read one archive file into a {cache_key: response} dict.
+
+    Touches no shared state, so callers run it without holding ``_lock``.
+    """
+    responses: Dict[str, Dict[str, Any]] = {}
+    path = _archive_path(season, endpoint)
+    if not os.path.exists(path):
+        return responses
+
+    with gzip.open(path, 'rt', encoding='utf-8') as fh:
+        for line_no, line in enumerate(fh, 1):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A crash mid-append can leave a truncated final line
+                logger.warning('Skipping unreadable archive line %s:%d', path, line_no)
+                continue
+            responses[cache_key(endpoint, entry['params'])] = entry['response']
+
+    return responses
+
+
+def _get_index(season: str, endpoint: str) -> Dict[str, Dict[str, Any]]:
+    """Return the cached index for (season, endpoint), loading it once.
+
+    Units re-deriving different seasons load their files concurrently;
+    requests for a file that is already loading wait for that load instead
+    of decompressing it again.
+    """
+    key = (season, endpoint)
+    with _lock:
+        responses = _index.get(key)
+        if responses is not None:
+            _index.move_to_end(key)
+            return responses
+        key_lock = _load_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        with _lock:
+            responses = _index.get(key)
+            if responses is not None:
+                _index.move_to_end(key)
+                return responses
+
+        responses = _load_index(season, endpoint)
+
+        with _lock:
+            _index[key] = responses
+            while len(_index) > max(1, ARCHIVE_CONFIG['index_cache_size']):
+                _index.popitem(last=False)
+            _load_locks.pop(key, None)
+    return responses
+
+
+def get_archived_response(
+    endpoint: str, season: str, params: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """Return the latest archived response for (endpoint, params), or ``None``."""
+    response = _get_index(season, endpoint).get(cache_key(endpoint, params))
+    with _lock:
+        if response is None:
+            _state['replay_misses'] += 1
+        else:
+            _state['replay_hits'] += 1
+    return response
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+def archive_stats() -> Dict[str, Any]:
+    """Snapshot of append and re-derive counters for this process."""
+    with _lock:
+        return dict(_state)
+
+
+def log_archive_stats() -> None:
+    """Log a one-line archive summary."""
+    stats = archive_stats()
+    if stats['replay']:
+        logger.info(
+            'Response archive: %d responses re-derived, %d requests not archived',
+            stats['replay_hits'], stats['replay_misses'],
+        )
+    elif stats['appended']:
+        logger.info(
+            'Response archive: %d responses appended (%.1f MB compressed)',
+            stats['appended'], stats['bytes_written'] / 1024 ** 2,
+        )
@@ -0,0 +1,268 @@
+"""
+The Glass - NBA API Response Cache
+
+Content-addressed on-disk cache for raw NBA API responses.  Entries are
+keyed by endpoint plus the fully built parameter dict, stored as gzipped
+JSON, and expire according to a TTL derived from the ``update_frequency``
+of the columns each endpoint feeds.  Completed seasons never change, so
+their responses are kept until evicted.
+
+Total size is capped by ``CACHE_CONFIG['max_bytes']``; least recently used
+entries (by file mtime, refreshed on every hit) are evicted first.
+
+No classes -- module-level state guarded by a lock, like the client.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from src.etl.definitions import DB_COLUMNS
+from src.etl.sources.nba_api.config import CACHE_CONFIG, DB_SCHEMA, SEASON_CONFIG
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_state: Dict[str, Any] = {
+    'total_bytes': None,   # lazily computed on first write
+    'hits': 0,
+    'misses': 0,
+    'writes': 0,
+    'evictions': 0,
+    'bypass': False,
+}
+
+# Shorter frequencies win when an endpoint feeds columns of mixed cadence
+_FREQUENCY_RANK = {'daily': 0, 'annual': 1, None: 2}
+_endpoint_frequency: Optional[Dict[str, Optional[str]]] = None
+
+
+# ============================================================================
+# TTL POLICY
+# ============================================================================
+
+def _build_endpoint_frequencies() -> Dict[str, Optional[str]]:
+    """Map every endpoint to the shortest update_frequency of its columns."""
+    freqs: Dict[str, Optional[str]] = {}
+    for col_meta in DB_COLUMNS.values():
+        provider_sources = (col_meta.get('sources') or {}).get(DB_SCHEMA) or {}
+        freq = col_meta.get('update_frequency')
+        for source in provider_sources.values():
+            ep = source.get('endpoint') or source.get('pipeline', {}).get('endpoint')
+            if not ep:
+                continue
+            if ep not in freqs or _FREQUENCY_RANK[freq] < _FREQUENCY_RANK[freqs[ep]]:
+                freqs[ep] = freq
+    return freqs
+
+
+def response_ttl(endpoint: str, season: str) -> Optional[float]:
+    """Seconds a response for *endpoint* / *season* stays fresh.
+
+    Returns ``None`` when the entry should never expire.
+    """
+    global _endpoint_frequency
+    if season < SEASON_CONFIG['current_season']:
+        return CACHE_CONFIG['completed_season_ttl']
+
+    if _endpoint_frequency is None:
+        _endpoint_frequency = _build_endpoint_frequencies()
+    freq = _endpoint_frequency.get(endpoint)
+    if freq == 'daily':
+        return CACHE_CONFIG['ttl_daily']
+    if freq == 'annual':
+        return CACHE_CONFIG['ttl_annual']
+    return CACHE_CONFIG['ttl_default']
+
+
+# ============================================================================
+# KEYING
+# ============================================================================
+
+def cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Stable content hash of an endpoint name and its full parameter dict."""
+    payload = json.dumps(
+        {'endpoint': endpoint, 'params': params},
+        sort_keys=True, default=str, separators=(',', ':'),
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(CACHE_CONFIG['directory'], key[:2], f'{key}.json.gz')
+
+
+# ============================================================================
+# READ / WRITE
+# ============================================================================
+
+def _cache_active() -> bool:
+    return CACHE_CONFIG['enabled'] and not _state['bypass']
+
+
+def set_cache_bypass(bypass: bool) -> None:
+    """Skip the cache entirely (used by fixture record/replay modes)."""
+    with _lock:
+        _state['bypass'] = bypass
+
+
+def get_cached_response(endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
+    """Return the cached response for (endpoint, params), or ``None``.
+
+    Expired or unreadable entries are removed and count as misses.
+    """
+    if not _cache_active():
+        return None
+
+    path = _entry_path(cache_key(endpoint, params))
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as fh:
+            entry = json.load(fh)
+    except FileNotFoundError:
+        with _lock:
+            _state['misses'] += 1
+        return None
+    except (OSError, ValueError):
+        logger.warning('Discarding unreadable cache entry %s', path)
+        _remove_entry(path)
+        with _lock:
+            _state['misses'] += 1
+        return None
+
+    expires_at = entry.get('expires_at')
+    if expires_at is not None and expires_at <= time.time():
+        _remove_entry(path)
+        with _lock:
+            _state['misses'] += 1
+        return None
+
+    # Touch mtime so eviction sees this entry as recently used
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+    with _lock:
+        _state['hits'] += 1
+    return entry['response']
+
+
+def store_response(
+    endpoint: str,
+    params: Dict[str, Any],
+    response: Dict[str, Any],
+    ttl: Optional[float],
+) -> None:
+    """Write *response* to the cache and evict old entries if over the cap."""
+    if not _cache_active() or response is None:
+        return
+
+    key = cache_key(endpoint, params)
+    path = _entry_path(key)
+    now = time.time()
+    entry = {
+        'endpoint': endpoint,
+        'params': params,
+        'stored_at': now,
+        'expires_at': now + ttl if ttl is not None else None,
+        'response': response,
+    }
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as fh:
+            json.dump(entry, fh, default=str, separators=(',', ':'))
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp_path, path)
+        new_size = os.path.getsize(path)
+    except OSError as exc:
+        logger.warning('Could not write cache entry for %s: %s', endpoint, exc)
+        _remove_entry(tmp_path)
+        return
+
+    with _lock:
+        if _state['total_bytes'] is None:
+            _state['total_bytes'] = _scan_total_bytes()
+        else:
+            _state['total_bytes'] += new_size - old_size
+        _state['writes'] += 1
+        if _state['total_bytes'] > CACHE_CONFIG['max_bytes']:
+            _evict_locked()
+
+
+# ============================================================================
+# EVICTION
+# ============================================================================
+
+def _iter_entries():
+    """Yield (path, size, mtime) for every cache entry on disk."""
+    root = CACHE_CONFIG['directory']
+    if not os.path.isdir(root):
+        return
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if not name.endswith('.json.gz'):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            yield path, st.st_size, st.st_mtime
+
+
+def _scan_total_bytes() -> int:
+    return sum(size for _, size, _ in _iter_entries())
+
+
+def _evict_locked() -> None:
+    """Delete least recently used entries until under the target size.
+
+    Caller must hold ``_lock``.
+    """
+    target = CACHE_CONFIG['max_bytes'] * CACHE_CONFIG['evict_to_ratio']
+    entries = sorted(_iter_entries(), key=lambda e: e[2])
+    total = sum(size for _, size, _ in entries)
+    for path, size, _ in entries:
+        if total <= target:
+            break
+        if _remove_entry(path):
+            total -= size
+            _state['evictions'] += 1
+    _state['total_bytes'] = total
+
+
+def _remove_entry(path: str) -> bool:
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+def cache_stats() -> Dict[str, Any]:
+    """Snapshot of hit/miss/write/eviction counters for this process."""
+    with _lock:
+        return dict(_state)
+
+
+def log_cache_stats() -> None:
+    """Log a one-line cache summary (no-op when the cache is disabled)."""
+    if not _cache_active():
+        return
+    stats = cache_stats()
+    lookups = stats['hits'] + stats['misses']
+    hit_rate = (stats['hits'] / lookups * 100) if lookups else 0.0
+    logger.info(
+        'Response cache: %d hits, %d misses (%.1f%% hit rate), %d writes, %d evictions',
+        stats['hits'], stats['misses'], hit_rate, stats['writes'], stats['evictions'],
+    )
@@ -2,7 +2,7 @@
 The Glass - NBA API Client
 
 Wraps the nba_api library with browser header patching, dynamic endpoint
-loading, retry logic, and parameter building.  Abstracts NBA-specific
+loading, rate limiting, retry logic, and parameter building.  Abstracts NBA-specific
 HTTP concerns so the core pipeline never touches requests directly.
 
 No classes -- all functions operate on plain data.
@@ -10,17 +10,36 @@ No classes -- all functions operate on plain data.
 
 import importlib
 import inspect
+import json
 import logging
+import os
+import threading
 import time
-import warnings
-from typing import Any, Callable, Dict, Optional
-
-from src.etl.sources.nba_api.config import API_CONFIG, ENDPOINTS, RETRY_CONFIG
-
-warnings.filterwarnings(
-    "ignore",
-    message="Failed to return connection to pool",
-    module="urllib3",
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional
+
+from src.etl.sources.nba_api.archive import (
+    append_response,
+    archive_replay_active,
+    get_archived_response,
+    log_archive_stats,
+    set_archive_replay,
+)
+from src.etl.sources.nba_api.cache import (
+    cache_key,
+    get_cached_response,
+    log_cache_stats,
+    response_ttl,
+    set_cache_bypass,
+    store_response,
+)
+from src.etl.sources.nba_api.config import (
+    API_BUDGET,
+    API_CONFIG,
+    ENDPOINTS,
+    RATE_LIMITS,
+    RETRY_CONFIG,
+    THROTTLE_CONFIG,
 )
 
 logger = logging.getLogger(__name__)
@@ -32,7 +51,8 @@ logger = logging.getLogger(__name__)
 
 _NBA_STATS_HEADERS = {
     "Accept": "application/json, text/plain, */*",
-    "Accept-Encoding": "gzip, deflate, br",
+    # No "br": requests only decodes brotli when the optional package is present
+    "Accept-Encoding": "gzip, deflate",
     "Accept-Language": "en-US,en;q=0.9",
     "Cache-Control": "no-cache",
     "Connection": "keep-alive",
@@ -55,28 +75,102 @@ _NBA_STATS_HEADERS = {
 
 
 # ============================================================================
-# SESSION PATCHING
+# HTTP SESSION
 # ============================================================================
+# One pooled keep-alive session, owned by the client and installed on
+# nba_api's NBAStatsHTTP, is shared by every endpoint call.  The pool is
+# sized for the per-entity worker pool and blocks when exhausted, so
+# connections are reused instead of opened and discarded per request.
 
 _session_patched = False
+_session_lock = threading.Lock()
+_session_state: Dict[str, Any] = {'session': None, 'adapter': None}
+
+
+def _raise_for_throttle(response: Any, *args: Any, **kwargs: Any) -> None:
+    """requests response hook: surface 429/503 as HTTPError.
+
+    nba_api would otherwise fail later with an opaque JSON decode error,
+    hiding the throttle signal from the rate limiter.
+    """
+    if response.status_code in (429, 503):
+        response.raise_for_status()
+
+
+def _build_session() -> Any:
+    """Create the shared requests session with a sized connection pool."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    adapter = HTTPAdapter(
+        pool_connections=API_CONFIG['http_pool_connections'],
+        pool_maxsize=API_CONFIG['http_pool_maxsize'],
+        pool_block=True,
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(_NBA_STATS_HEADERS)
+    session.hooks['response'].append(_raise_for_throttle)
+    _session_state['session'] = session
+    _session_state['adapter'] = adapter
+    return session
 
 
 def _patch_nba_api_headers() -> None:
-    """Apply browser-like headers to the nba_api library (idempotent)."""
+    """Apply browser-like headers and the shared session to nba_api (idempotent).
+
+    Also points the library at ``API_CONFIG['base_url_override']`` when set
+    (e.g. the local stand-in server in stand_in.py).
+    """
     global _session_patched
     if _session_patched:
         return
-    try:
-        from nba_api.stats.library import http as _stats_http
-        from nba_api.library import http as _base_http
-
-        _stats_http.STATS_HEADERS = _NBA_STATS_HEADERS
-        _stats_http.NBAStatsHTTP.headers = _NBA_STATS_HEADERS
-        _stats_http.NBAStatsHTTP._session = None
-        _base_http.NBAHTTP._session = None
-        _session_patched = True
-    except ImportError:
-        logger.warning("nba_api not installed -- header patching skipped")
+    with _session_lock:
+        if _session_patched:
+            return
+        try:
+            from nba_api.stats.library import http as _stats_http
+
+            _stats_http.STATS_HEADERS = _NBA_STATS_HEADERS
+            _stats_http.NBAStatsHTTP.headers = _NBA_STATS_HEADERS
+
+            base_url = API_CONFIG['base_url_override']
+            if base_url:
+                _stats_http.NBAStatsHTTP.base_url = base_url.rstrip('/') + '/{endpoint}'
+                logger.info('NBA API base URL overridden: %s', base_url)
+
+            _stats_http.NBAStatsHTTP.set_session(_build_session())
+            _session_patched = True
+        except ImportError:
+            logger.warning("nba_api not installed -- header patching skipped")
+
+
+def session_stats() -> Dict[str, int]:
+    """Requests sent vs. connections opened on the shared session."""
+    stats = {'requests': 0, 'connections': 0}
+    adapter = _session_state['adapter']
+    if adapter is None:
+        return stats
+    pools = adapter.poolmanager.pools
+    for key in pools.keys():
+        pool = pools.get(key)
+        if pool is not None:
+            stats['requests'] += pool.num_requests
+            stats['connections'] += pool.num_connections
+    return stats
+
+
+def log_session_stats() -> None:
+    """Log how often requests reused an open connection."""
+    stats = session_stats()
+    if not stats['requests']:
+        return
+    reused = stats['requests'] - stats['connections']
+    logger.info(
+        'HTTP session: %d requests over %d connections (%.1f%% reused)',
+        stats['requests'], stats['connections'], reused / stats['requests'] * 100,
+    )
 
 
 # ============================================================================
@@ -139,103 +233,419 @@ def create_api_call(
     clean_params = {k: v for k, v in params.items() if not k.startswith('_')}
 
     # Filter to only params the endpoint actually accepts
-    sig = inspect.signature(endpoint_class.__init__)
-    accepted = set(sig.parameters.keys()) - {'self'}
-    has_kwargs = any(
-        p.kind == inspect.Parameter.VAR_KEYWORD
-        for p in sig.parameters.values()
-    )
-    if not has_kwargs:
+    accepted = _accepted_params(endpoint_class)
+    if accepted is not None:
         clean_params = {k: v for k, v in clean_params.items() if k in accepted}
 
     call_timeout = timeout or API_CONFIG['timeout_default']
+    fixture_name = endpoint_name or endpoint_class.__name__.lower()
 
     def _call() -> Dict[str, Any]:
-        result = endpoint_class(**clean_params, timeout=call_timeout)
-        return result.get_dict()
+        if _fixtures['mode'] == 'replay':
+            return _load_fixture(fixture_name, clean_params)
+        result = endpoint_class(**clean_params, timeout=call_timeout).get_dict()
+        if _fixtures['mode'] == 'record':
+            _save_fixture(fixture_name, clean_params, result)
+        return result
 
     return _call
 
 
+# ============================================================================
+# RECORD / REPLAY FIXTURES
+# ============================================================================
+# Record mode saves every response create_api_call receives under
+# <dir>/<endpoint>/<hash>.json; replay mode serves those files with no
+# network access and no rate limiting.  Both bypass the response cache so
+# every call reaches the fixture layer.
+
+_fixtures: Dict[str, Optional[str]] = {'mode': None, 'directory': None}
+
+
+def configure_fixtures(mode: Optional[str], directory: Optional[str]) -> None:
+    """Switch the client into ``'record'`` or ``'replay'`` mode (or back to live)."""
+    if mode not in (None, 'record', 'replay'):
+        raise ValueError(f"Unknown fixture mode: {mode!r}")
+    if mode and not directory:
+        raise ValueError(f"Fixture mode {mode!r} requires a directory")
+    if mode == 'replay' and not os.path.isdir(directory):
+        raise ValueError(f"Replay directory does not exist: {directory}")
+
+    _fixtures['mode'] = mode
+    _fixtures['directory'] = directory
+    set_cache_bypass(mode is not None)
+    set_rate_limiting(mode != 'replay')
+    if mode:
+        logger.info('NBA API fixtures: %s mode (%s)', mode, directory)
+
+
+def _fixture_path(endpoint_name: str, params: Dict[str, Any]) -> str:
+    return os.path.join(
+        _fixtures['directory'], endpoint_name,
+        f'{cache_key(endpoint_name, params)}.json',
+    )
+
+
+def _load_fixture(endpoint_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the recorded response for (endpoint, params).
+
+    Raises FileNotFoundError when nothing was recorded for the request.
+    """
+    path = _fixture_path(endpoint_name, params)
+    try:
+        with open(path, encoding='utf-8') as fh:
+            return json.load(fh)['response']
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"No recorded response for {endpoint_name} {params} ({path})"
+        ) from None
+
+
+def _save_fixture(
+    endpoint_name: str, params: Dict[str, Any], response: Dict[str, Any],
+) -> None:
+    path = _fixture_path(endpoint_name, params)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as fh:
+        json.dump(
+            {'endpoint': endpoint_name, 'params': params, 'response': response},
+            fh, default=str,
+        )
+    os.replace(tmp_path, path)
+
+
+# ============================================================================
+# RATE LIMITER
+# ============================================================================
+# One process-wide token bucket per endpoint class (RATE_LIMITS), plus one
+# API_BUDGET bucket that every request also takes a token from.  This is
+# the only place the client waits: steady-state pacing, retry back-off,
+# throttle penalties and per-entity batch cooldowns all go through
+# _acquire_token.  A shared throttle multiplier stretches every bucket's
+# interval when the API pushes back.
+
+_limiter_lock = threading.Lock()
+_limiter_enabled = True
+_buckets: Dict[str, Dict[str, float]] = {}
+_throttle = {'factor': 1.0, 'signals': 0}
+_throttle_stats: Dict[str, Dict[str, float]] = {}
+
+# _buckets key of the API_BUDGET bucket (never an execution tier)
+_API_BUDGET = '*'
+
+
+def _get_bucket(rate_class: str) -> Dict[str, float]:
+    """Return (creating on first use) the bucket state for *rate_class*."""
+    bucket = _buckets.get(rate_class)
+    if bucket is None:
+        if rate_class == _API_BUDGET:
+            limits = API_BUDGET
+        else:
+            limits = RATE_LIMITS.get(rate_class, RATE_LIMITS['league'])
+        bucket = {
+            'tokens': float(limits['burst']),
+            'updated': time.monotonic(),
+            'blocked_until': 0.0,
+            'interval': float(limits['interval']),
+            'burst': float(limits['burst']),
+            'batch_size': limits.get('batch_size', 0),
+            'batch_cooldown': float(limits.get('batch_cooldown', 0)),
+            'batch_count': 0,
+        }
+        _buckets[rate_class] = bucket
+    return bucket
+
+
+def _refill(bucket: Dict[str, float], now: float) -> float:
+    """Top *bucket* up to *now*; return seconds until it can give a token."""
+    interval = bucket['interval'] * _throttle['factor']
+    if interval > 0:
+        elapsed = now - bucket['updated']
+        bucket['tokens'] = min(
+            bucket['burst'], bucket['tokens'] + elapsed / interval,
+        )
+    else:
+        bucket['tokens'] = bucket['burst']
+    bucket['updated'] = now
+
+    wait = bucket['blocked_until'] - now
+    if wait <= 0 and bucket['tokens'] < 1:
+        wait = (1 - bucket['tokens']) * interval
+    return max(wait, 0.0)
+
+
+def _acquire_token(rate_class: str) -> None:
+    """Block until *rate_class* and the API budget have a token, then take both.
+
+    Every ``batch_size``-th token of a class with a batch budget blocks the
+    class for ``batch_cooldown`` seconds, whichever thread took it.  Time
+    spent waiting is accumulated in the throttle stats.
+    """
+    if not _limiter_enabled:
+        return
+    waited = 0.0
+    while True:
+        with _limiter_lock:
+            bucket = _get_bucket(rate_class)
+            budget = _get_bucket(_API_BUDGET)
+            now = time.monotonic()
+            wait = max(_refill(bucket, now), _refill(budget, now))
+            if wait <= 0:
+                bucket['tokens'] -= 1
+                budget['tokens'] -= 1
+                stats = _throttle_stats.setdefault(
+                    rate_class,
+                    {'requests': 0, 'throttled_seconds': 0.0, 'cooldowns': 0},
+                )
+                stats['requests'] += 1
+                stats['throttled_seconds'] += waited
+                if bucket['batch_size'] and bucket['batch_cooldown'] > 0:
+                    bucket['batch_count'] += 1
+                    if bucket['batch_count'] >= bucket['batch_size']:
+                        bucket['batch_count'] = 0
+                        bucket['blocked_until'] = max(
+                            bucket['blocked_until'], now + bucket['batch_cooldown'],
+                        )
+                        stats['cooldowns'] += 1
+                        logger.info(
+                            'Rate limiter [%s]: %d requests, cooling down %ss',
+                            rate_class, bucket['batch_size'], bucket['batch_cooldown'],
+                        )
+                return
+        time.sleep(wait)
+        waited += wait
+
+
+def set_rate_limiting(enabled: bool) -> None:
+    """Enable or disable all request pacing (disabled for fixture replay)."""
+    global _limiter_enabled
+    _limiter_enabled = enabled
+
+
+def _block_class(rate_class: str, seconds: float) -> None:
+    """Hold back the next request of *rate_class* for at least *seconds*."""
+    with _limiter_lock:
+        bucket = _get_bucket(rate_class)
+        bucket['blocked_until'] = max(
+            bucket['blocked_until'], time.monotonic() + seconds,
+        )
+
+
+def _record_success() -> None:
+    """Decay the throttle multiplier back toward 1 after a good response."""
+    with _limiter_lock:
+        if _throttle['factor'] > 1.0:
+            _throttle['factor'] = max(
+                1.0, _throttle['factor'] * THROTTLE_CONFIG['throttle_recovery'],
+            )
+
+
+def _record_throttle_signal() -> None:
+    """Slow every bucket down after a 429 / timeout from the API."""
+    with _limiter_lock:
+        _throttle['signals'] += 1
+        _throttle['factor'] = min(
+            THROTTLE_CONFIG['throttle_max_factor'],
+            _throttle['factor'] * THROTTLE_CONFIG['throttle_factor'],
+        )
+        # Drain banked burst so the slowdown takes effect immediately
+        for bucket in _buckets.values():
+            bucket['tokens'] = min(bucket['tokens'], 0.0)
+
+
+def _is_throttle_signal(exc: Exception) -> bool:
+    """True for errors that mean the API wants us to slow down."""
+    try:
+        import requests
+        if isinstance(exc, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+            return True
+        if isinstance(exc, requests.exceptions.HTTPError):
+            response = getattr(exc, 'response', None)
+            if response is not None and response.status_code in (429, 503):
+                return True
+    except ImportError:
+        pass
+    return isinstance(exc, TimeoutError) or '429' in str(exc)
+
+
+def rate_class_for_endpoint(endpoint_name: str) -> str:
+    """Endpoint class used for rate limiting (the endpoint's execution tier)."""
+    return ENDPOINTS.get(endpoint_name, {}).get('execution_tier', 'league')
+
+
+def rate_limiter_stats() -> Dict[str, Any]:
+    """Snapshot of per-class request counts and time spent throttled."""
+    with _limiter_lock:
+        return {
+            'throttle_factor': _throttle['factor'],
+            'throttle_signals': _throttle['signals'],
+            'classes': {k: dict(v) for k, v in _throttle_stats.items()},
+        }
+
+
+def log_rate_limiter_stats() -> None:
+    """Log how long each endpoint class spent waiting on the limiter."""
+    stats = rate_limiter_stats()
+    for rate_class, class_stats in sorted(stats['classes'].items()):
+        logger.info(
+            'Rate limiter [%s]: %d requests, %.1fs throttled, %d batch cooldowns',
+            rate_class, class_stats['requests'], class_stats['throttled_seconds'],
+            class_stats['cooldowns'],
+        )
+    if stats['throttle_signals']:
+        logger.info(
+            'Rate limiter: %d throttle signals, final back-off x%.2f',
+            stats['throttle_signals'], stats['throttle_factor'],
+        )
+
+
 # ============================================================================
 # RETRY WRAPPER
 # ============================================================================
 
-def with_retry(func: Callable, max_retries: Optional[int] = None) -> Any:
-    """Execute *func* with exponential back-off on failure.
+def with_retry(
+    func: Callable,
+    max_retries: Optional[int] = None,
+    rate_class: str = 'league',
+) -> Any:
+    """Execute *func* with back-off on failure, paced by the rate limiter.
 
-    Always applies the configured rate-limit delay before each attempt.
+    Every attempt first takes a token from *rate_class*'s bucket.  Failed
+    attempts block that class for a linear back-off; 429 / timeout errors
+    additionally raise the shared throttle multiplier.
     Returns the first successful result or re-raises the last exception.
     """
     retries = max_retries or RETRY_CONFIG['max_retries']
     backoff = RETRY_CONFIG['backoff_base']
 
     for attempt in range(1, retries + 1):
+        _acquire_token(rate_class)
         try:
-            time.sleep(API_CONFIG['rate_limit_delay'])
-            return func()
-        except Exception:
+            result = func()
+        except Exception as exc:
+            if _is_throttle_signal(exc):
+                _record_throttle_signal()
             if attempt >= retries:
                 raise
             wait = attempt * (backoff // API_CONFIG['backoff_divisor'])
             logger.warning(
                 'Attempt %d failed, retrying in %ds...', attempt, wait,
             )
-            time.sleep(wait)
+            _block_class(rate_class, wait)
+            continue
+        _record_success()
+        return result
 
     raise RuntimeError(f"with_retry exhausted {retries} attempts")
 
 
 # ============================================================================
-# PARAMETER BUILDER
+# CALL SPECS
 # ============================================================================
+# Every ENDPOINTS entry is compiled once into an immutable call spec: the
+# endpoint class, the constructor params it accepts, the static param
+# template and the season / season-type / entity slots.  A fetch then only
+# fills in those slots and the caller's overrides.
 
-def build_endpoint_params(
-    endpoint_name: str,
-    season: str,
-    season_type_name: str,
-    entity: str,
-    extra_params: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
-    """Assemble the full parameter dict for an NBA API call.
+_call_specs: Dict[str, Mapping[str, Any]] = {}
+_call_specs_lock = threading.Lock()
+_accepted_params_cache: Dict[Any, Optional[FrozenSet[str]]] = {}
 
-    Merges standard parameters (season, league_id, per_mode, season_type)
-    with endpoint-specific defaults and caller-supplied overrides.
-    """
-    ep_cfg = ENDPOINTS.get(endpoint_name, {})
 
-    # Season parameter — most endpoints use 'season' (str like "2025-26"),
-    # but some (e.g., draft combine) use 'season_year' (int like 2025).
-    season_param = ep_cfg.get('season_param', 'season')
-    if season_param == 'season_year':
-        params: Dict[str, Any] = {season_param: int(season.split('-')[0])}
-    else:
-        params: Dict[str, Any] = {season_param: season}
+def _accepted_params(endpoint_class: Any) -> Optional[FrozenSet[str]]:
+    """Constructor params of *endpoint_class*, or ``None`` if it takes **kwargs."""
+    if endpoint_class in _accepted_params_cache:
+        return _accepted_params_cache[endpoint_class]
 
-    # Season type
-    st_param = ep_cfg.get('season_type_param')
-    if st_param:
-        params[st_param] = season_type_name
+    sig = inspect.signature(endpoint_class.__init__)
+    has_kwargs = any(
+        p.kind == inspect.Parameter.VAR_KEYWORD
+        for p in sig.parameters.values()
+    )
+    accepted = None if has_kwargs else frozenset(sig.parameters) - {'self'}
+    _accepted_params_cache[endpoint_class] = accepted
+    return accepted
+
+
+def _compile_call_spec(endpoint_name: str) -> Mapping[str, Any]:
+    """Build the immutable call spec for one endpoint."""
+    ep_cfg = ENDPOINTS.get(endpoint_name, {})
+    virtual = bool(ep_cfg.get('virtual'))
+    endpoint_class = None if virtual else load_endpoint_class(endpoint_name)
+
+    template: Dict[str, Any] = {}
 
     # Per-mode
     pm_param = ep_cfg.get('per_mode_param')
     if pm_param and pm_param in API_CONFIG:
-        params[pm_param] = API_CONFIG[pm_param]
-
-    # Player / Team discriminator for shared endpoints
-    if (
-        'player' in ep_cfg.get('entity_types', [])
-        and 'team' in ep_cfg.get('entity_types', [])
-    ):
-        if entity == 'player':
-            params['player_or_team'] = 'Player'
-        else:
-            params['player_or_team'] = 'Team'
+        template[pm_param] = API_CONFIG[pm_param]
 
     # League ID — add both variants; signature filtering in create_api_call
     # will keep only the one the endpoint accepts.
-    params['league_id'] = API_CONFIG['league_id']
-    params['league_id_nullable'] = API_CONFIG['league_id']
+    template['league_id'] = API_CONFIG['league_id']
+    template['league_id_nullable'] = API_CONFIG['league_id']
+
+    entity_types = ep_cfg.get('entity_types', [])
+    return MappingProxyType({
+        'endpoint': endpoint_name,
+        'virtual': virtual,
+        'endpoint_class': endpoint_class,
+        'accepted': (
+            _accepted_params(endpoint_class) if endpoint_class is not None else None
+        ),
+        'template': MappingProxyType(template),
+        # Most endpoints use 'season' (str like "2025-26"), but some
+        # (e.g., draft combine) use 'season_year' (int like 2025).
+        'season_param': ep_cfg.get('season_param', 'season'),
+        'season_type_param': ep_cfg.get('season_type_param'),
+        # Player / Team discriminator for shared endpoints
+        'player_or_team': 'player' in entity_types and 'team' in entity_types,
+        'rate_class': ep_cfg.get('execution_tier', 'league'),
+    })
+
+
+def compile_call_specs() -> Dict[str, Mapping[str, Any]]:
+    """Compile a call spec for every ENDPOINTS entry (run once at startup)."""
+    with _call_specs_lock:
+        for endpoint_name in ENDPOINTS:
+            if endpoint_name not in _call_specs:
+                _call_specs[endpoint_name] = _compile_call_spec(endpoint_name)
+        logger.info('Compiled %d endpoint call specs', len(_call_specs))
+        return dict(_call_specs)
+
+
+def get_call_spec(endpoint_name: str) -> Mapping[str, Any]:
+    """Return the call spec for *endpoint_name*, compiling it on first use."""
+    spec = _call_specs.get(endpoint_name)
+    if spec is None:
+        with _call_specs_lock:
+            spec = _call_specs.get(endpoint_name)
+            if spec is None:
+                spec = _compile_call_spec(endpoint_name)
+                _call_specs[endpoint_name] = spec
+    return spec
+
+
+def fill_call_params(
+    spec: Mapping[str, Any],
+    season: str,
+    season_type_name: str,
+    entity: str,
+    extra_params: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Fill a call spec's slots to produce the full parameter dict."""
+    season_param = spec['season_param']
+    if season_param == 'season_year':
+        params: Dict[str, Any] = {season_param: int(season.split('-')[0])}
+    else:
+        params = {season_param: season}
+
+    if spec['season_type_param']:
+        params[spec['season_type_param']] = season_type_name
+    params.update(spec['template'])
+    if spec['player_or_team']:
+        params['player_or_team'] = 'Player' if entity == 'player' else 'Team'
 
     # Caller overrides win
     if extra_params:
@@ -244,6 +654,23 @@ def build_endpoint_params(
     return params
 
 
+def build_endpoint_params(
+    endpoint_name: str,
+    season: str,
+    season_type_name: str,
+    entity: str,
+    extra_params: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Assemble the full parameter dict for an NBA API call.
+
+    Merges standard parameters (season, league_id, per_mode, season_type)
+    with endpoint-specific defaults and caller-supplied overrides.
+    """
+    return fill_call_params(
+        get_call_spec(endpoint_name), season, season_type_name, entity, extra_params,
+    )
+
+
 # ============================================================================
 # FETCHER FACTORY
 # ============================================================================
@@ -252,25 +679,64 @@ def make_fetcher(season: str, season_type_name: str, entity: str) -> Callable:
     """Create an api_fetcher closure for the given season, season type, and entity.
 
     Returns a function that accepts (endpoint, extra_params) and executes
-    a fully parameterized NBA API call with retry logic.
+    a fully parameterized NBA API call with retry logic.  Responses are
+    served from / written to the on-disk response cache (see cache.py), and
+    live responses are appended to the raw archive (see archive.py).  In
+    re-derive mode every response comes from the archive instead.
     Virtual endpoints (e.g. team_metadata) are routed to dedicated handlers.
     """
     def fetch(endpoint: str, extra_params: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
-        ep_cfg = ENDPOINTS.get(endpoint, {})
-        if ep_cfg.get('virtual'):
+        spec = get_call_spec(endpoint)
+        if spec['virtual']:
+            if archive_replay_active():
+                logger.debug('Virtual endpoint %s is not archived, skipping', endpoint)
+                return None
             return _fetch_virtual(endpoint, season)
 
-        EndpointClass = load_endpoint_class(endpoint)
-        if EndpointClass is None:
+        if spec['endpoint_class'] is None:
             return None
-        full_params = build_endpoint_params(
-            endpoint, season, season_type_name, entity, extra_params or {},
+        full_params = fill_call_params(
+            spec, season, season_type_name, entity, extra_params,
         )
-        api_call = create_api_call(EndpointClass, full_params, endpoint_name=endpoint)
-        return with_retry(api_call)
+        if archive_replay_active():
+            return get_archived_response(endpoint, season, full_params)
+
+        cached = get_cached_response(endpoint, full_params)
+        if cached is not None:
+            return cached
+
+        api_call = create_api_call(
+            spec['endpoint_class'], full_params, endpoint_name=endpoint,
+        )
+        result = with_retry(api_call, rate_class=spec['rate_class'])
+        if _fixtures['mode'] != 'replay':
+            append_response(endpoint, season, full_params, result)
+        store_response(endpoint, full_params, result, response_ttl(endpoint, season))
+        return result
     return fetch
 
 
+def configure_archive_replay(enabled: bool) -> None:
+    """Serve every fetch from the raw response archive (``--phase rederive``).
+
+    Bypasses the response cache and disables rate limiting, since no
+    request reaches the network.
+    """
+    set_archive_replay(enabled)
+    set_cache_bypass(enabled)
+    set_rate_limiting(not enabled)
+    if enabled:
+        logger.info('NBA API: re-deriving from response archive')
+
+
+def log_run_stats() -> None:
+    """Log client-side metrics accumulated during this process."""
+    log_cache_stats()
+    log_archive_stats()
+    log_rate_limiter_stats()
+    log_session_stats()
+
+
 # ============================================================================
 # VIRTUAL ENDPOINT HANDLERS
 # ============================================================================
@@ -64,6 +64,16 @@ API_CONFIG = {
 
     'roster_batch_size': 175,
     'roster_batch_cooldown': 120,
+    'per_entity_workers': 4,
+    'per_entity_burst_interval': 1.0,
+
+    # Shared HTTP session: hosts kept in the pool manager, and connections
+    # per host (>= per_entity_workers so workers never wait on a socket)
+    'http_pool_connections': 2,
+    'http_pool_maxsize': 8,
+
+    # e.g. http://127.0.0.1:8765/stats for the local stand-in server
+    'base_url_override': os.getenv('NBA_API_BASE_URL'),
 
     'league_id': '00',
     'per_mode_simple': 'Totals',
@@ -80,6 +90,93 @@ RETRY_CONFIG = {
     'backoff_base': 30,
 }
 
+# Token-bucket budgets per endpoint class (the endpoint's execution_tier).
+# interval = steady-state seconds per request, burst = bucket capacity.
+# Per-entity classes run in bursts of batch_size requests, after which the
+# limiter blocks the whole class for batch_cooldown seconds -- shared by
+# every thread and unit.  Within a burst a bucket allows burst + 10/interval
+# requests per 10 s; 1 + 10/1.0 = 11 keeps a class under the throttle
+# threshold modelled by STAND_IN_CONFIG (burst_limit per burst_window_seconds).
+# per_entity_workers only overlaps response latency; it does not add rate.
+RATE_LIMITS = {
+    'league':    {'interval': API_CONFIG['rate_limit_delay'], 'burst': 3},
+    'team_call': {'interval': API_CONFIG['rate_limit_delay'], 'burst': 3},
+    'team': {
+        'interval': API_CONFIG['per_entity_burst_interval'],
+        'burst': 1,
+        'batch_size': API_CONFIG['roster_batch_size'],
+        'batch_cooldown': API_CONFIG['roster_batch_cooldown'],
+    },
+    'player': {
+        'interval': API_CONFIG['per_entity_burst_interval'],
+        'burst': 1,
+        'batch_size': API_CONFIG['roster_batch_size'],
+        'batch_cooldown': API_CONFIG['roster_batch_cooldown'],
+    },
+}
+
+# Process-wide budget every request also draws from, whatever its class, so
+# concurrent units cannot add their class budgets together.  The throttle
+# threshold in STAND_IN_CONFIG counts all requests, so this stays under it too.
+API_BUDGET = {'interval': 1.0, 'burst': 1}
+
+# Adaptive back-off applied to every bucket when the API signals throttling
+# (HTTP 429, timeouts, dropped connections).  Each signal multiplies request
+# intervals by throttle_factor up to throttle_max_factor; each success decays
+# the multiplier by throttle_recovery back toward 1.
+THROTTLE_CONFIG = {
+    'throttle_factor': 2.0,
+    'throttle_max_factor': 8.0,
+    'throttle_recovery': 0.9,
+}
+
+# Local stand-in for stats.nba.com (stand_in.py).  Latency is log-normal
+# around latency_median_ms; requests beyond burst_limit within
+# burst_window_seconds are answered with 429s, hangs (client timeouts) or
+# connection resets in the given proportions.  Baseline fault rates apply
+# to every request.
+STAND_IN_CONFIG = {
+    'host': '127.0.0.1',
+    'port': 8765,
+    'latency_median_ms': 250,
+    'latency_sigma': 0.5,
+    'burst_window_seconds': 10.0,
+    'burst_limit': 12,
+    'burst_429_share': 0.6,
+    'burst_timeout_share': 0.25,
+    'burst_reset_share': 0.15,
+    'hang_seconds': 45.0,
+    'base_reset_rate': 0.005,
+    'base_error_rate': 0.005,
+    'synthetic_players': 450,
+    'synthetic_teams': 30,
+}
+
+# On-disk response cache.  TTLs are chosen per endpoint from the shortest
+# update_frequency of the DB_COLUMNS it feeds; completed seasons use
+# completed_season_ttl (None = never expires).
+CACHE_CONFIG = {
+    'enabled': os.getenv('NBA_API_CACHE', '1') != '0',
+    'directory': os.getenv('NBA_API_CACHE_DIR', '.cache/nba_api'),
+    'max_bytes': 2 * 1024 ** 3,
+    'evict_to_ratio': 0.9,
+    'ttl_daily': 20 * 3600,
+    'ttl_annual': 30 * 86400,
+    'ttl_default': 7 * 86400,
+    'completed_season_ttl': None,
+}
+
+# Raw response archive (bronze layer).  Every live response is appended to
+# <directory>/<season>/<endpoint>.ndjson.gz; `--phase rederive` rebuilds the
+# stats tables from it without calling the API.
+ARCHIVE_CONFIG = {
+    'enabled': os.getenv('NBA_API_ARCHIVE', '1') != '0',
+    'directory': os.getenv('NBA_API_ARCHIVE_DIR', 'archive/nba_api'),
+    # Decompressed (season, endpoint) files kept in memory during re-derive,
+    # least recently used dropped first; concurrent units span several seasons
+    'index_cache_size': 32,
+}
+
 
 # ============================================================================
 # ENDPOINT DEFINITIONS
@@ -300,6 +397,12 @@ def validate_provider_config() -> list:
     errors.extend(validate_flat_config(SEASON_CONFIG, SEASON_CONFIG_SCHEMA, 'SEASON_CONFIG'))
     errors.extend(validate_flat_config(API_CONFIG, API_CONFIG_SCHEMA, 'API_CONFIG'))
     errors.extend(validate_flat_config(RETRY_CONFIG, RETRY_CONFIG_SCHEMA, 'RETRY_CONFIG'))
+    errors.extend(validate_dict_config(RATE_LIMITS, RATE_LIMITS_SCHEMA, 'RATE_LIMITS'))
+    errors.extend(validate_flat_config(API_BUDGET, RATE_LIMITS_SCHEMA, 'API_BUDGET'))
+    errors.extend(validate_flat_config(THROTTLE_CONFIG, THROTTLE_CONFIG_SCHEMA, 'THROTTLE_CONFIG'))
+    errors.extend(validate_flat_config(STAND_IN_CONFIG, STAND_IN_CONFIG_SCHEMA, 'STAND_IN_CONFIG'))
+    errors.extend(validate_flat_config(CACHE_CONFIG, CACHE_CONFIG_SCHEMA, 'CACHE_CONFIG'))
+    errors.extend(validate_flat_config(ARCHIVE_CONFIG, ARCHIVE_CONFIG_SCHEMA, 'ARCHIVE_CONFIG'))
     errors.extend(validate_dict_config(SEASON_TYPES, SEASON_TYPES_SCHEMA, 'SEASON_TYPES'))
     errors.extend(validate_dict_config(ENDPOINTS, ENDPOINTS_SCHEMA, 'ENDPOINTS'))
     
@@ -337,6 +440,11 @@ API_CONFIG_SCHEMA = {
     'max_consecutive_failures': {'required': True, 'types': (int,)},
     'roster_batch_size': {'required': True, 'types': (int,)},
     'roster_batch_cooldown': {'required': True, 'types': (int, float)},
+    'per_entity_workers': {'required': True, 'types': (int,)},
+    'per_entity_burst_interval': {'required': True, 'types': (int, float)},
+    'http_pool_connections': {'required': True, 'types': (int,)},
+    'http_pool_maxsize': {'required': True, 'types': (int,)},
+    'base_url_override': {'required': True, 'types': (str, type(None))},
     'league_id': {'required': True, 'types': (str,)},
     'per_mode_simple': {'required': True, 'types': (str,)},
     'per_mode_time': {'required': True, 'types': (str,)},
@@ -352,6 +460,53 @@ RETRY_CONFIG_SCHEMA = {
     'backoff_base': {'required': True, 'types': (int, float)},
 }
 
+RATE_LIMITS_SCHEMA = {
+    'interval': {'required': True, 'types': (int, float)},
+    'burst': {'required': True, 'types': (int,)},
+    'batch_size': {'required': False, 'types': (int,)},
+    'batch_cooldown': {'required': False, 'types': (int, float)},
+}
+
+THROTTLE_CONFIG_SCHEMA = {
+    'throttle_factor': {'required': True, 'types': (int, float)},
+    'throttle_max_factor': {'required': True, 'types': (int, float)},
+    'throttle_recovery': {'required': True, 'types': (int, float)},
+}
+
+STAND_IN_CONFIG_SCHEMA = {
+    'host': {'required': True, 'types': (str,)},
+    'port': {'required': True, 'types': (int,)},
+    'latency_median_ms': {'required': True, 'types': (int, float)},
+    'latency_sigma': {'required': True, 'types': (int, float)},
+    'burst_window_seconds': {'required': True, 'types': (int, float)},
+    'burst_limit': {'required': True, 'types': (int,)},
+    'burst_429_share': {'required': True, 'types': (int, float)},
+    'burst_timeout_share': {'required': True, 'types': (int, float)},
+    'burst_reset_share': {'required': True, 'types': (int, float)},
+    'hang_seconds': {'required': True, 'types': (int, float)},
+    'base_reset_rate': {'required': True, 'types': (int, float)},
+    'base_error_rate': {'required': True, 'types': (int, float)},
+    'synthetic_players': {'required': True, 'types': (int,)},
+    'synthetic_teams': {'required': True, 'types': (int,)},
+}
+
+CACHE_CONFIG_SCHEMA = {
+    'enabled': {'required': True, 'types': (bool,)},
+    'directory': {'required': True, 'types': (str,)},
+    'max_bytes': {'required': True, 'types': (int,)},
+    'evict_to_ratio': {'required': True, 'types': (int, float)},
+    'ttl_daily': {'required': True, 'types': (int, float)},
+    'ttl_annual': {'required': True, 'types': (int, float)},
+    'ttl_default': {'required': True, 'types': (int, float)},
+    'completed_season_ttl': {'required': True, 'types': (int, float, type(None))},
+}
+
+ARCHIVE_CONFIG_SCHEMA = {
+    'enabled': {'required': True, 'types': (bool,)},
+    'directory': {'required': True, 'types': (str,)},
+    'index_cache_size': {'required': True, 'types': (int,)},
+}
+
 ENDPOINTS_SCHEMA = {
     'min_season': {'required': True, 'types': (str, type(None))},
     'execution_tier': {'required': True, 'types': (str,), 'allowed_values': VALID_EXECUTION_TIERS},
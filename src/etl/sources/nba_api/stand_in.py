@@ -0,0 +1,396 @@
+"""
+The Glass - Local stats.nba.com Stand-In
+
+A throttling-aware local HTTP server that answers ``/stats/<endpoint>``
+requests with ``resultSets`` payloads, so retry/back-off (RETRY_CONFIG,
+THROTTLE_CONFIG) and concurrency settings can be tuned without touching
+production.
+
+Payloads come from a record-mode fixture directory (see ``--record`` on
+the ETL runner) when a matching response exists, otherwise a synthetic
+payload is generated from the DB_COLUMNS source mappings for the endpoint.
+Behaviour follows STAND_IN_CONFIG: log-normal latency, baseline resets and
+5xx errors, and 429s / hangs / connection resets once a burst threshold is
+exceeded.
+
+Usage:
+    python -m src.etl.sources.nba_api.stand_in --fixtures fixtures/
+    NBA_API_BASE_URL=http://127.0.0.1:8765/stats NBA_API_CACHE=0 \\
+        python -m src.etl.runner --source nba_api --phase backfill
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import socket
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from src.etl.definitions import DB_COLUMNS
+from src.etl.sources.nba_api.config import DB_SCHEMA, ENDPOINTS, STAND_IN_CONFIG
+
+logger = logging.getLogger(__name__)
+
+_PLAYER_ID_BASE = 1630000
+_TEAM_ID_BASE = 1610612737
+
+_state: Dict[str, Any] = {
+    'lock': threading.Lock(),
+    'recent': deque(),
+    'outcomes': {},
+    'fixtures': {},
+    'config': dict(STAND_IN_CONFIG),
+}
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def _query_pairs(endpoint: str, params: Dict[str, Any]) -> Optional[FrozenSet[Tuple[str, str]]]:
+    """The ``(key, value)`` query pairs nba_api sends for recorded *params*.
+
+    Recorded params are the client's endpoint-constructor kwargs; the
+    endpoint class maps them to query keys and fills in its defaults.
+    Returns ``None`` when *endpoint* has no nba_api class.
+    """
+    from src.etl.sources.nba_api.client import load_endpoint_class
+
+    cls = load_endpoint_class(endpoint)
+    if cls is None:
+        return None
+    parameters = cls(**params, get_request=False).parameters
+    return frozenset((k, str(v)) for k, v in parameters.items() if v is not None)
+
+
+def load_fixtures(directory: str) -> Dict[str, List[Tuple[FrozenSet[Tuple[str, str]], Dict[str, Any]]]]:
+    """Index record-mode fixture files by endpoint.
+
+    Each entry is ``(query_pairs, response)``; a request matches a fixture
+    when every recorded ``(key, value)`` pair appears in its query string.
+    """
+    index: Dict[str, List[Tuple[FrozenSet[Tuple[str, str]], Dict[str, Any]]]] = {}
+    skipped = 0
+    for dirpath, _, filenames in os.walk(directory):
+        for name in filenames:
+            if not name.endswith('.json'):
+                continue
+            with open(os.path.join(dirpath, name), encoding='utf-8') as fh:
+                entry = json.load(fh)
+            endpoint = entry['endpoint'].lower()
+            pairs = _query_pairs(endpoint, entry['params'])
+            if pairs is None:
+                skipped += 1
+                continue
+            index.setdefault(endpoint, []).append((pairs, entry['response']))
+    logger.info(
+        'Loaded %d fixtures for %d endpoints (%d without an nba_api endpoint skipped)',
+        sum(len(v) for v in index.values()), len(index), skipped,
+    )
+    return index
+
+
+def _match_fixture(endpoint: str, query: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """Return the most specific recorded response matching the query."""
+    query_pairs = set(query.items())
+    best, best_size = None, -1
+    for pairs, response in _state['fixtures'].get(endpoint, []):
+        if pairs <= query_pairs and len(pairs) > best_size:
+            best, best_size = response, len(pairs)
+    return best
+
+
+# ============================================================================
+# SYNTHETIC PAYLOADS
+# ============================================================================
+
+def _endpoint_layout(endpoint: str) -> Dict[str, Dict[str, Any]]:
+    """Derive result sets, headers and filter values for *endpoint*.
+
+    Returns ``{result_set: {'entity': str, 'fields': set, 'filters': {field: set}}}``
+    built from every DB_COLUMNS source that reads the endpoint.
+    """
+    default_rs = ENDPOINTS.get(endpoint, {}).get('default_result_set', endpoint)
+    layout: Dict[str, Dict[str, Any]] = {}
+
+    def _slot(rs: Optional[str], entity: str) -> Dict[str, Any]:
+        return layout.setdefault(
+            rs or default_rs, {'entity': entity, 'fields': set(), 'filters': {}},
+        )
+
+    for col_meta in DB_COLUMNS.values():
+        provider_sources = (col_meta.get('sources') or {}).get(DB_SCHEMA) or {}
+        for entity, source in provider_sources.items():
+            pipeline = source.get('pipeline') or {}
+            if source.get('endpoint') == endpoint:
+                slot = _slot(source.get('result_set'), entity)
+                slot['fields'].add(source['field'])
+                if source.get('derived', {}).get('subtract'):
+                    slot['fields'].add(source['derived']['subtract'])
+                if source.get('player_id_field'):
+                    slot['fields'].add(source['player_id_field'])
+                    slot['fields'].add(source.get('minutes_field', 'MIN'))
+            elif pipeline.get('endpoint') == endpoint:
+                for op in pipeline.get('operations', []):
+                    slot = _slot(op.get('result_set'), entity)
+                    if op.get('field'):
+                        slot['fields'].add(op['field'])
+                    slot['fields'].update((op.get('fields') or {}).values())
+                    if op.get('filter_field'):
+                        slot['filters'].setdefault(op['filter_field'], set()).update(
+                            op.get('filter_values') or [],
+                        )
+    return layout
+
+
+def _expected_result_sets(endpoint: str) -> Dict[str, List[str]]:
+    """Result set names and headers the nba_api endpoint class expects.
+
+    nba_api indexes these by name while loading a response, so a synthetic
+    payload must contain every one of them.
+    """
+    from src.etl.sources.nba_api.client import load_endpoint_class
+
+    cls = load_endpoint_class(endpoint)
+    return dict(getattr(cls, 'expected_data', None) or {})
+
+
+def _synthetic_response(endpoint: str, query: Dict[str, str]) -> Dict[str, Any]:
+    """Build a plausible ``resultSets`` payload for an unrecorded request."""
+    cfg = _state['config']
+    seed = zlib.crc32(json.dumps([endpoint, sorted(query.items())]).encode())
+    rng = random.Random(seed)
+    wants_team = query.get('PlayerOrTeam', '').lower() == 'team'
+    player_id = int(query.get('PlayerID') or 0)
+    team_id = int(query.get('TeamID') or 0)
+
+    layout = _endpoint_layout(endpoint)
+    expected = _expected_result_sets(endpoint)
+
+    result_sets = []
+    for rs_name in dict.fromkeys(list(expected) + list(layout)):
+        slot = layout.get(rs_name)
+        base_headers = list(expected.get(rs_name, []))
+        if slot is None:
+            result_sets.append({'name': rs_name, 'headers': base_headers, 'rowSet': []})
+            continue
+
+        entity = 'team' if wants_team else slot['entity']
+        if entity == 'team':
+            ids = [team_id] if team_id else [
+                _TEAM_ID_BASE + i for i in range(cfg['synthetic_teams'])
+            ]
+            id_headers = ['TEAM_ID', 'TEAM_NAME']
+        else:
+            if player_id:
+                ids = [player_id]
+            elif team_id:
+                ids = rng.sample(
+                    [_PLAYER_ID_BASE + i for i in range(cfg['synthetic_players'])], 15,
+                )
+            else:
+                ids = [_PLAYER_ID_BASE + i for i in range(cfg['synthetic_players'])]
+            id_headers = ['PLAYER_ID', 'PERSON_ID', 'PLAYER_NAME', 'TEAM_ID']
+
+        filter_fields = sorted(slot['filters'])
+        own_headers = id_headers + filter_fields + sorted(slot['fields'])
+        headers = base_headers + [h for h in own_headers if h not in base_headers]
+
+        # One row per entity per combination of filter values
+        combos: List[Dict[str, Any]] = [{}]
+        for ff in filter_fields:
+            combos = [
+                {**c, ff: v} for c in combos for v in sorted(slot['filters'][ff])
+            ]
+
+        rows = []
+        for eid in ids:
+            if entity == 'team':
+                ident = {'TEAM_ID': eid, 'TEAM_NAME': f'Team {eid}'}
+            else:
+                ident = {
+                    'PLAYER_ID': eid, 'PERSON_ID': eid,
+                    'PLAYER_NAME': f'Player {eid}',
+                    'TEAM_ID': team_id or _TEAM_ID_BASE + eid % 30,
+                }
+            for combo in combos:
+                row = []
+                for h in headers:
+                    if h in ident:
+                        row.append(ident[h])
+                    elif h in combo:
+                        row.append(combo[h])
+                    elif h.endswith('PLAYER_ID'):
+                        row.append(eid)
+                    else:
+                        row.append(round(rng.uniform(0, 500), 1))
+                rows.append(row)
+
+        result_sets.append({'name': rs_name, 'headers': headers, 'rowSet': rows})
+
+    return {'resource': endpoint, 'parameters': query, 'resultSets': result_sets}
+
+
+# ============================================================================
+# FAULT MODEL
+# ============================================================================
+
+def _choose_outcome(rng: random.Random) -> str:
+    """Decide how to answer the next request: ok, 429, hang, reset or error."""
+    cfg = _state['config']
+    now = time.monotonic()
+    with _state['lock']:
+        recent = _state['recent']
+        recent.append(now)
+        while recent and recent[0] < now - cfg['burst_window_seconds']:
+            recent.popleft()
+        in_burst = len(recent) > cfg['burst_limit']
+
+    roll = rng.random()
+    if in_burst:
+        if roll < cfg['burst_429_share']:
+            return '429'
+        if roll < cfg['burst_429_share'] + cfg['burst_timeout_share']:
+            return 'hang'
+        return 'reset'
+    if roll < cfg['base_reset_rate']:
+        return 'reset'
+    if roll < cfg['base_reset_rate'] + cfg['base_error_rate']:
+        return 'error'
+    return 'ok'
+
+
+def _latency_seconds(rng: random.Random) -> float:
+    cfg = _state['config']
+    mu = math.log(max(cfg['latency_median_ms'], 1) / 1000.0)
+    return rng.lognormvariate(mu, cfg['latency_sigma'])
+
+
+# ============================================================================
+# HTTP HANDLER
+# ============================================================================
+
+class _StatsHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def handle(self) -> None:
+        # Resets and client-side timeouts are expected here, not errors
+        try:
+            super().handle()
+        except (ConnectionError, OSError, ValueError):
+            self.close_connection = True
+
+    def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+        parsed = urlparse(self.path)
+        endpoint = parsed.path.rstrip('/').rsplit('/', 1)[-1].lower()
+        query = {k: v[0] for k, v in parse_qs(parsed.query, keep_blank_values=True).items()}
+
+        rng = random.Random()
+        outcome = _choose_outcome(rng)
+        with _state['lock']:
+            _state['outcomes'][outcome] = _state['outcomes'].get(outcome, 0) + 1
+
+        if outcome == 'reset':
+            # SO_LINGER 0 makes close() send RST instead of FIN
+            self.connection.setsockopt(
+                socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0),
+            )
+            self.close_connection = True
+            self.connection.close()
+            return
+        if outcome == 'hang':
+            time.sleep(_state['config']['hang_seconds'])
+        else:
+            time.sleep(_latency_seconds(rng))
+
+        if outcome == '429':
+            self._send(429, b'Too Many Requests', 'text/plain')
+            return
+        if outcome == 'error':
+            self._send(500, b'{"Message":"An error has occurred."}', 'application/json')
+            return
+
+        payload = _match_fixture(endpoint, query) or _synthetic_response(endpoint, query)
+        self._send(200, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client gave up (e.g. its timeout fired during a hang)
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug('%s - %s', self.address_string(), format % args)
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def serve(fixtures_dir: Optional[str] = None, **overrides: Any) -> None:
+    """Run the stand-in server until interrupted."""
+    _state['config'].update({k: v for k, v in overrides.items() if v is not None})
+    if fixtures_dir:
+        _state['fixtures'] = load_fixtures(fixtures_dir)
+
+    cfg = _state['config']
+    server = ThreadingHTTPServer((cfg['host'], cfg['port']), _StatsHandler)
+    server.daemon_threads = True
+    logger.info(
+        'stats.nba.com stand-in listening on http://%s:%d/stats',
+        cfg['host'], cfg['port'],
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info('Stand-in outcomes: %s', _state['outcomes'])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Local stand-in for stats.nba.com')
+    parser.add_argument('--fixtures', type=str, default=None, metavar='DIR',
+                        help='Record-mode fixture directory to serve responses from')
+    parser.add_argument('--host', type=str, default=None)
+    parser.add_argument('--port', type=int, default=None)
+    parser.add_argument('--latency-ms', type=float, default=None,
+                        help='Median response latency in milliseconds')
+    parser.add_argument('--burst-limit', type=int, default=None,
+                        help='Requests per burst window before throttling kicks in')
+    parser.add_argument('--hang-seconds', type=float, default=None,
+                        help='How long throttled "timeout" responses hang')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+    )
+    serve(
+        args.fixtures,
+        host=args.host,
+        port=args.port,
+        latency_median_ms=args.latency_ms,
+        burst_limit=args.burst_limit,
+        hang_seconds=args.hang_seconds,
+    )
+
+
+if __name__ == '__main__':
+    main()
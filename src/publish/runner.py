@@ -18,6 +18,7 @@ load_dotenv()
 from src.publish.definitions.config import (
     STAT_RATES, DEFAULT_STAT_RATE
 )
+from src.core.db import log_pool_stats
 from src.publish.core.executor import sync_league
 
 logging.basicConfig(
@@ -75,6 +76,7 @@ def main():
     historical_config = {'mode': 'seasons', 'value': num_seasons}
 
     sync_league(league, rate, show_advanced, historical_config, data_only, sync_section, priority_tab)
+    log_pool_stats()
 
     if args.sync:
         import subprocess
@@ -0,0 +1,100 @@
+"""Re-derive reads of the raw response archive under concurrent units."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.etl.sources.nba_api import archive
+
+SEASONS = ['2021-22', '2022-23', '2023-24']
+ENDPOINT = 'playerdashptreb'
+
+
+@pytest.fixture
+def archived(tmp_path, monkeypatch):
+    monkeypatch.setitem(archive.ARCHIVE_CONFIG, 'directory', str(tmp_path))
+    monkeypatch.setitem(archive.ARCHIVE_CONFIG, 'enabled', True)
+    archive.set_archive_replay(False)
+    for season in SEASONS:
+        for player_id in range(3):
+            archive.append_response(
+                ENDPOINT, season, {'player_id': player_id, 'season': season},
+                {'season': season, 'player_id': player_id},
+            )
+    archive.set_archive_replay(True)
+
+    # loads: files read so far; barrier: when set, holds each load open
+    # until that many loads are in flight together
+    state = SimpleNamespace(loads=[], barrier=None)
+    load_index = archive._load_index
+
+    def counting_load(season, endpoint):
+        state.loads.append((season, endpoint))
+        if state.barrier is not None:
+            state.barrier.wait()
+        return load_index(season, endpoint)
+
+    monkeypatch.setattr(archive, '_load_index', counting_load)
+    yield state
+    archive.set_archive_replay(False)
+
+
+def _read(season, player_id):
+    return archive.get_archived_response(
+        ENDPOINT, season, {'player_id': player_id, 'season': season},
+    )
+
+
+def test_concurrent_seasons_load_each_file_once(archived):
+    results = {}
+    errors = []
+    archived.barrier = threading.Barrier(len(SEASONS), timeout=10)
+
+    def unit(season, player_id):
+        try:
+            results[(season, player_id)] = _read(season, player_id)
+        except threading.BrokenBarrierError as exc:
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=unit, args=(season, player_id))
+        for season in SEASONS for player_id in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # A load serialized behind a global lock would break the barrier
+    assert errors == []
+    assert sorted(archived.loads) == [(season, ENDPOINT) for season in SEASONS]
+    archived.barrier = None
+    for (season, player_id), response in results.items():
+        assert response == {'season': season, 'player_id': player_id}
+
+    # Interleaving seasons again reuses every loaded index
+    for season in SEASONS:
+        _read(season, 0)
+    assert len(archived.loads) == len(SEASONS)
+
+
+def test_index_cache_evicts_least_recently_used(archived, monkeypatch):
+    monkeypatch.setitem(archive.ARCHIVE_CONFIG, 'index_cache_size', 2)
+
+    _read(SEASONS[0], 0)
+    _read(SEASONS[1], 0)
+    _read(SEASONS[0], 1)
+    _read(SEASONS[2], 0)
+    _read(SEASONS[0], 2)
+    assert archived.loads == [(s, ENDPOINT) for s in SEASONS]
+
+    _read(SEASONS[1], 1)
+    assert archived.loads[-1] == (SEASONS[1], ENDPOINT)
+
+
+def test_missing_file_counts_as_miss(archived):
+    before = archive.archive_stats()['replay_misses']
+
+    assert archive.get_archived_response(ENDPOINT, '1999-00', {'player_id': 1}) is None
+    assert archive.archive_stats()['replay_misses'] == before + 1
@@ -0,0 +1,166 @@
+"""Write-path domain rules and the CASE cleanup match the per-domain UPDATEs."""
+
+import contextlib
+import itertools
+import sqlite3
+
+import pytest
+
+from src.etl.core import cleanup
+from src.etl.core.batch import RowBatch
+
+# {minutes_col: [stat cols]} for two non-primary domains
+DOMAINS = {'min_a': ['a1', 'a2'], 'min_b': ['b1']}
+COLUMNS = ['min_a', 'a1', 'a2', 'min_b', 'b1']
+SEASON, SEASON_TYPE = '2023-24', 'rs'
+
+MINUTES = [None, 0, -3, 0.5, 12]
+STATS = [None, 0, 7]
+
+
+def _rows():
+    """Every minutes x stats combination for both domains, plus another season."""
+    rows = []
+    combos = itertools.product(MINUTES, STATS, STATS, MINUTES, STATS)
+    for entity_id, values in enumerate(combos):
+        rows.append((entity_id, SEASON, SEASON_TYPE, *values))
+    rows.append((len(rows), '2022-23', SEASON_TYPE, 0, 5, 5, None, 5))
+    return rows
+
+
+class _Cursor:
+    def __init__(self, db):
+        self.db = db
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=()):
+        self.rowcount = self.db.execute(sql.replace('%s', '?'), params).rowcount
+
+
+class _Connection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return _Cursor(self.db)
+
+
+def _stats_table():
+    conn = sqlite3.connect(':memory:')
+    conn.execute(
+        'CREATE TABLE player_season_stats (entity_id INT, season TEXT, season_type TEXT, '
+        + ', '.join(f'"{c}" REAL' for c in COLUMNS) + ')'
+    )
+    conn.executemany(
+        f'INSERT INTO player_season_stats VALUES ({", ".join("?" * (3 + len(COLUMNS)))})',
+        _rows(),
+    )
+    return conn
+
+
+@pytest.fixture
+def db(monkeypatch):
+    conn = _stats_table()
+    monkeypatch.setattr(cleanup, '_domain_columns', {'player': DOMAINS})
+    monkeypatch.setattr(
+        cleanup, 'db_connection', contextlib.contextmanager(lambda: (yield _Connection(conn))),
+    )
+    return conn
+
+
+def _legacy_cleanup(conn):
+    """The per-domain UPDATE pair cleanup_stat_domains ran before the CASE form."""
+    for minutes_col, cols in DOMAINS.items():
+        conn.execute(
+            f'UPDATE player_season_stats SET '
+            + ', '.join(f'"{c}" = COALESCE("{c}", 0)' for c in cols)
+            + f' WHERE season = ? AND season_type = ? AND "{minutes_col}" > 0',
+            (SEASON, SEASON_TYPE),
+        )
+        conn.execute(
+            f'UPDATE player_season_stats SET '
+            + ', '.join(f'"{c}" = NULL' for c in cols)
+            + f' WHERE season = ? AND season_type = ? '
+            f'AND ("{minutes_col}" IS NULL OR "{minutes_col}" = 0)',
+            (SEASON, SEASON_TYPE),
+        )
+
+
+def _table(conn):
+    return conn.execute('SELECT * FROM player_season_stats ORDER BY entity_id').fetchall()
+
+
+def _expected():
+    reference = _stats_table()
+    _legacy_cleanup(reference)
+    return _table(reference)
+
+
+def _season_batch(columns):
+    rows = [r for r in _rows() if r[1] == SEASON]
+    return RowBatch(
+        columns, [r[0] for r in rows],
+        [[r[3 + COLUMNS.index(c)] for r in rows] for c in columns],
+    )
+
+
+def test_case_update_matches_per_domain_updates(db):
+    before = _table(db)
+
+    updated = cleanup.cleanup_stat_domains('main', 'player', SEASON, SEASON_TYPE)
+
+    after = _table(db)
+    assert after == _expected()
+    assert updated == sum(1 for old, new in zip(before, after) if old != new)
+    # Only mismatched rows are touched, so a second pass has nothing to do
+    assert cleanup.cleanup_stat_domains('main', 'player', SEASON, SEASON_TYPE) == 0
+
+
+def test_write_path_rules_match_per_domain_updates(db):
+    batch = _season_batch(COLUMNS)
+
+    cleanup.apply_domain_rules(batch, 'player')
+
+    expected = {r[0]: r[3:] for r in _expected() if r[1] == SEASON}
+    assert {eid: vals for eid, vals in batch.iter_rows(COLUMNS)} == expected
+
+
+def test_negative_minutes_leave_stats_alone(db):
+    batch = _season_batch(COLUMNS)
+    original = dict(batch.iter_rows(COLUMNS))
+
+    cleanup.apply_domain_rules(batch, 'player')
+
+    for eid, vals in batch.iter_rows(COLUMNS):
+        if vals[0] == -3:
+            assert vals[1:3] == original[eid][1:3]
+
+
+def test_batch_without_minutes_column_is_untouched(db):
+    columns = ['a1', 'a2', 'min_b', 'b1']
+    batch = _season_batch(columns)
+    original = [list(v) for v in batch.values]
+
+    cleanup.apply_domain_rules(batch, 'player')
+
+    # Domain a has no minutes in the batch; domain b still applies
+    assert batch.values[:2] == original[:2]
+    expected = {r[0]: (r[6], r[7]) for r in _expected() if r[1] == SEASON}
+    assert dict(batch.iter_rows(['min_b', 'b1'])) == expected
+
+
+def test_batch_with_some_stat_columns_only_touches_those(db):
+    batch = _season_batch(['min_a', 'a2'])
+
+    changed = cleanup.apply_domain_rules(batch, 'player')
+
+    expected = {r[0]: (r[3], r[5]) for r in _expected() if r[1] == SEASON}
+    assert dict(batch.iter_rows(['min_a', 'a2'])) == expected
+    original = {r[0]: r[5] for r in _rows() if r[1] == SEASON}
+    assert changed == sum(1 for eid, (_, a2) in expected.items() if original[eid] != a2)
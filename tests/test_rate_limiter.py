@@ -0,0 +1,103 @@
+"""Per-entity batch cooldowns are enforced by the shared rate limiter."""
+
+import threading
+import time
+
+import pytest
+
+from src.etl.sources.nba_api import client
+from src.etl.sources.nba_api.config import STAND_IN_CONFIG
+
+COOLDOWN = 0.2
+BATCH = 10
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    monkeypatch.setitem(client.RATE_LIMITS, 'player', {
+        'interval': 0.001, 'burst': 4, 'batch_size': BATCH, 'batch_cooldown': COOLDOWN,
+    })
+    monkeypatch.setattr(client, 'API_BUDGET', {'interval': 0.0001, 'burst': 100})
+    monkeypatch.setattr(client, '_buckets', {})
+    monkeypatch.setattr(client, '_throttle_stats', {})
+    monkeypatch.setattr(client, '_throttle', {'factor': 1.0, 'signals': 0})
+    monkeypatch.setattr(client, '_limiter_enabled', True)
+    return client
+
+
+def _run_units(limiter, units, calls, rate_classes=('player',)):
+    stamps = []
+    lock = threading.Lock()
+
+    def unit(rate_class):
+        for _ in range(calls):
+            limiter._acquire_token(rate_class)
+            with lock:
+                stamps.append(time.monotonic())
+
+    threads = [
+        threading.Thread(target=unit, args=(rate_classes[i % len(rate_classes)],))
+        for i in range(units)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(stamps)
+
+
+def test_single_unit_pauses_between_batches(limiter):
+    stamps = _run_units(limiter, units=1, calls=2 * BATCH)
+
+    assert stamps[BATCH] - stamps[BATCH - 1] >= COOLDOWN * 0.9
+    assert limiter.rate_limiter_stats()['classes']['player']['cooldowns'] == 2
+
+
+def test_concurrent_units_share_one_cooldown_budget(limiter):
+    units = 4
+    stamps = _run_units(limiter, units=units, calls=BATCH)
+
+    # Four units of one batch each are four batches of the shared class:
+    # three cooldowns between them, as if a single unit had made every call.
+    assert stamps[-1] - stamps[0] >= (units - 1) * COOLDOWN * 0.9
+    for start in range(0, len(stamps), BATCH):
+        window = stamps[start:start + BATCH]
+        assert window[-1] - window[0] < COOLDOWN
+    stats = limiter.rate_limiter_stats()['classes']['player']
+    assert stats['requests'] == units * BATCH
+    assert stats['cooldowns'] == units
+    assert stats['throttled_seconds'] >= (units - 1) * COOLDOWN * 0.9
+
+
+def test_all_classes_share_the_api_budget(limiter, monkeypatch):
+    interval = 0.02
+    monkeypatch.setitem(limiter.RATE_LIMITS, 'league', {'interval': 0.0001, 'burst': 50})
+    monkeypatch.setitem(limiter.RATE_LIMITS, 'team_call', {'interval': 0.0001, 'burst': 50})
+    monkeypatch.setattr(limiter, 'API_BUDGET', {'interval': interval, 'burst': 1})
+
+    stamps = _run_units(limiter, units=4, calls=5, rate_classes=('league', 'team_call'))
+
+    # Each class alone would send its 10 calls at once; together they are
+    # paced by the single budget
+    assert stamps[-1] - stamps[0] >= (len(stamps) - 1) * interval * 0.9
+    classes = limiter.rate_limiter_stats()['classes']
+    assert classes['league']['requests'] == classes['team_call']['requests'] == 10
+
+
+def test_disabled_limiter_skips_cooldowns(limiter):
+    limiter.set_rate_limiting(False)
+    start = time.monotonic()
+    _run_units(limiter, units=2, calls=2 * BATCH)
+
+    assert time.monotonic() - start < COOLDOWN
+    assert limiter.rate_limiter_stats()['classes'] == {}
+
+
+@pytest.mark.parametrize('limits', [
+    pytest.param(limits, id=rate_class) for rate_class, limits in sorted(client.RATE_LIMITS.items())
+] + [pytest.param(client.API_BUDGET, id='api_budget')])
+def test_configured_budgets_stay_under_stand_in_throttle(limits):
+    window = STAND_IN_CONFIG['burst_window_seconds']
+
+    # A full bucket plus refills over one window is the most a class can send
+    assert limits['burst'] + window / limits['interval'] < STAND_IN_CONFIG['burst_limit']
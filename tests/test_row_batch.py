@@ -0,0 +1,73 @@
+"""RowBatch.concat stacks per-entity batches like the dict merge it replaces."""
+
+import random
+
+import pytest
+
+from src.etl.core.batch import RowBatch
+from src.etl.core.extract import extract_columns_columnar, extract_columns_from_result
+
+
+def _dict_merge(batches):
+    rows = {}
+    for batch in batches:
+        rows.update(batch.to_rows())
+    return RowBatch.from_rows(rows)
+
+
+def _same(a, b):
+    # Column order is not part of the contract; loaders select by name
+    assert set(a.columns) == set(b.columns)
+    assert a.entity_ids == b.entity_ids
+    assert a.to_rows() == b.to_rows()
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_concat_matches_dict_update(seed):
+    rng = random.Random(seed)
+    batches = []
+    for _ in range(rng.randint(0, 6)):
+        eids = rng.sample(range(12), rng.randint(0, 5))
+        cols = rng.sample(['a', 'b', 'c', 'd'], rng.randint(1, 4))
+        batches.append(RowBatch(
+            cols, eids, [[rng.choice([None, rng.randint(0, 99)]) for _ in eids] for _ in cols],
+        ))
+
+    _same(RowBatch.concat(batches), _dict_merge(batches))
+
+
+def test_concat_of_nothing_is_empty():
+    batch = RowBatch.concat([RowBatch(['a'], [], [[]])])
+    assert len(batch) == 0
+    assert batch.columns == ()
+
+
+def test_per_entity_responses_stack_like_row_extraction():
+    columns = {
+        'height': {'field': 'HEIGHT_IN', 'transform': 'safe_int'},
+        'weight': {'field': 'WEIGHT', 'transform': 'safe_int'},
+        'draft_pick': {'field': 'DRAFT_NUMBER', 'transform': 'safe_int'},
+    }
+    responses = [
+        {'resultSets': [{
+            'name': 'CommonPlayerInfo',
+            'headers': ['PERSON_ID', 'HEIGHT_IN', 'WEIGHT', 'DRAFT_NUMBER'],
+            'rowSet': [[pid, 70 + pid, '2%02d' % pid, 'Undrafted' if pid % 3 else pid]],
+        }]}
+        for pid in (7, 3, 9, 3)
+    ] + [{'resultSets': []}]
+
+    rows = {}
+    for response in responses:
+        rows.update(extract_columns_from_result(
+            response, columns, 'player', 'PLAYER_ID', id_aliases={'PLAYER_ID': ['PERSON_ID']},
+        ))
+    batch = RowBatch.concat(
+        extract_columns_columnar(
+            response, columns, 'player', 'PLAYER_ID', id_aliases={'PLAYER_ID': ['PERSON_ID']},
+        )
+        for response in responses
+    )
+
+    assert batch.to_rows() == rows
+    assert batch.entity_ids == [7, 3, 9]
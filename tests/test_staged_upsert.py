@@ -0,0 +1,204 @@
+"""COPY upsert path: CSV escaping and staging-table column order."""
+
+import re
+
+import pytest
+
+from src.etl.core import load
+from src.etl.core.load import STAGING_TABLE, UpsertCounts, _csv_field, bulk_upsert
+
+TABLE = 'nba.player_season_stats'
+COLUMNS = ['entity_id', 'season', 'name', '2fgm', 'pct']
+CONFLICT = ['entity_id', 'season']
+
+
+class _Cursor:
+    def __init__(self, fetched=None):
+        self.statements = []
+        self.copies = []
+        self.fetched = fetched or []
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+
+    def copy_expert(self, sql, buf):
+        self.copies.append((sql, buf.read()))
+
+    def fetchall(self):
+        return self.fetched
+
+
+class _Connection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+def _parse_pg_csv(text):
+    """Parse COPY ... (FORMAT csv) input the way PostgreSQL does.
+
+    An unquoted empty field is NULL; a quoted one is the empty string.
+    Quoted fields may contain commas, newlines and doubled quotes.
+    """
+    rows, row, field, quoted, in_quotes, i = [], [], [], False, False, 0
+    while i < len(text):
+        ch = text[i]
+        if in_quotes:
+            if ch == '"' and text[i + 1:i + 2] == '"':
+                field.append('"')
+                i += 1
+            elif ch == '"':
+                in_quotes = False
+            else:
+                field.append(ch)
+        elif ch == '"':
+            in_quotes = quoted = True
+        elif ch in ',\n':
+            row.append(''.join(field) if field or quoted else None)
+            field, quoted = [], False
+            if ch == '\n':
+                rows.append(row)
+                row = []
+        else:
+            field.append(ch)
+        i += 1
+    assert not in_quotes and not field and not row, 'unterminated CSV'
+    return rows
+
+
+def _column_list(sql, prefix):
+    match = re.search(re.escape(prefix) + r'\s*\(([^)]*)\)', sql)
+    assert match, f'{prefix!r} not in {sql!r}'
+    return [c.strip().strip('"') for c in match.group(1).split(',')]
+
+
+def _select_list(sql):
+    match = re.search(r'SELECT (.*?) FROM', sql)
+    return [c.strip().strip('"') for c in match.group(1).split(',')]
+
+
+@pytest.mark.parametrize('value, field', [
+    (None, ''),
+    ('', '""'),
+    ('plain', '"plain"'),
+    ('say "hi"', '"say ""hi"""'),
+    ('a,b', '"a,b"'),
+    ('line\nbreak', '"line\nbreak"'),
+    ('tab\tback\\slash', '"tab\tback\\slash"'),
+    ('\\N', '"\\N"'),
+    ('NULL', '"NULL"'),
+    (0, '0'),
+    (-12, '-12'),
+    (0.5, '0.5'),
+    (True, 'true'),
+    (False, 'false'),
+])
+def test_csv_field(value, field):
+    assert _csv_field(value) == field
+
+
+def _staged(data, fetched=None, **kwargs):
+    cursor = _Cursor(fetched)
+    conn = _Connection(cursor)
+    written = bulk_upsert(conn, TABLE, COLUMNS, data, CONFLICT, method='copy', **kwargs)
+    return cursor, conn, written
+
+
+def test_copy_round_trips_nulls_empty_strings_quotes_and_newlines():
+    data = [
+        (1, '2023-24', None, 5, 0.5),
+        (2, '2023-24', '', None, None),
+        (3, '2023-24', 'O"Neal, Shaquille\nBig "Diesel"', 0, 1.0),
+        (4, '2023-24', 'NULL', -1, 0.0),
+    ]
+    cursor, conn, written = _staged(data)
+
+    (_, text), = cursor.copies
+    parsed = _parse_pg_csv(text)
+    # Non-strings arrive as their text form; PostgreSQL casts per column type
+    assert parsed == [
+        [None if v is None else str(v) for v in row] for row in data
+    ]
+    assert parsed[0][2] is None and parsed[1][2] == ''
+    assert written == 4 and conn.commits == 1 and conn.rollbacks == 0
+
+
+def test_staging_statements_keep_one_column_order():
+    cursor, _, _ = _staged([(1, '2023-24', 'x', 2, 0.5)])
+
+    drop, create, insert = cursor.statements
+    (copy_sql, text), = cursor.copies
+    assert drop == f'DROP TABLE IF EXISTS {STAGING_TABLE}'
+    assert create.startswith(f'CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS ')
+    assert _select_list(create) == COLUMNS
+    assert f'FROM {TABLE} WITH NO DATA' in create
+    assert _column_list(copy_sql, f'COPY {STAGING_TABLE}') == COLUMNS
+    assert 'FORMAT csv' in copy_sql
+    assert _column_list(insert, f'INSERT INTO {TABLE} AS t') == COLUMNS
+    assert _select_list(insert.split('AS t (', 1)[1]) == COLUMNS
+    assert f'FROM {STAGING_TABLE} ON CONFLICT ("entity_id", "season")' in insert
+    # Conflict columns are never overwritten
+    assert '"entity_id" = EXCLUDED' not in insert
+    assert '"2fgm" = EXCLUDED."2fgm"' in insert
+    assert _parse_pg_csv(text) == [['1', '2023-24', 'x', '2', '0.5']]
+
+
+def test_duplicate_conflict_keys_keep_the_last_row():
+    data = [
+        (1, '2023-24', 'first', 1, None),
+        (2, '2023-24', 'other', 2, None),
+        (1, '2023-24', 'last', 3, None),
+    ]
+    cursor, _, written = _staged(data)
+
+    rows = _parse_pg_csv(cursor.copies[0][1])
+    assert rows == [['1', '2023-24', 'last', '3', None], ['2', '2023-24', 'other', '2', None]]
+    assert written == 2
+
+
+def test_change_aware_copy_counts_returned_rows():
+    counts = UpsertCounts()
+    returned = []
+    # RETURNING entity_id plus the inserted flag; the third row was unchanged
+    cursor, _, written = _staged(
+        [(1, 's', 'a', 1, None), (2, 's', 'b', 2, None), (3, 's', 'c', 3, None)],
+        fetched=[(1, True), (2, False)],
+        returning=['entity_id'], returned=returned, only_changed=True, counts=counts,
+    )
+
+    insert = cursor.statements[-1]
+    assert 'IS DISTINCT FROM' in insert
+    assert insert.endswith(' RETURNING "entity_id", (xmax = 0)')
+    assert written == 2
+    assert (counts.inserted, counts.updated, counts.unchanged) == (1, 1, 1)
+    assert returned == [(1,), (2,)]
+
+
+def test_failed_copy_rolls_back():
+    class _FailingCursor(_Cursor):
+        def copy_expert(self, sql, buf):
+            raise RuntimeError('invalid input syntax')
+
+    conn = _Connection(_FailingCursor())
+    with pytest.raises(RuntimeError):
+        bulk_upsert(conn, TABLE, COLUMNS, [(1, 's', 'a', 1, None)], CONFLICT, method='copy')
+    assert conn.rollbacks == 1 and conn.commits == 0
+
+
+def test_threshold_selects_copy(monkeypatch):
+    monkeypatch.setitem(load.ETL_CONFIG, 'copy_upsert_threshold', 2)
+    cursor = _Cursor()
+
+    bulk_upsert(_Connection(cursor), TABLE, COLUMNS, [(1, 's', 'a', 1, None)] * 2, CONFLICT)
+
+    assert len(cursor.copies) == 1
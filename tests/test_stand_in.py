@@ -0,0 +1,58 @@
+"""Stand-in fixture matching on recorded (key, value) query pairs."""
+
+import json
+
+import pytest
+
+from src.etl.sources.nba_api import stand_in
+from src.etl.sources.nba_api.client import load_endpoint_class
+
+ENDPOINT = 'playerdashptreb'
+
+
+def _record(directory, name, params):
+    path = directory / ENDPOINT / f'{name}.json'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        'endpoint': ENDPOINT, 'params': params, 'response': {'fixture': name},
+    }))
+
+
+def _query(**params):
+    """Query dict the stand-in parses from nba_api's request for *params*."""
+    parameters = load_endpoint_class(ENDPOINT)(**params, get_request=False).parameters
+    return {k: str(v) for k, v in parameters.items() if v is not None}
+
+
+@pytest.fixture
+def fixtures(tmp_path, monkeypatch):
+    _record(tmp_path, 'season', {'player_id': 203, 'team_id': 0, 'season': '2023-24'})
+    _record(tmp_path, 'last10', {
+        'player_id': 203, 'team_id': 0, 'season': '2023-24', 'last_n_games': 10,
+    })
+    _record(tmp_path, 'per_game', {
+        'player_id': 77, 'team_id': 0, 'season': '2023-24', 'per_mode_simple': 'PerGame',
+    })
+    monkeypatch.setitem(stand_in._state, 'fixtures', stand_in.load_fixtures(str(tmp_path)))
+
+
+def _match(**params):
+    response = stand_in._match_fixture(ENDPOINT, _query(**params))
+    return response and response['fixture']
+
+
+def test_exact_request_matches(fixtures):
+    assert _match(player_id=203, team_id=0, season='2023-24') == 'season'
+    assert _match(player_id=203, team_id=0, season='2023-24', last_n_games=10) == 'last10'
+
+
+def test_value_shared_by_another_key_does_not_match(fixtures):
+    # '0' is still present under Month, Period and OpponentTeamID
+    assert _match(player_id=203, team_id=0, season='2023-24', last_n_games=5) is None
+    # 'Totals' must be PerMode's value, not just appear somewhere
+    assert _match(player_id=77, team_id=0, season='2023-24') is None
+    assert _match(player_id=203, team_id=0, season='2022-23') is None
+
+
+def test_player_id_is_not_confused_with_team_id(fixtures):
+    assert _match(player_id=0, team_id=203, season='2023-24') is None
@@ -0,0 +1,84 @@
+"""Parity between the NumPy batch converters and the scalar converters."""
+
+import pytest
+
+from src.etl.core.extract import extract_columns_columnar, extract_columns_from_result
+from src.etl.core.transform import apply_batch_transform, apply_transform
+
+NUMERIC = ['safe_int', 'safe_float', 'null_if_zero']
+SCALES = [1, 10, 100, 1000]
+
+MIXED = [
+    None, '', ' ', 0, 0.0, -0.0, '0', '0.0', 1, -1, 2.5, 3.5, -2.5, 0.4, -0.6,
+    '12', ' 12 ', '12.5', '-7.25', '1e3', '1_000', b'42',
+    'abc', '1,000', '12abc', 'nan', 'NaN', float('nan'), 'inf', '-inf',
+    float('inf'), True, False,
+    [1, 2], [], {'a': 1}, {}, (1, 2),
+    10 ** 400, -10 ** 400, 1e300, -1e300, '1e400', 2 ** 62, 2 ** 63, 9.2e18,
+]
+
+# Columns made only of equal-length lists parse into a 2-D NumPy array
+NESTED_COLUMNS = [
+    [[1, 2], [3, 4]],
+    [[1], [2]],
+    [(1, 2), (3, 4)],
+    [[1, 2], [3]],
+]
+
+
+def _scalar(values, transform, scale):
+    return [apply_transform(v, transform, scale) for v in values]
+
+
+def _assert_same(batch, scalar):
+    assert len(batch) == len(scalar)
+    for b, s in zip(batch, scalar):
+        assert b == s and type(b) is type(s)
+
+
+@pytest.mark.parametrize('scale', SCALES)
+@pytest.mark.parametrize('transform', NUMERIC)
+def test_mixed_values(transform, scale):
+    _assert_same(
+        apply_batch_transform(MIXED, transform, scale),
+        _scalar(MIXED, transform, scale),
+    )
+
+
+@pytest.mark.parametrize('scale', SCALES)
+@pytest.mark.parametrize('transform', NUMERIC)
+@pytest.mark.parametrize('value', MIXED, ids=repr)
+def test_single_value(transform, scale, value):
+    # One-element columns take the NumPy fast path wherever it applies
+    _assert_same(
+        apply_batch_transform([value], transform, scale),
+        _scalar([value], transform, scale),
+    )
+
+
+@pytest.mark.parametrize('transform', NUMERIC)
+@pytest.mark.parametrize('column', NESTED_COLUMNS, ids=repr)
+def test_nested_columns_are_null(transform, column):
+    assert apply_batch_transform(column, transform, 10) == [None] * len(column)
+    assert _scalar(column, transform, 10) == [None] * len(column)
+
+
+@pytest.mark.parametrize('transform', NUMERIC)
+def test_empty_column(transform):
+    assert apply_batch_transform([], transform, 10) == []
+
+
+@pytest.mark.parametrize('column', [MIXED] + NESTED_COLUMNS, ids=repr)
+def test_columnar_extraction_matches_row_extraction(column):
+    api_result = {'resultSets': [{
+        'name': 'Stats',
+        'headers': ['PLAYER_ID', 'MIN', 'PTS'],
+        'rowSet': [[i + 1, v, v] for i, v in enumerate(column)],
+    }]}
+    columns = {
+        'minutes_x10': {'field': 'MIN', 'transform': 'safe_int', 'scale': 10},
+        'points': {'field': 'PTS', 'transform': 'null_if_zero'},
+    }
+    rows = extract_columns_from_result(api_result, columns, 'player', 'PLAYER_ID')
+    batch = extract_columns_columnar(api_result, columns, 'player', 'PLAYER_ID')
+    assert batch.to_rows() == rows
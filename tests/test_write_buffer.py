@@ -0,0 +1,118 @@
+"""WriteBuffer merges columnar batches like the per-entity dict merge did."""
+
+import random
+
+import pytest
+
+from src.etl.core import executor
+from src.etl.core.batch import RowBatch
+from src.etl.core.executor import WriteBuffer
+
+
+@pytest.fixture
+def upserts(monkeypatch):
+    calls = []
+
+    def fake_write(entity, scope, batch, *args, counts=None, changed_ids=None):
+        calls.append(batch)
+        changed_ids.update(batch.entity_ids)
+        return len(batch)
+
+    monkeypatch.setattr(executor, 'write_entity_rows', fake_write)
+    return calls
+
+
+def _buffer():
+    return WriteBuffer('player', 'entity', '2023-24', 'rs', 'nba')
+
+
+def _reference(adds):
+    """The old merge: one dict per entity, later groups win per column."""
+    rows = {}
+    for batch in adds:
+        for eid, values in batch.iter_rows(batch.columns):
+            rows.setdefault(eid, {}).update(zip(batch.columns, values))
+    return rows
+
+
+def _written(upserts):
+    rows = {}
+    for batch in upserts:
+        assert list(batch.columns) == sorted(batch.columns)
+        for eid, values in batch.iter_rows(batch.columns):
+            assert eid not in rows
+            rows[eid] = dict(zip(batch.columns, values))
+    return rows
+
+
+def _random_batches(rng, count):
+    batches = []
+    for _ in range(count):
+        eids = rng.sample(range(40), rng.randint(0, 25))
+        cols = rng.sample(['a', 'b', 'c', 'd', 'e'], rng.randint(1, 4))
+        batches.append(RowBatch(
+            cols, eids,
+            [[rng.choice([None, rng.randint(0, 9)]) for _ in eids] for _ in cols],
+        ))
+    return batches
+
+
+@pytest.mark.parametrize('seed', range(25))
+def test_flush_matches_dict_merge(upserts, seed):
+    adds = _random_batches(random.Random(seed), 6)
+    buffer = _buffer()
+    for batch in adds:
+        buffer.add(batch)
+
+    expected = _reference(adds)
+    assert buffer.cells == sum(len(v) for v in expected.values())
+    written, _ = buffer.flush()
+
+    assert _written(upserts) == expected
+    assert written == len(expected)
+    # One upsert per distinct column set
+    assert len(upserts) == len({tuple(sorted(v)) for v in expected.values()})
+
+
+def test_aligned_groups_flush_as_one_batch(upserts):
+    buffer = _buffer()
+    buffer.add(RowBatch(['pts'], [1, 2, 3], [[10, 20, 30]]))
+    buffer.add(RowBatch(['ast', 'pts'], [1, 2, 3], [[1, 2, 3], [11, None, 31]]))
+    buffer.add({1: {'reb': 5}, 2: {'reb': 6}, 3: {'reb': 7}})
+
+    assert buffer.cells == 9
+    buffer.flush()
+    assert len(upserts) == 1
+    assert _written(upserts) == {
+        1: {'ast': 1, 'pts': 11, 'reb': 5},
+        2: {'ast': 2, 'pts': None, 'reb': 6},
+        3: {'ast': 3, 'pts': 31, 'reb': 7},
+    }
+
+
+def test_groups_credited_with_their_entities(upserts):
+    buffer = _buffer()
+    buffer.begin_group('g1')
+    buffer.add(RowBatch(['pts'], [1, 2], [[10, 20]]))
+    buffer.begin_group('g2')
+    buffer.add(RowBatch(['ast'], [2, 3], [[1, 2]]))
+
+    _, per_group = buffer.flush()
+    assert per_group == {'g1': 2, 'g2': 2}
+    assert buffer.entity_ids == [] and buffer.columns == {} and buffer.cells == 0
+
+
+def test_failing_callback_does_not_fail_flush(upserts):
+    buffer = _buffer()
+    buffer.add(RowBatch(['pts'], [1], [[10]]))
+    ran = []
+
+    def broken():
+        raise RuntimeError('hash table unavailable')
+
+    buffer.after_flush(broken)
+    buffer.after_flush(lambda: ran.append(True))
+
+    written, _ = buffer.flush()
+    assert written == 1
+    assert ran == [True]